@@ -1,6 +1,7 @@
 """Module d'affichage"""
 
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 from pygame.surface import Surface
 from pygame.draw import rect as draw_rect
@@ -9,10 +10,11 @@ from pygame.locals import SRCALPHA
 from pygame.color import Color
 from pygame.font import Font, get_default_font
 
-from nsi_tetris.jeu.erreurs import verifier_type
+from nsi_tetris.jeu.erreurs import verif_entier_pos, verifier_type
 from nsi_tetris.jeu.tetrimino import Tetrimino
-from nsi_tetris.jeu.plateau import Plateau
-from nsi_tetris.jeu.constantes import TAILLE_CASE, BLANC
+from nsi_tetris.jeu.plateau import ObservateurPlateau, Plateau
+from nsi_tetris.jeu.constantes import TAILLE_CASE, BLANC, NOIR, TRANSPARENT
+from nsi_tetris.jeu.profilage import Profileur
 from nsi_tetris.jeu.tableaux import parcourir
 
 
@@ -50,44 +52,291 @@ def afficher_plateau(plateau: Plateau) -> Surface:
     return surface
 
 
-def afficher_tetrimino(tetrimino: Tetrimino) -> Surface:
+class SurfacePlateau(ObservateurPlateau):
     """
-    Dessine un tetrimino et renvoie la surface
+    Représente une surface persistante contenant le dessin d'un plateau.
+
+    La surface est dessinée entièrement une seule fois, puis le plateau prévient
+    l'objet des lignes modifiées : seules ces lignes sont redessinées, et l'effacement
+    d'une ligne fait défiler la partie de la surface située au dessus.
+    Entre deux modifications, afficher le plateau ne coûte donc qu'un blit.
+    """
+
+    def __init__(self, plateau: Plateau, taille_case=TAILLE_CASE) -> None:
+        """
+        Args:
+            plateau (Plateau): Le plateau à dessiner, qui sera observé
+            taille_case (int, optional): La taille des cases en pixels
+
+        Raises:
+            TypeError: Le type de plateau ou de taille_case est invalide
+            ValueError: taille_case est négative
+        """
+        # Préconditions
+        verifier_type("plateau", plateau, Plateau)
+        verif_entier_pos("taille_case", taille_case)
+
+        lignes, colonnes = plateau.forme()
+        self.__plateau = plateau
+        self.__taille_case = taille_case
+        self.__surface = Surface(
+            (colonnes * taille_case, lignes * taille_case), SRCALPHA
+        )
+
+        # Zone de la surface modifiée depuis le dernier appel à vider_modifications
+        self.__modifications: Optional[Rect] = None
+
+        self.lignes_modifiees(tuple(range(lignes)))
+        plateau.ajouter_observateur(self)
+
+    def get_surface(self) -> Surface:
+        """Renvoie la surface du plateau, à jour avec le contenu de sa grille"""
+        return self.__surface
+
+    def vider_modifications(self) -> Optional[Rect]:
+        """
+        Renvoie la zone de la surface modifiée depuis le dernier appel, puis l'oublie
+
+        Returns:
+            Optional[Rect]: Le rectangle contenant les modifications, ou None s'il n'y en a pas
+        """
+        modifications = self.__modifications
+        self.__modifications = None
+        return modifications
+
+    def __modifier(self, zone: Rect) -> None:
+        """Ajoute une zone à la zone modifiée de la surface"""
+        if self.__modifications is None:
+            self.__modifications = zone
+        else:
+            self.__modifications.union_ip(zone)
+
+    def detacher(self) -> None:
+        """Arrête d'observer le plateau, la surface n'est alors plus mise à jour"""
+        self.__plateau.retirer_observateur(self)
+
+    def lignes_modifiees(self, lignes: Tuple[int, ...]) -> None:
+        taille = self.__taille_case
+        largeur = self.__surface.get_width()
+        for indice in lignes:
+            zone = Rect(0, indice * taille, largeur, taille)
+            self.__surface.fill(TRANSPARENT, zone)
+            self.__modifier(zone)
+            for colonne, couleur_case in enumerate(self.__plateau.ligne(indice)):
+                if couleur_case is not None:
+                    rect_case = Rect(colonne * taille, indice * taille, taille, taille)
+                    draw_rect(self.__surface, couleur_case, rect_case)
+
+    def ligne_effacee(self, indice: int) -> None:
+        # Les lignes situées au dessus de la ligne effacée descendent d'une case,
+        # et la ligne du haut devient vide
+        taille = self.__taille_case
+        largeur = self.__surface.get_width()
+        if indice > 0:
+            haut = self.__surface.subsurface(Rect(0, 0, largeur, (indice + 1) * taille))
+            haut.scroll(0, taille)
+
+        self.__surface.fill(TRANSPARENT, Rect(0, 0, largeur, taille))
+        self.__modifier(Rect(0, 0, largeur, (indice + 1) * taille))
+
+
+class CacheSprites:
+    """
+    Représente un cache des surfaces de tetriminos, indexées par forme tournée, couleur
+    et transparence, afin de ne dessiner chaque surface qu'une seule fois.
+
+    Le cache est borné : lorsqu'il est plein, la surface utilisée le moins récemment
+    est supprimée. Il doit être invalidé si la taille des cases change.
+    """
+
+    def __init__(self, taille_max=64, taille_case=TAILLE_CASE) -> None:
+        verif_entier_pos("taille_max", taille_max)
+        verif_entier_pos("taille_case", taille_case)
+
+        self.__taille_max = taille_max
+        self.__taille_case = taille_case
+        self.__surfaces: "OrderedDict[tuple, Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__surfaces)
+
+    def get_taille_case(self) -> int:
+        """Renvoie la taille des cases utilisée pour dessiner les surfaces"""
+        return self.__taille_case
+
+    def set_taille_case(self, taille_case: int) -> None:
+        """
+        Modifie la taille des cases, ce qui invalide les surfaces déjà dessinées
+
+        Args:
+            taille_case (int): La nouvelle taille des cases
+
+        Raises:
+            TypeError: Le type de taille_case est invalide
+            ValueError: taille_case est négative
+        """
+        verif_entier_pos("taille_case", taille_case)
+        if taille_case != self.__taille_case:
+            self.__taille_case = taille_case
+            self.invalider()
+
+    def invalider(self) -> None:
+        """Supprime toutes les surfaces du cache"""
+        self.__surfaces.clear()
+
+    def obtenir(self, tetrimino: Tetrimino, alpha=255) -> Surface:
+        """
+        Renvoie la surface d'un tetrimino, en la dessinant si elle n'est pas dans le cache
+
+        Args:
+            tetrimino (Tetrimino): Le tetrimino à dessiner
+            alpha (int, optional): La transparence de la surface, de 0 à 255
+
+        Returns:
+            Surface: La surface du tetrimino, partagée et donc à ne pas modifier
+        """
+        etat = tetrimino.get_etat()
+        cle = (etat.forme, tuple(tetrimino.get_couleur()), alpha)
+
+        surface = self.__surfaces.get(cle)
+        if surface is not None:
+            self.__surfaces.move_to_end(cle)
+            return surface
+
+        taille = self.__taille_case
+        largeur = len(etat.forme[0]) * taille
+        hauteur = len(etat.forme) * taille
+        surface = Surface((largeur, hauteur), SRCALPHA)
+
+        couleur_tetr = tetrimino.get_couleur()
+        for ligne, colonne in etat.cases:
+            rect_case = Rect(colonne * taille, ligne * taille, taille, taille)
+            draw_rect(surface, couleur_tetr, rect_case)
+
+        if alpha != 255:
+            surface.set_alpha(alpha)
+
+        self.__surfaces[cle] = surface
+        if len(self.__surfaces) > self.__taille_max:
+            self.__surfaces.popitem(last=False)
+
+        return surface
+
+
+# Cache utilisé par afficher_tetrimino
+SPRITES = CacheSprites()
+
+
+def afficher_tetrimino(tetrimino: Tetrimino, alpha=255) -> Surface:
+    """
+    Dessine un tetrimino et renvoie la surface.
+    La surface provient du cache des sprites, elle ne doit donc pas être modifiée.
 
     Args:
         tetrimino (Tetrimino): Le tetrimino à dessiner
+        alpha (int, optional): La transparence de la surface, de 0 à 255
 
     Raises:
         TypeError: Le type de tetrimino est invalide
+        TypeError: Le type de alpha est invalide
+        ValueError: alpha n'est pas compris entre 0 et 255
 
     Returns:
         Surface: La surface contenant le tetrimino
     """
-    # Précondition
+    # Préconditions
     verifier_type("tetrimino", tetrimino, Tetrimino)
+    verifier_type("alpha", alpha, int)
+    if not 0 <= alpha <= 255:
+        raise ValueError("alpha doit être compris entre 0 et 255")
 
-    largeur = len(tetrimino.get_forme()[0]) * TAILLE_CASE
-    hauteur = len(tetrimino.get_forme()) * TAILLE_CASE
-    surface = Surface((largeur, hauteur), SRCALPHA)
+    return SPRITES.obtenir(tetrimino, alpha)
 
-    couleur_tetr = tetrimino.get_couleur()
-    for bit, ligne, colonne in parcourir(tetrimino.get_forme()):
-        if bit != 0:
-            rect_case = Rect(
-                colonne * TAILLE_CASE,
-                ligne * TAILLE_CASE,
-                TAILLE_CASE,
-                TAILLE_CASE,
-            )
 
-            draw_rect(surface, couleur_tetr, rect_case)
+class CacheTextes:
+    """
+    Représente un cache des polices, indexées par taille, et des surfaces de texte,
+    indexées par texte, taille et couleur d'arrière plan.
 
-    return surface
+    Les polices ne sont chargées qu'une seule fois par taille, et un texte qui ne change
+    pas d'une image à l'autre (comme le score entre deux lignes) n'est dessiné qu'une fois.
+    Le cache des surfaces est borné : la surface utilisée le moins récemment est supprimée.
+    """
+
+    def __init__(self, taille_max=32) -> None:
+        verif_entier_pos("taille_max", taille_max)
+
+        self.__taille_max = taille_max
+        self.__polices: Dict[int, Font] = {}
+        self.__surfaces: "OrderedDict[tuple, Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__surfaces)
+
+    def invalider(self) -> None:
+        """
+        Supprime toutes les polices et les surfaces du cache,
+        par exemple après avoir réinitialisé pygame
+        """
+        self.__polices.clear()
+        self.__surfaces.clear()
+
+    def police(self, taille: int) -> Font:
+        """
+        Renvoie la police par défaut à une taille donnée, en la chargeant si nécessaire
+
+        Args:
+            taille (int): La taille du texte
+
+        Returns:
+            Font: La police correspondante
+        """
+        police = self.__polices.get(taille)
+        if police is None:
+            police = Font(get_default_font(), taille)
+            self.__polices[taille] = police
+
+        return police
+
+    def obtenir(
+        self, texte: str, taille: int, arriere: Optional[Color] = None
+    ) -> Surface:
+        """
+        Renvoie la surface d'un texte, en la dessinant si elle n'est pas dans le cache
+
+        Args:
+            texte (str): Le texte à dessiner
+            taille (int): La taille du texte
+            arriere (Color, optional): La couleur d'arrière plan
+
+        Returns:
+            Surface: La surface du texte, partagée et donc à ne pas modifier
+        """
+        # Les couleurs pygame ne sont pas hachables, on utilise leurs composantes
+        cle = (texte, taille, None if arriere is None else tuple(arriere))
+
+        surface = self.__surfaces.get(cle)
+        if surface is not None:
+            self.__surfaces.move_to_end(cle)
+            return surface
+
+        surface = self.police(taille).render(texte, True, BLANC, arriere)
+
+        self.__surfaces[cle] = surface
+        if len(self.__surfaces) > self.__taille_max:
+            self.__surfaces.popitem(last=False)
+
+        return surface
+
+
+# Cache utilisé par afficher_texte
+TEXTES = CacheTextes()
 
 
 def afficher_texte(texte: str, taille: int, arriere: Optional[Color] = None) -> Surface:
     """
-    Dessine du texte et renvoie la surface
+    Dessine du texte et renvoie la surface.
+    La surface provient du cache des textes, elle ne doit donc pas être modifiée.
 
     Args:
         texte (str): Le texte à dessiner
@@ -113,8 +362,49 @@ def afficher_texte(texte: str, taille: int, arriere: Optional[Color] = None) ->
     if taille < 0:
         raise ValueError("La taille du texte doit être supérieure à 0")
 
-    police = Font(get_default_font(), taille)
-    return police.render(texte, True, BLANC, arriere)
+    return TEXTES.obtenir(texte, taille, arriere)
+
+
+def afficher_profil(profileur: Profileur, taille=14) -> Surface:
+    """
+    Dessine les centiles des durées des phases et le nombre d'images trop longues,
+    et renvoie la surface.
+    Les textes changent à chaque appel, ils ne passent donc pas par le cache des textes.
+
+    Args:
+        profileur (Profileur): Le profileur dont les mesures sont affichées
+        taille (int, optional): La taille du texte
+
+    Raises:
+        TypeError: Le type de profileur ou de taille est invalide
+
+    Returns:
+        Surface: La surface contenant les mesures
+    """
+    # Préconditions
+    verifier_type("profileur", profileur, Profileur)
+    verif_entier_pos("taille", taille)
+
+    textes = [
+        f"{phase:<18} p50 {p50 * 1000:5.2f}  p95 {p95 * 1000:5.2f}  p99 {p99 * 1000:5.2f} ms"
+        for phase, (p50, p95, p99) in profileur.resume().items()
+    ]
+    textes.append(
+        f"Dépassements : {profileur.depassements()} / {len(profileur)} images"
+        f" (budget {profileur.get_budget() * 1000:.1f} ms)"
+    )
+
+    police = TEXTES.police(taille)
+    lignes = [police.render(texte, True, BLANC, NOIR) for texte in textes]
+    hauteur_ligne = police.get_linesize()
+    surface = Surface(
+        (max(ligne.get_width() for ligne in lignes), hauteur_ligne * len(lignes))
+    )
+    surface.fill(NOIR)
+    for indice, ligne in enumerate(lignes):
+        surface.blit(ligne, (0, indice * hauteur_ligne))
+
+    return surface
 
 
 def centrer(surface_a: Surface, surface_b: Surface) -> Tuple[int, int]:
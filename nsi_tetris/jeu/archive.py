@@ -0,0 +1,239 @@
+"""
+Module de l'archive des parties, qui stocke un grand nombre d'enregistrements dans un seul
+fichier auquel on ne fait qu'ajouter des données.
+
+Chaque partie est écrite à la suite des précédentes, sous la forme de la taille de son
+enregistrement, de l'enregistrement lui-même, puis de la table de ses instantanés (le tick
+et la position de chacun). La position de chaque partie est ajoutée dans un fichier d'index
+à côté de l'archive, où elle occupe 8 octets : la lecture projette les deux fichiers en
+mémoire et accède directement à n'importe quelle partie, et à n'importe quel instantané
+d'une partie, sans lire ce qui précède.
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .enregistrement import lire, reprendre
+from .erreurs import verif_entier_pos
+from .moteur import Moteur
+
+ENTETE_ARCHIVE = b"NTA\x01"
+
+_TAILLE = struct.Struct("<I")
+_INSTANTANE = struct.Struct("<II")
+_POSITION = struct.Struct("<Q")
+
+Chemin = Union[str, os.PathLike]
+
+
+def chemin_index(chemin: Chemin) -> Path:
+    """Renvoie le chemin du fichier d'index d'une archive"""
+    chemin = Path(chemin)
+    return chemin.with_name(chemin.name + ".index")
+
+
+class Archive:
+    """
+    Permet d'ajouter des parties à la fin d'une archive, en la créant si nécessaire.
+    L'index n'est complété qu'une fois la partie écrite, une partie interrompue par
+    un arrêt du programme est donc simplement ignorée, de même qu'une position de
+    l'index écrite partiellement.
+    """
+
+    def __init__(self, chemin: Chemin) -> None:
+        # pylint: disable=consider-using-with
+        self.__fichier = open(chemin, "ab")
+        self.__index = open(chemin_index(chemin), "ab")
+
+        if self.__fichier.seek(0, os.SEEK_END) == 0:
+            self.__fichier.write(ENTETE_ARCHIVE)
+            self.__fichier.flush()
+
+        # Un arrêt pendant l'écriture de l'index peut laisser une position incomplète,
+        # qui décalerait toutes les positions ajoutées ensuite : on la supprime
+        self.__nombre = self.__index.seek(0, os.SEEK_END) // _POSITION.size
+        self.__index.truncate(self.__nombre * _POSITION.size)
+
+    def __len__(self) -> int:
+        return self.__nombre
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fermer()
+
+    def fermer(self) -> None:
+        """Ferme les fichiers de l'archive"""
+        self.__fichier.close()
+        self.__index.close()
+
+    def ajouter(self, donnees: bytes) -> int:
+        """
+        Ajoute l'enregistrement d'une partie à la fin de l'archive
+
+        Args:
+            donnees (bytes): Les données renvoyées par Enregistreur.terminer
+
+        Raises:
+            ValueError: Les données ne sont pas un enregistrement valide
+
+        Returns:
+            int: Le numéro de la partie dans l'archive
+        """
+        instantanes = lire(donnees).instantanes
+
+        bloc = bytearray(_TAILLE.pack(len(donnees)))
+        bloc += donnees
+        bloc += _TAILLE.pack(len(instantanes))
+        for tick, position in instantanes:
+            bloc += _INSTANTANE.pack(tick, position)
+
+        position_partie = self.__fichier.seek(0, os.SEEK_END)
+        self.__fichier.write(bloc)
+        self.__fichier.flush()
+
+        self.__index.write(_POSITION.pack(position_partie))
+        self.__index.flush()
+
+        self.__nombre += 1
+        return self.__nombre - 1
+
+
+class LecteurArchive:
+    """
+    Permet de lire une archive en la projetant en mémoire.
+    Les parties ajoutées après l'ouverture ne sont visibles qu'après un appel à actualiser.
+    """
+
+    def __init__(self, chemin: Chemin) -> None:
+        self.__chemin = Path(chemin)
+        self.__donnees: Optional[mmap.mmap] = None
+        self.__index: Optional[mmap.mmap] = None
+        self.__nombre = 0
+        self.actualiser()
+
+    def __len__(self) -> int:
+        return self.__nombre
+
+    def __enter__(self) -> "LecteurArchive":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fermer()
+
+    @staticmethod
+    def __projeter(chemin: Path) -> Optional[mmap.mmap]:
+        """Projette un fichier en mémoire en lecture seule, sauf s'il est vide"""
+        with open(chemin, "rb") as fichier:
+            if os.fstat(fichier.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def fermer(self) -> None:
+        """Ferme les projections de l'archive"""
+        for projection in (self.__donnees, self.__index):
+            if projection is not None:
+                projection.close()
+
+        self.__donnees = None
+        self.__index = None
+        self.__nombre = 0
+
+    def actualiser(self) -> None:
+        """Projette à nouveau l'archive pour voir les parties ajoutées depuis l'ouverture"""
+        self.fermer()
+        self.__donnees = self.__projeter(self.__chemin)
+        entete = (
+            None if self.__donnees is None else self.__donnees[: len(ENTETE_ARCHIVE)]
+        )
+        if entete != ENTETE_ARCHIVE:
+            raise ValueError("Le fichier n'est pas une archive de parties")
+
+        self.__index = self.__projeter(chemin_index(self.__chemin))
+        if self.__index is not None:
+            self.__nombre = len(self.__index) // _POSITION.size
+
+    def __position(self, numero: int) -> int:
+        """Renvoie la position de la partie dans l'archive"""
+        verif_entier_pos("numero", numero)
+        if numero >= self.__nombre:
+            raise IndexError("Il n'y a pas de partie avec ce numéro dans l'archive")
+
+        return _POSITION.unpack_from(self.__index, numero * _POSITION.size)[0]
+
+    def __bornes(self, numero: int) -> Tuple[int, int]:
+        """Renvoie la position du début et de la fin de l'enregistrement d'une partie"""
+        position = self.__position(numero)
+        taille = _TAILLE.unpack_from(self.__donnees, position)[0]
+        debut = position + _TAILLE.size
+        return debut, debut + taille
+
+    def enregistrement(self, numero: int) -> bytes:
+        """
+        Renvoie l'enregistrement d'une partie
+
+        Args:
+            numero (int): Le numéro de la partie
+
+        Raises:
+            TypeError: Le type de numero est invalide
+            ValueError: numero est négatif
+            IndexError: Il n'y a pas de partie avec ce numéro
+
+        Returns:
+            bytes: Les données de l'enregistrement
+        """
+        debut, fin = self.__bornes(numero)
+        return self.__donnees[debut:fin]
+
+    def moteur(self, numero: int, tick: int) -> Moteur:
+        """
+        Renvoie le moteur d'une partie tel qu'il était à un tick donné, en repartant
+        du dernier instantané qui précède ce tick, trouvé par dichotomie dans la table
+        des instantanés de la partie
+
+        Args:
+            numero (int): Le numéro de la partie
+            tick (int): Le tick recherché
+
+        Raises:
+            TypeError: Le type de numero ou de tick est invalide
+            ValueError: numero ou tick est négatif
+            IndexError: Il n'y a pas de partie avec ce numéro
+
+        Returns:
+            Moteur: Le moteur au tick demandé, ou à la fin de la partie si elle est terminée
+        """
+        verif_entier_pos("tick", tick)
+
+        debut, fin = self.__bornes(numero)
+        nombre = _TAILLE.unpack_from(self.__donnees, fin)[0]
+        table = fin + _TAILLE.size
+
+        # On cherche le nombre d'instantanés dont le tick est inférieur ou égal à tick
+        bas, haut = 0, nombre
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            tick_milieu = _INSTANTANE.unpack_from(
+                self.__donnees, table + milieu * _INSTANTANE.size
+            )[0]
+            if tick_milieu <= tick:
+                bas = milieu + 1
+            else:
+                haut = milieu
+
+        instantane = None
+        if bas > 0:
+            instantane = _INSTANTANE.unpack_from(
+                self.__donnees, table + (bas - 1) * _INSTANTANE.size
+            )
+
+        # La vue évite de copier l'enregistrement, elle doit être libérée avant de fermer
+        # la projection
+        with memoryview(self.__donnees) as vue:
+            with vue[debut:fin] as enregistrement:
+                return reprendre(enregistrement, tick, instantane)
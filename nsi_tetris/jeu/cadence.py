@@ -0,0 +1,91 @@
+"""
+Module de la cadence de la logique du jeu, qui fait avancer le moteur à un rythme fixe
+indépendant du nombre d'images affichées par seconde
+"""
+
+from time import perf_counter
+from typing import Callable, Optional
+
+from .erreurs import verif_entier_pos
+from .regles import FREQUENCE_LOGIQUE
+
+
+class Cadence:
+    """
+    Représente un accumulateur à pas fixe.
+
+    Le temps écoulé depuis le dernier appel est ajouté à un accumulateur, qui est ensuite
+    découpé en ticks de durée fixe : une image affichée en retard donne donc plusieurs
+    ticks, et une image en avance n'en donne aucun. Le nombre de ticks rattrapés en une
+    fois est borné, le retard au delà est abandonné pour ne pas bloquer l'affichage.
+
+    Sans fréquence, la cadence est illimitée : chaque appel renvoie le nombre maximal
+    de ticks, sans consulter l'horloge, ce qui permet de jouer le plus vite possible.
+    """
+
+    def __init__(
+        self,
+        frequence: Optional[int] = FREQUENCE_LOGIQUE,
+        rattrapage_max=8,
+        horloge: Callable[[], float] = perf_counter,
+    ) -> None:
+        """
+        Args:
+            frequence (int, optional): Le nombre de ticks par seconde, ou None pour une
+                cadence illimitée
+            rattrapage_max (int, optional): Le nombre maximal de ticks renvoyés par appel
+            horloge (Callable[[], float], optional): La fonction qui renvoie le temps
+                actuel en secondes
+
+        Raises:
+            TypeError: Le type de frequence ou de rattrapage_max est invalide
+            ValueError: frequence ou rattrapage_max est inférieur à 1
+        """
+        # Préconditions
+        if frequence is not None:
+            verif_entier_pos("frequence", frequence)
+            if frequence < 1:
+                raise ValueError("La fréquence doit être supérieure ou égale à 1")
+
+        verif_entier_pos("rattrapage_max", rattrapage_max)
+        if rattrapage_max < 1:
+            raise ValueError("rattrapage_max doit être supérieur ou égal à 1")
+
+        self.__frequence = frequence
+        self.__pas = None if frequence is None else 1 / frequence
+        self.__rattrapage_max = rattrapage_max
+        self.__horloge = horloge
+        self.__accumulateur = 0.0
+        self.__precedent = horloge()
+
+    def get_frequence(self) -> Optional[int]:
+        """Renvoie le nombre de ticks par seconde, ou None si la cadence est illimitée"""
+        return self.__frequence
+
+    def reinitialiser(self) -> None:
+        """Oublie le temps écoulé, par exemple à la sortie d'une pause"""
+        self.__accumulateur = 0.0
+        self.__precedent = self.__horloge()
+
+    def ticks(self) -> int:
+        """
+        Renvoie le nombre de ticks à jouer depuis le dernier appel
+
+        Returns:
+            int: Le nombre de ticks, entre 0 et rattrapage_max
+        """
+        if self.__pas is None:
+            return self.__rattrapage_max
+
+        maintenant = self.__horloge()
+        self.__accumulateur += maintenant - self.__precedent
+        self.__precedent = maintenant
+
+        nombre = int(self.__accumulateur // self.__pas)
+        if nombre > self.__rattrapage_max:
+            # Le retard est trop important pour être rattrapé, on l'abandonne
+            self.__accumulateur = 0.0
+            return self.__rattrapage_max
+
+        self.__accumulateur -= nombre * self.__pas
+        return nombre
@@ -0,0 +1,249 @@
+"""
+Module du client de test de charge du serveur multijoueur.
+
+Chaque client simulé cherche une partie, envoie des actions au hasard à un rythme
+donné et reconstruit les deux plateaux à partir des messages reçus, puis cherche une
+nouvelle partie à la fin de chacune. Le serveur peut être lancé dans le même processus
+avec --local, sinon il doit être lancé à part :
+
+    python -m nsi_tetris.jeu.serveur --port 7777
+    python -m nsi_tetris.jeu.charge --port 7777 --parties 200 --duree 30
+"""
+
+import asyncio
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from typing import Dict, NamedTuple, Optional
+
+from .erreurs import verif_entier_pos
+from .moteur import Action
+from .regles import GRILLE_LIGNES
+from .reseau import (
+    ACTION,
+    DEBUT,
+    ETAT,
+    FIN,
+    REJOINDRE,
+    Vue,
+    appliquer_etat,
+    lire_debut,
+    lire_trame,
+    trame,
+)
+from .serveur import Serveur
+
+# Les actions envoyées par les clients simulés
+_ACTIONS = [
+    trame(ACTION, bytes((action.value,)))
+    for action in Action
+    if action is not Action.TICK
+]
+
+
+class Compteurs:
+    """Représente les compteurs partagés par tous les clients simulés"""
+
+    def __init__(self) -> None:
+        self.parties = 0
+        """Le nombre de parties commencées"""
+        self.terminees = 0
+        """Le nombre de parties terminées"""
+        self.messages = 0
+        """Le nombre de messages reçus"""
+        self.octets = 0
+        """Le nombre d'octets reçus"""
+        self.actions = 0
+        """Le nombre d'actions envoyées"""
+        self.erreurs = 0
+        """Le nombre de clients déconnectés par une erreur"""
+
+
+class Rapport(NamedTuple):
+    """Représente le résultat d'un test de charge"""
+
+    clients: int
+    """Le nombre de clients simulés"""
+    duree: float
+    """La durée du test, en secondes"""
+    parties: int
+    """Le nombre de parties commencées"""
+    terminees: int
+    """Le nombre de parties terminées"""
+    messages_par_seconde: float
+    """Le nombre de messages reçus par seconde par l'ensemble des clients"""
+    octets_par_seconde: float
+    """Le nombre d'octets reçus par seconde par l'ensemble des clients"""
+    actions_par_seconde: float
+    """Le nombre d'actions envoyées par seconde par l'ensemble des clients"""
+    erreurs: int
+    """Le nombre de clients déconnectés par une erreur"""
+
+
+async def _envoyer_actions(
+    ecrivain: asyncio.StreamWriter, aleatoire: Random, intervalle: float, compteurs
+) -> None:
+    """Envoie une action au hasard à chaque intervalle, jusqu'à être annulé"""
+    while True:
+        await asyncio.sleep(intervalle * (0.5 + aleatoire.random()))
+        ecrivain.write(aleatoire.choice(_ACTIONS))
+        compteurs.actions += 1
+
+
+async def client(
+    hote: str,
+    port: int,
+    duree: float,
+    compteurs: Compteurs,
+    graine: Optional[int] = None,
+    actions_par_seconde=10.0,
+) -> None:
+    """
+    Simule un joueur pendant une durée donnée
+
+    Args:
+        hote (str): L'adresse du serveur
+        port (int): Le port du serveur
+        duree (float): La durée de la simulation, en secondes
+        compteurs (Compteurs): Les compteurs à mettre à jour
+        graine (int, optional): La graine du choix des actions
+        actions_par_seconde (float, optional): Le nombre moyen d'actions par seconde
+    """
+    aleatoire = Random(graine)
+    lecteur, ecrivain = await asyncio.open_connection(hote, port)
+    envoi: Optional[asyncio.Task] = None
+    fin = perf_counter() + duree
+    vues: Dict[int, Vue] = {}
+    try:
+        ecrivain.write(trame(REJOINDRE))
+        while True:
+            reste = fin - perf_counter()
+            if reste <= 0:
+                break
+
+            try:
+                type_message, contenu = await asyncio.wait_for(
+                    lire_trame(lecteur), reste
+                )
+            except asyncio.TimeoutError:
+                break
+
+            compteurs.messages += 1
+            compteurs.octets += len(contenu) + 3
+            if type_message == DEBUT:
+                lire_debut(contenu)
+                compteurs.parties += 1
+                vues = {0: Vue(GRILLE_LIGNES + 10), 1: Vue(GRILLE_LIGNES + 10)}
+                envoi = asyncio.ensure_future(
+                    _envoyer_actions(
+                        ecrivain, aleatoire, 1 / actions_par_seconde, compteurs
+                    )
+                )
+            elif type_message == ETAT:
+                appliquer_etat(vues, contenu)
+            elif type_message == FIN:
+                compteurs.terminees += 1
+                if envoi is not None:
+                    envoi.cancel()
+                    envoi = None
+                ecrivain.write(trame(REJOINDRE))
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        compteurs.erreurs += 1
+    finally:
+        if envoi is not None:
+            envoi.cancel()
+        ecrivain.close()
+
+
+async def charger(
+    hote: str,
+    port: int,
+    parties: int,
+    duree: float,
+    actions_par_seconde=10.0,
+    local=False,
+) -> Rapport:
+    """
+    Lance un test de charge
+
+    Args:
+        hote (str): L'adresse du serveur
+        port (int): Le port du serveur
+        parties (int): Le nombre de parties simultanées, soit deux fois plus de clients
+        duree (float): La durée du test, en secondes
+        actions_par_seconde (float, optional): Le nombre moyen d'actions par seconde
+            de chaque client
+        local (bool, optional): True pour lancer le serveur dans ce processus, sur un
+            port choisi par le système
+
+    Raises:
+        TypeError: Le type de parties est invalide
+
+    Returns:
+        Rapport: Le résultat du test
+    """
+    verif_entier_pos("parties", parties)
+
+    taches = []
+    if local:
+        serveur = Serveur(graine=0)
+        serveur_asyncio = await serveur.demarrer(hote, 0)
+        port = serveur_asyncio.sockets[0].getsockname()[1]
+        taches.append(asyncio.ensure_future(serveur.executer()))
+
+    compteurs = Compteurs()
+    debut = perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                client(hote, port, duree, compteurs, graine, actions_par_seconde)
+                for graine in range(parties * 2)
+            )
+        )
+    finally:
+        if local:
+            # Le serveur doit constater chaque déconnexion avant d'être arrêté
+            serveur_asyncio.close()
+            for _ in range(100):
+                if serveur.statistiques().connexions == 0:
+                    break
+                await asyncio.sleep(0.05)
+
+        for tache in taches:
+            tache.cancel()
+
+    ecoule = perf_counter() - debut
+    return Rapport(
+        parties * 2,
+        ecoule,
+        compteurs.parties,
+        compteurs.terminees,
+        compteurs.messages / ecoule,
+        compteurs.octets / ecoule,
+        compteurs.actions / ecoule,
+        compteurs.erreurs,
+    )
+
+
+if __name__ == "__main__":
+    analyseur = ArgumentParser(description="Test de charge du serveur multijoueur")
+    analyseur.add_argument("--hote", default="127.0.0.1")
+    analyseur.add_argument("--port", type=int, default=7777)
+    analyseur.add_argument("--parties", type=int, default=100)
+    analyseur.add_argument("--duree", type=float, default=10.0)
+    analyseur.add_argument("--actions", type=float, default=10.0)
+    analyseur.add_argument("--local", action="store_true")
+    arguments = analyseur.parse_args()
+
+    print(
+        asyncio.run(
+            charger(
+                arguments.hote,
+                arguments.port,
+                arguments.parties,
+                arguments.duree,
+                arguments.actions,
+                arguments.local,
+            )
+        )
+    )
@@ -5,6 +5,18 @@ from pygame.color import Color
 
 from .tetrimino import Modele
 
+# Les constantes des règles sont définies à part pour pouvoir jouer sans pygame
+from .regles import (  # pylint: disable=unused-import
+    TETR_DEFAUT_X,
+    TETR_DEFAUT_Y,
+    GRILLE_LIGNES,
+    GRILLE_COLONNES,
+    FREQUENCE_LOGIQUE,
+    SCORES,
+    FORMES_TETRIMINOS,
+    TABLE_ROTATIONS,
+)
+
 # Couleurs
 BLANC = Color(255, 255, 255)
 NOIR = Color(0, 0, 0)
@@ -16,75 +28,21 @@ TAILLE_CASE = 18
 TAILLE_BORDURE = 8
 IPS = 60
 
-# Position par défaut d'un tetrimino
-TETR_DEFAUT_X = 3
-TETR_DEFAUT_Y = 7
-
-# Taille de la grille
-GRILLE_LIGNES = 20
-GRILLE_COLONNES = 10
-
-# Le score que rapporte chaque nombre de lignes
-SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+# Ne redessiner que les zones de la fenêtre qui changent d'une image à l'autre
+RENDU_PARTIEL = True
+
+# Couleurs des différents tetriminos
+COULEURS_TETRIMINOS: Dict[str, Color] = {
+    "I": Color("cyan"),
+    "O": Color("yellow"),
+    "T": Color("purple"),
+    "S": Color("green"),
+    "Z": Color("red"),
+    "J": Color("blue"),
+    "L": Color("orange"),
+}
 
 # Caractéristiques des différents tetriminos
 MODELES_TETRIMINOS: Dict[str, Modele] = {
-    "I": (
-        (
-            (0, 0, 0, 0),  #
-            (1, 1, 1, 1),  #
-            (0, 0, 0, 0),  #
-            (0, 0, 0, 0),  #
-        ),
-        Color("cyan"),
-    ),
-    "O": (
-        (
-            (0, 0, 0, 0),  #
-            (0, 1, 1, 0),  #
-            (0, 1, 1, 0),  #
-            (0, 0, 0, 0),  #
-        ),
-        Color("yellow"),
-    ),
-    "T": (
-        (
-            (0, 1, 0),  #
-            (1, 1, 1),  #
-            (0, 0, 0),  #
-        ),
-        Color("purple"),
-    ),
-    "S": (
-        (
-            (0, 1, 1),  #
-            (1, 1, 0),  #
-            (0, 0, 0),  #
-        ),
-        Color("green"),
-    ),
-    "Z": (
-        (
-            (1, 1, 0),  #
-            (0, 1, 1),  #
-            (0, 0, 0),  #
-        ),
-        Color("red"),
-    ),
-    "J": (
-        (
-            (1, 0, 0),  #
-            (1, 1, 1),  #
-            (0, 0, 0),  #
-        ),
-        Color("blue"),
-    ),
-    "L": (
-        (
-            (0, 0, 1),  #
-            (1, 1, 1),  #
-            (0, 0, 0),  #
-        ),
-        Color("orange"),
-    ),
+    nom: (forme, COULEURS_TETRIMINOS[nom]) for nom, forme in FORMES_TETRIMINOS.items()
 }
@@ -0,0 +1,522 @@
+"""
+Module d'enregistrement des parties, qui permet de les rejouer à l'identique sans affichage.
+
+Une partie est entièrement déterminée par la graine du sac, le niveau de départ et les
+actions du joueur avec le tick auquel elles ont été jouées. Le format binaire est compact :
+
+- un en-tête, suivi de la graine et du niveau de départ
+- pour chaque action, l'écart en ticks avec l'entrée précédente (entier de taille variable)
+  puis le code de l'action sur un octet
+- régulièrement, un instantané de l'état du moteur : l'écart en ticks, le code INSTANTANE,
+  la taille de l'instantané puis son contenu, ce qui permet de reprendre la partie à
+  n'importe quel tick sans rejouer tous les ticks précédents
+- l'écart en ticks jusqu'à la fin de la partie suivi du code FIN, puis le score,
+  le nombre de lignes et l'empreinte du plateau final sur 8 octets
+"""
+
+from hashlib import blake2b
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from .erreurs import verif_entier_pos, verifier_type
+from .moteur import Action, EtatMoteur, Moteur
+from .plateau import Plateau
+from .tetrimino import Modele, Rotation
+
+ENTETE = b"NTR\x01"
+CODE_INSTANTANE = 0xFE
+CODE_FIN = 0xFF
+
+# Le nombre de ticks entre deux instantanés, et donc le nombre maximal de ticks
+# à rejouer pour reprendre une partie à un tick donné
+INTERVALLE_INSTANTANES = 600
+
+
+def ecrire_varint(tampon: bytearray, valeur: int) -> None:
+    """
+    Ajoute un entier positif à un tampon, sur 7 bits par octet : le bit de poids fort
+    de chaque octet vaut 1 s'il est suivi d'un autre octet
+
+    Args:
+        tampon (bytearray): Le tampon à compléter
+        valeur (int): L'entier positif à écrire
+    """
+    while valeur > 0x7F:
+        tampon.append((valeur & 0x7F) | 0x80)
+        valeur >>= 7
+    tampon.append(valeur)
+
+
+def lire_varint(donnees: bytes, position: int) -> Tuple[int, int]:
+    """
+    Lit un entier écrit par ecrire_varint
+
+    Args:
+        donnees (bytes): Les données à lire
+        position (int): La position du premier octet de l'entier
+
+    Raises:
+        ValueError: Les données s'arrêtent au milieu de l'entier
+
+    Returns:
+        Tuple[int, int]: L'entier lu et la position de l'octet suivant
+    """
+    valeur = 0
+    decalage = 0
+    while True:
+        if position >= len(donnees):
+            raise ValueError("Les données de l'enregistrement sont tronquées")
+
+        octet = donnees[position]
+        position += 1
+        valeur |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return valeur, position
+        decalage += 7
+
+
+def ecrire_relatif(tampon: bytearray, valeur: int) -> None:
+    """
+    Ajoute un entier éventuellement négatif à un tampon, en l'entrelaçant avec
+    les entiers positifs (0, -1, 1, -2...) pour que les petites valeurs restent courtes
+
+    Args:
+        tampon (bytearray): Le tampon à compléter
+        valeur (int): L'entier à écrire
+    """
+    ecrire_varint(tampon, valeur * 2 if valeur >= 0 else -valeur * 2 - 1)
+
+
+def lire_relatif(donnees: bytes, position: int) -> Tuple[int, int]:
+    """
+    Lit un entier écrit par ecrire_relatif
+
+    Args:
+        donnees (bytes): Les données à lire
+        position (int): La position du premier octet de l'entier
+
+    Returns:
+        Tuple[int, int]: L'entier lu et la position de l'octet suivant
+    """
+    valeur, position = lire_varint(donnees, position)
+    return (valeur >> 1) ^ -(valeur & 1), position
+
+
+def empreinte_plateau(plateau: Plateau) -> int:
+    """
+    Calcule une empreinte de 64 bits du contenu d'un plateau, indépendante des couleurs
+
+    Args:
+        plateau (Plateau): Le plateau
+
+    Returns:
+        int: L'empreinte du plateau
+    """
+    taille = (plateau.forme()[1] + 7) // 8
+    contenu = b"".join(
+        masque.to_bytes(taille, "little") for masque in plateau.masques()
+    )
+    return int.from_bytes(blake2b(contenu, digest_size=8).digest(), "little")
+
+
+def ecrire_etat(tampon: bytearray, etat: EtatMoteur, modeles: List[Modele]) -> None:
+    """
+    Ajoute l'état d'un moteur à un tampon. Chaque ligne de la grille est écrite sous
+    la forme de son masque, suivi de l'indice du modèle de chacune de ses cases occupées.
+
+    Args:
+        tampon (bytearray): Le tampon à compléter
+        etat (EtatMoteur): L'état à écrire
+        modeles (List[Modele]): Les modèles du moteur, qui donnent les couleurs des cases
+    """
+    for valeur in (etat.ticks, etat.fractions, etat.score, etat.lignes, etat.pieces):
+        ecrire_varint(tampon, valeur)
+
+    tampon.append(etat.perdu)
+    tampon.append(etat.modele)
+    ecrire_relatif(tampon, etat.x)
+    ecrire_relatif(tampon, etat.y)
+    tampon.append(etat.rotation.value)
+
+    couleurs = [couleur for _, couleur in modeles]
+    ecrire_varint(tampon, len(etat.grille))
+    ecrire_varint(tampon, len(etat.grille[0]))
+    for ligne in etat.grille:
+        masque = 0
+        cases = bytearray()
+        for colonne, case in enumerate(ligne):
+            if case is not None:
+                masque |= 1 << colonne
+                cases.append(couleurs.index(case))
+        ecrire_varint(tampon, masque)
+        tampon += cases
+
+
+def lire_etat(
+    donnees: bytes, position: int, modeles: List[Modele]
+) -> Tuple[EtatMoteur, int]:
+    """
+    Lit un état écrit par ecrire_etat
+
+    Args:
+        donnees (bytes): Les données à lire
+        position (int): La position du début de l'état
+        modeles (List[Modele]): Les modèles du moteur
+
+    Returns:
+        Tuple[EtatMoteur, int]: L'état lu et la position de l'octet suivant
+    """
+    ticks, position = lire_varint(donnees, position)
+    fractions, position = lire_varint(donnees, position)
+    score, position = lire_varint(donnees, position)
+    nombre_lignes, position = lire_varint(donnees, position)
+    pieces, position = lire_varint(donnees, position)
+
+    perdu, modele = bool(donnees[position]), donnees[position + 1]
+    tetr_x, position = lire_relatif(donnees, position + 2)
+    tetr_y, position = lire_relatif(donnees, position)
+    rotation = Rotation(donnees[position])
+
+    lignes, position = lire_varint(donnees, position + 1)
+    colonnes, position = lire_varint(donnees, position)
+    grille = []
+    for _ in range(lignes):
+        masque, position = lire_varint(donnees, position)
+        ligne = [None] * colonnes
+        for colonne in range(colonnes):
+            if masque >> colonne & 1:
+                ligne[colonne] = modeles[donnees[position]][1]
+                position += 1
+        grille.append(ligne)
+
+    etat = EtatMoteur(
+        ticks,
+        fractions,
+        score,
+        nombre_lignes,
+        pieces,
+        perdu,
+        tuple(map(tuple, grille)),
+        modele,
+        tetr_x,
+        tetr_y,
+        rotation,
+    )
+    return etat, position
+
+
+class Enregistrement(NamedTuple):
+    """Représente le contenu d'un enregistrement"""
+
+    graine: int
+    """La graine du sac"""
+    niveau: int
+    """Le niveau de départ"""
+    actions: List[Tuple[int, Action]]
+    """Les actions jouées, avec le tick auquel elles ont été jouées"""
+    instantanes: List[Tuple[int, int]]
+    """Le tick et la position dans les données de chaque instantané"""
+    ticks: int
+    """Le nombre de ticks de la partie"""
+    score: int
+    """Le score final"""
+    lignes: int
+    """Le nombre de lignes effacées"""
+    empreinte: int
+    """L'empreinte du plateau final"""
+
+
+class Enregistreur:
+    """Enregistre les actions d'une partie au format binaire compact"""
+
+    def __init__(
+        self,
+        graine: int,
+        niveau=1,
+        intervalle: Optional[int] = INTERVALLE_INSTANTANES,
+    ) -> None:
+        """
+        Args:
+            graine (int): La graine du sac de la partie
+            niveau (int, optional): Le niveau de départ de la partie
+            intervalle (int, optional): Le nombre de ticks entre deux instantanés,
+                ou None pour ne pas en enregistrer
+
+        Raises:
+            TypeError: Le type de graine, de niveau ou d'intervalle est invalide
+            ValueError: graine, niveau ou intervalle est négatif
+        """
+        # Préconditions
+        verif_entier_pos("graine", graine)
+        verif_entier_pos("niveau", niveau)
+        if intervalle is not None:
+            verif_entier_pos("intervalle", intervalle)
+
+        self.__tampon = bytearray(ENTETE)
+        ecrire_varint(self.__tampon, graine)
+        ecrire_varint(self.__tampon, niveau)
+        self.__dernier_tick = 0
+        self.__intervalle = intervalle
+        self.__dernier_instantane = 0
+
+    def __len__(self) -> int:
+        return len(self.__tampon)
+
+    def ajouter(self, tick: int, action: Action) -> None:
+        """
+        Enregistre une action jouée avant un tick donné
+
+        Args:
+            tick (int): Le nombre de ticks écoulés quand l'action a été jouée
+            action (Action): L'action jouée, qui ne peut pas être un tick
+
+        Raises:
+            TypeError: Le type de action est invalide
+            ValueError: L'action est un tick, ou tick est inférieur au tick précédent
+        """
+        # Préconditions
+        verifier_type("action", action, Action)
+        if action is Action.TICK:
+            raise ValueError("Les ticks ne sont pas enregistrés comme des actions")
+        if tick < self.__dernier_tick:
+            raise ValueError("Les actions doivent être enregistrées dans l'ordre")
+
+        ecrire_varint(self.__tampon, tick - self.__dernier_tick)
+        self.__tampon.append(action.value)
+        self.__dernier_tick = tick
+
+    def suivre(self, moteur: Moteur) -> None:
+        """
+        Enregistre un instantané de l'état du moteur si l'intervalle entre deux
+        instantanés est écoulé. À appeler après chaque tick.
+
+        Args:
+            moteur (Moteur): Le moteur de la partie enregistrée
+        """
+        tick = moteur.get_ticks()
+        if (
+            self.__intervalle is None
+            or tick - self.__dernier_instantane < self.__intervalle
+        ):
+            return
+
+        etat = bytearray()
+        ecrire_etat(etat, moteur.etat(), moteur.get_modeles())
+
+        ecrire_varint(self.__tampon, tick - self.__dernier_tick)
+        self.__tampon.append(CODE_INSTANTANE)
+        ecrire_varint(self.__tampon, len(etat))
+        self.__tampon += etat
+        self.__dernier_tick = tick
+        self.__dernier_instantane = tick
+
+    def terminer(self, moteur: Moteur) -> bytes:
+        """
+        Renvoie l'enregistrement complet, en ajoutant l'état final de la partie.
+        L'enregistreur peut continuer à être utilisé ensuite.
+
+        Args:
+            moteur (Moteur): Le moteur de la partie enregistrée
+
+        Raises:
+            TypeError: Le type de moteur est invalide
+            ValueError: Le moteur est en retard sur la dernière action enregistrée
+
+        Returns:
+            bytes: Les données de l'enregistrement
+        """
+        # Préconditions
+        verifier_type("moteur", moteur, Moteur)
+        if moteur.get_ticks() < self.__dernier_tick:
+            raise ValueError("Le moteur est en retard sur la dernière action")
+
+        donnees = bytearray(self.__tampon)
+        ecrire_varint(donnees, moteur.get_ticks() - self.__dernier_tick)
+        donnees.append(CODE_FIN)
+        ecrire_varint(donnees, moteur.get_score())
+        ecrire_varint(donnees, moteur.get_lignes())
+        donnees += empreinte_plateau(moteur.get_plateau()).to_bytes(8, "little")
+        return bytes(donnees)
+
+
+def lire_entete(donnees: bytes) -> Tuple[int, int, int]:
+    """
+    Lit l'en-tête d'un enregistrement
+
+    Args:
+        donnees (bytes): Les données de l'enregistrement
+
+    Raises:
+        ValueError: Les données ne sont pas un enregistrement
+
+    Returns:
+        Tuple[int, int, int]: La graine, le niveau de départ et la position
+        de la première entrée
+    """
+    if bytes(donnees[: len(ENTETE)]) != ENTETE:
+        raise ValueError("Les données ne sont pas un enregistrement de partie")
+
+    graine, position = lire_varint(donnees, len(ENTETE))
+    niveau, position = lire_varint(donnees, position)
+    return graine, niveau, position
+
+
+def parcourir(donnees: bytes, position: int, tick=0) -> Iterator[Tuple[int, int, int]]:
+    """
+    Parcourt les entrées d'un enregistrement jusqu'au code FIN inclus
+
+    Args:
+        donnees (bytes): Les données de l'enregistrement
+        position (int): La position de la première entrée à lire
+        tick (int, optional): Le tick de l'entrée précédente
+
+    Raises:
+        ValueError: Les données sont tronquées ou contiennent un code invalide
+
+    Yields:
+        Tuple[int, int, int]: Le tick, le code et la position qui suit le code de chaque
+        entrée (pour un instantané, la position de sa taille)
+    """
+    while True:
+        ecart, position = lire_varint(donnees, position)
+        tick += ecart
+        if position >= len(donnees):
+            raise ValueError("Les données de l'enregistrement sont tronquées")
+
+        code = donnees[position]
+        position += 1
+        if code == CODE_INSTANTANE:
+            yield tick, code, position
+            taille, position = lire_varint(donnees, position)
+            position += taille
+        elif code == CODE_FIN:
+            yield tick, code, position
+            return
+        elif code >= len(Action) or code == Action.TICK.value:
+            raise ValueError(f"Code d'action invalide : {code}")
+        else:
+            yield tick, code, position
+
+
+def lire(donnees: bytes) -> Enregistrement:
+    """
+    Décode un enregistrement
+
+    Args:
+        donnees (bytes): Les données renvoyées par Enregistreur.terminer
+
+    Raises:
+        ValueError: Les données ne sont pas un enregistrement valide
+
+    Returns:
+        Enregistrement: Le contenu de l'enregistrement
+    """
+    graine, niveau, position = lire_entete(donnees)
+
+    actions: List[Tuple[int, Action]] = []
+    instantanes: List[Tuple[int, int]] = []
+    fin = 0
+    for tick, code, suivante in parcourir(donnees, position):
+        if code == CODE_INSTANTANE:
+            instantanes.append((tick, suivante))
+        elif code == CODE_FIN:
+            # parcourir s'arrête après le code FIN, qui est suivi du résultat
+            fin, position = tick, suivante
+        else:
+            actions.append((tick, Action(code)))
+
+    score, position = lire_varint(donnees, position)
+    lignes, position = lire_varint(donnees, position)
+    if len(donnees) != position + 8:
+        raise ValueError("Les données de l'enregistrement sont tronquées")
+    empreinte = int.from_bytes(donnees[position:], "little")
+
+    return Enregistrement(
+        graine, niveau, actions, instantanes, fin, score, lignes, empreinte
+    )
+
+
+def _avancer(moteur: Moteur, tick: int) -> None:
+    """Joue des ticks jusqu'à atteindre un tick donné ou la fin de la partie"""
+    jouer = moteur.jouer
+    action_tick = Action.TICK
+    while moteur.get_ticks() < tick and not moteur.est_perdu():
+        jouer(action_tick)
+
+
+def rejouer(donnees: bytes) -> Moteur:
+    """
+    Rejoue une partie enregistrée sans affichage, le plus vite possible, puis vérifie
+    que le score et le plateau final correspondent à ceux de l'enregistrement
+
+    Args:
+        donnees (bytes): Les données renvoyées par Enregistreur.terminer
+
+    Raises:
+        ValueError: Les données sont invalides, ou la partie rejouée ne donne pas
+            le même résultat que la partie enregistrée
+
+    Returns:
+        Moteur: Le moteur à la fin de la partie rejouée
+    """
+    enregistrement = lire(donnees)
+    moteur = Moteur(graine=enregistrement.graine, niveau=enregistrement.niveau)
+
+    for tick_action, action in enregistrement.actions:
+        _avancer(moteur, tick_action)
+        moteur.jouer(action)
+
+    _avancer(moteur, enregistrement.ticks)
+
+    if (
+        moteur.get_ticks() != enregistrement.ticks
+        or moteur.get_score() != enregistrement.score
+        or moteur.get_lignes() != enregistrement.lignes
+        or empreinte_plateau(moteur.get_plateau()) != enregistrement.empreinte
+    ):
+        raise ValueError("La partie rejouée ne correspond pas à l'enregistrement")
+
+    return moteur
+
+
+def reprendre(
+    donnees: bytes, tick: int, instantane: Optional[Tuple[int, int]] = None
+) -> Moteur:
+    """
+    Renvoie le moteur d'une partie enregistrée tel qu'il était à un tick donné.
+    Si un instantané est donné, la partie est reprise à partir de celui-ci et seules les
+    entrées qui le suivent sont lues : au plus un intervalle de ticks est alors rejoué.
+
+    Args:
+        donnees (bytes): Les données de l'enregistrement
+        tick (int): Le tick auquel arrêter la partie
+        instantane (Tuple[int, int], optional): Le tick et la position d'un instantané
+            antérieur à tick, comme donnés par lire
+
+    Raises:
+        ValueError: Les données sont invalides, ou l'instantané est postérieur à tick
+
+    Returns:
+        Moteur: Le moteur au tick demandé, ou à la fin de la partie si elle est terminée
+    """
+    graine, niveau, position = lire_entete(donnees)
+    moteur = Moteur(graine=graine, niveau=niveau)
+    depart = 0
+
+    if instantane is not None:
+        depart, position = instantane
+        if depart > tick:
+            raise ValueError("L'instantané doit être antérieur au tick demandé")
+
+        _, position = lire_varint(donnees, position)
+        etat, position = lire_etat(donnees, position, moteur.get_modeles())
+        moteur.restaurer(etat)
+
+    for tick_entree, code, _ in parcourir(donnees, position, depart):
+        if tick_entree > tick or code == CODE_FIN:
+            break
+        if code != CODE_INSTANTANE:
+            _avancer(moteur, tick_entree)
+            moteur.jouer(Action(code))
+
+    _avancer(moteur, tick)
+    return moteur
@@ -0,0 +1,388 @@
+"""
+Module des environnements d'apprentissage par renforcement, avec l'interface de
+Gymnasium : reset renvoie l'observation initiale, et step renvoie l'observation,
+la récompense, et si la partie est terminée ou interrompue.
+
+Les observations sont de petits tableaux numpy construits à partir des masques du
+plateau, sans passer par les couleurs ni par les copies de la grille.
+"""
+
+from random import Random
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .erreurs import verif_entier_pos, verifier_type
+from .moteur import Action, Moteur, Resultat
+from .regles import GRILLE_COLONNES, GRILLE_LIGNES
+
+# Les actions sont désignées par leur valeur, qui est aussi leur indice
+ACTIONS: Tuple[Action, ...] = tuple(Action)
+
+# Le nombre de prochains modèles observés par défaut
+APERCU = 5
+
+# Le nombre de plateaux dont les cases occupées sont conservées par l'observateur
+TAILLE_CACHE = 4096
+
+
+class Observation(NamedTuple):
+    """
+    Représente ce que l'agent observe de la partie. Les modèles sont désignés par
+    leur indice dans la liste des modèles du moteur.
+    """
+
+    plateau: np.ndarray
+    """Les cases occupées, de forme (lignes + 10, colonnes), 1 pour une case occupée"""
+    tetrimino: np.ndarray
+    """Le modèle, la position x, la position y et la rotation du tetrimino actuel"""
+    apercu: np.ndarray
+    """Les modèles des prochains tetriminos, dans l'ordre où ils seront piochés"""
+
+
+def _jouer(moteur: Moteur, action: int) -> Resultat:
+    """Joue une action désignée par sa valeur, puis fait avancer le temps d'un tick"""
+    if not 0 <= action < len(ACTIONS):
+        raise ValueError(f"L'action doit être comprise entre 0 et {len(ACTIONS) - 1}")
+
+    tick = Action.TICK
+    action_moteur = ACTIONS[action]
+    if action_moteur is not tick:
+        moteur.jouer(action_moteur)
+
+    return moteur.jouer(tick)
+
+
+class _Observateur:
+    """Remplit les tableaux des observations à partir de l'état d'un moteur"""
+
+    def __init__(self, moteur: Moteur) -> None:
+        self.__colonnes = np.arange(moteur.get_plateau().forme()[1], dtype=np.uint64)
+
+        # Les modèles sont partagés entre le moteur et son sac : on retrouve leur
+        # indice par identité, sans comparer les formes et les couleurs
+        self.__indices = {
+            id(modele): i for i, modele in enumerate(moteur.get_modeles())
+        }
+
+        # Le plateau ne change que lorsqu'un tetrimino est verrouillé : les cases
+        # occupées sont conservées, indexées par l'empreinte de Zobrist du plateau
+        self.__cache: Dict[int, np.ndarray] = {}
+
+    def remplir(
+        self,
+        moteur: Moteur,
+        plateau: np.ndarray,
+        tetrimino: np.ndarray,
+        apercu: np.ndarray,
+    ) -> None:
+        """Écrit l'observation du moteur dans les tableaux donnés"""
+        plateau_moteur = moteur.get_plateau()
+        cle = plateau_moteur.empreinte()
+        cases = self.__cache.get(cle)
+        if cases is None:
+            if len(self.__cache) >= TAILLE_CACHE:
+                self.__cache.clear()
+
+            masques = np.array(plateau_moteur.masques(), dtype=np.uint64)
+            cases = ((masques[:, None] >> self.__colonnes) & 1).astype(np.uint8)
+            self.__cache[cle] = cases
+
+        plateau[...] = cases
+
+        indices = self.__indices
+        tetr = moteur.get_tetrimino()
+        x, y = tetr.get_position()
+        tetrimino[:] = (
+            indices[id(moteur.get_modele())],
+            x,
+            y,
+            tetr.get_rotation().value,
+        )
+        apercu[:] = [
+            indices[id(modele)] for modele in moteur.get_sac().apercu(len(apercu))
+        ]
+
+
+class Environnement:
+    """
+    Représente une partie jouée par un agent.
+
+    À chaque étape, l'action choisie est jouée puis le temps avance d'un tick, comme
+    dans simulation.jouer_partie. La récompense est le nombre de points gagnés.
+    """
+
+    def __init__(
+        self,
+        apercu=APERCU,
+        ticks_max: Optional[int] = None,
+        lignes=GRILLE_LIGNES,
+        colonnes=GRILLE_COLONNES,
+    ) -> None:
+        """
+        Args:
+            apercu (int, optional): Le nombre de prochains modèles observés
+            ticks_max (int, optional): Le nombre de ticks après lequel la partie est
+                interrompue. Aucune limite par défaut.
+            lignes (int, optional): Le nombre de lignes visibles de la grille
+            colonnes (int, optional): Le nombre de colonnes de la grille
+
+        Raises:
+            TypeError: Le type d'un paramètre est invalide
+            ValueError: apercu est inférieur à 1
+        """
+        # Préconditions
+        verif_entier_pos("apercu", apercu)
+        if ticks_max is not None:
+            verif_entier_pos("ticks_max", ticks_max)
+        verif_entier_pos("lignes", lignes)
+        verif_entier_pos("colonnes", colonnes)
+        if apercu < 1:
+            raise ValueError("apercu doit être supérieur ou égal à 1")
+
+        self.__apercu = apercu
+        self.__ticks_max = ticks_max
+        self.__lignes = lignes
+        self.__colonnes = colonnes
+        self.__moteur = Moteur(lignes=lignes, colonnes=colonnes, graine=0)
+        self.__observateur = _Observateur(self.__moteur)
+
+    def get_moteur(self) -> Moteur:
+        """Renvoie le moteur de la partie en cours"""
+        return self.__moteur
+
+    def forme_observation(self) -> Tuple[Tuple[int, ...], ...]:
+        """Renvoie les formes des tableaux d'une observation, dans l'ordre des champs"""
+        return (self.__moteur.get_plateau().forme(), (4,), (self.__apercu,))
+
+    def observer(self) -> Observation:
+        """
+        Renvoie l'observation de la partie en cours
+
+        Returns:
+            Observation: Des tableaux neufs, que l'appelant peut conserver
+        """
+        forme_plateau, forme_tetrimino, forme_apercu = self.forme_observation()
+        observation = Observation(
+            np.empty(forme_plateau, dtype=np.uint8),
+            np.empty(forme_tetrimino, dtype=np.int16),
+            np.empty(forme_apercu, dtype=np.int8),
+        )
+        self.__observateur.remplir(self.__moteur, *observation)
+        return observation
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Observation, dict]:
+        """
+        Commence une nouvelle partie
+
+        Args:
+            seed (int, optional): La graine du sac, aléatoire par défaut
+
+        Raises:
+            TypeError: Le type de seed est invalide
+
+        Returns:
+            Tuple[Observation, dict]: L'observation initiale et les informations
+            sur la partie
+        """
+        if seed is None:
+            seed = Random().getrandbits(32)
+        verifier_type("seed", seed, int)
+
+        self.__moteur = Moteur(
+            lignes=self.__lignes, colonnes=self.__colonnes, graine=seed
+        )
+        return self.observer(), {"graine": seed}
+
+    def step(self, action: int) -> Tuple[Observation, float, bool, bool, dict]:
+        """
+        Joue une action puis fait avancer le temps d'un tick
+
+        Args:
+            action (int): La valeur de l'action, parmi celles de moteur.Action
+
+        Raises:
+            ValueError: L'action n'existe pas
+
+        Returns:
+            Tuple[Observation, float, bool, bool, dict]: L'observation, les points
+            gagnés, True si la partie est perdue, True si elle a atteint ticks_max,
+            et les informations sur la partie
+        """
+        moteur = self.__moteur
+        resultat = _jouer(moteur, action)
+        tronque = (
+            self.__ticks_max is not None and moteur.get_ticks() >= self.__ticks_max
+        )
+        return (
+            self.observer(),
+            float(resultat.score),
+            resultat.perdu,
+            tronque and not resultat.perdu,
+            {"lignes": resultat.lignes, "score": moteur.get_score()},
+        )
+
+
+class EnvironnementLot:
+    """
+    Représente plusieurs parties jouées en même temps, dont les observations sont
+    réunies dans des tableaux dont la première dimension est l'indice de la partie.
+
+    Une partie terminée ou interrompue est immédiatement remplacée par une nouvelle
+    partie : l'observation renvoyée est alors celle de la nouvelle partie.
+    Les graines des parties successives se suivent à partir de celle de reset.
+    """
+
+    def __init__(
+        self,
+        nombre: int,
+        apercu=APERCU,
+        ticks_max: Optional[int] = None,
+        lignes=GRILLE_LIGNES,
+        colonnes=GRILLE_COLONNES,
+    ) -> None:
+        """
+        Args:
+            nombre (int): Le nombre de parties
+            apercu (int, optional): Le nombre de prochains modèles observés
+            ticks_max (int, optional): Le nombre de ticks après lequel une partie est
+                interrompue. Aucune limite par défaut.
+            lignes (int, optional): Le nombre de lignes visibles de la grille
+            colonnes (int, optional): Le nombre de colonnes de la grille
+
+        Raises:
+            TypeError: Le type d'un paramètre est invalide
+            ValueError: nombre ou apercu est inférieur à 1
+        """
+        # Préconditions
+        verif_entier_pos("nombre", nombre)
+        verif_entier_pos("apercu", apercu)
+        if ticks_max is not None:
+            verif_entier_pos("ticks_max", ticks_max)
+        verif_entier_pos("lignes", lignes)
+        verif_entier_pos("colonnes", colonnes)
+        if nombre < 1 or apercu < 1:
+            raise ValueError("nombre et apercu doivent être supérieurs ou égaux à 1")
+
+        self.__nombre = nombre
+        self.__apercu = apercu
+        self.__ticks_max = ticks_max
+        self.__lignes = lignes
+        self.__colonnes = colonnes
+        self.__graine = 0
+        self.__moteurs: List[Moteur] = [self.__nouvelle_partie() for _ in range(nombre)]
+
+        # Toutes les parties ont la même grille et les mêmes modèles que la première
+        self.__observateur = _Observateur(self.__moteurs[0])
+
+    def __len__(self) -> int:
+        return self.__nombre
+
+    def get_moteurs(self) -> List[Moteur]:
+        """Renvoie les moteurs des parties en cours"""
+        return self.__moteurs
+
+    def __nouvelle_partie(self) -> Moteur:
+        """Crée une partie avec la graine suivante"""
+        moteur = Moteur(
+            lignes=self.__lignes, colonnes=self.__colonnes, graine=self.__graine
+        )
+        self.__graine += 1
+        return moteur
+
+    def __observations(self) -> Observation:
+        """Renvoie les observations de toutes les parties dans des tableaux neufs"""
+        formes = (self.__moteurs[0].get_plateau().forme(), (4,), (self.__apercu,))
+        observations = Observation(
+            *(
+                np.empty((self.__nombre, *forme), dtype=type_)
+                for forme, type_ in zip(formes, (np.uint8, np.int16, np.int8))
+            )
+        )
+        remplir = self.__observateur.remplir
+        for indice, moteur in enumerate(self.__moteurs):
+            remplir(moteur, *(tableau[indice] for tableau in observations))
+
+        return observations
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Observation, dict]:
+        """
+        Commence de nouvelles parties
+
+        Args:
+            seed (int, optional): La graine de la première partie, aléatoire par défaut
+
+        Raises:
+            TypeError: Le type de seed est invalide
+
+        Returns:
+            Tuple[Observation, dict]: Les observations initiales et les informations
+            sur les parties
+        """
+        if seed is None:
+            seed = Random().getrandbits(32)
+        verifier_type("seed", seed, int)
+
+        self.__graine = seed
+        self.__moteurs = [self.__nouvelle_partie() for _ in range(self.__nombre)]
+        graines = np.array([moteur.get_graine() for moteur in self.__moteurs])
+        return self.__observations(), {"graine": graines}
+
+    def step_batch(
+        self, actions: Sequence[int]
+    ) -> Tuple[Observation, np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Joue une action dans chaque partie puis fait avancer leur temps d'un tick
+
+        Args:
+            actions (Sequence[int]): La valeur de l'action de chaque partie
+
+        Raises:
+            ValueError: Le nombre d'actions est différent du nombre de parties
+            ValueError: Une des actions n'existe pas
+
+        Returns:
+            Tuple[Observation, np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+            Les observations, les points gagnés, les parties perdues, les parties
+            interrompues, et les informations sur les parties : les lignes effacées
+            et le score final des parties terminées (0 pour les autres)
+        """
+        if len(actions) != self.__nombre:
+            raise ValueError(
+                f"{self.__nombre} actions sont attendues, pas {len(actions)}"
+            )
+
+        recompenses = np.zeros(self.__nombre, dtype=np.float32)
+        perdues = np.zeros(self.__nombre, dtype=bool)
+        tronquees = np.zeros(self.__nombre, dtype=bool)
+        lignes = np.zeros(self.__nombre, dtype=np.int8)
+        scores = np.zeros(self.__nombre, dtype=np.int64)
+
+        moteurs = self.__moteurs
+        ticks_max = self.__ticks_max
+        # Les entiers Python sont plus rapides à manipuler que les entiers numpy
+        if isinstance(actions, np.ndarray):
+            actions = actions.tolist()
+
+        for indice, action in enumerate(actions):
+            moteur = moteurs[indice]
+            resultat = _jouer(moteur, action)
+            recompenses[indice] = resultat.score
+            lignes[indice] = resultat.lignes
+            if resultat.perdu:
+                perdues[indice] = True
+            elif ticks_max is not None and moteur.get_ticks() >= ticks_max:
+                tronquees[indice] = True
+            else:
+                continue
+
+            scores[indice] = moteur.get_score()
+            moteurs[indice] = self.__nouvelle_partie()
+
+        return (
+            self.__observations(),
+            recompenses,
+            perdues,
+            tronquees,
+            {"lignes": lignes, "score_final": scores},
+        )
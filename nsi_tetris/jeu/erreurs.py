@@ -1,6 +1,21 @@
-"""Module de gestion des erreurs pour simplifier les préconditions"""
+"""
+Module de gestion des erreurs pour simplifier les préconditions.
 
-from typing import Type
+Les préconditions des méthodes appelées à chaque tick ou pendant la recherche de
+l'autojoueur sont écrites sous la forme suivante, qui ne construit le message d'erreur
+qu'en cas d'échec :
+
+    if __debug__ and not isinstance(valeur, Type):
+        raise erreur_type("valeur", valeur, Type)
+
+Lorsque Python est lancé en mode optimisé (python -O), __debug__ vaut False et ces
+vérifications sont supprimées à la compilation : elles ne coûtent alors plus rien.
+"""
+
+from typing import Tuple, Type, Union
+
+# Un type, ou un tuple de types comme ceux acceptés par isinstance
+Types = Union[Type, Tuple[Type, ...]]
 
 
 def ou_erreur(condition: bool, type_erreur: Type[Exception], *args) -> None:
@@ -20,23 +35,42 @@ def ou_erreur(condition: bool, type_erreur: Type[Exception], *args) -> None:
         raise type_erreur(*args)
 
 
-def verifier_type(nom: str, valeur, type_valide: Type) -> None:
+def erreur_type(nom: str, valeur, type_valide: Types) -> TypeError:
+    """
+    Construit l'erreur levée lorsqu'une valeur passée en argument d'une fonction
+    n'a pas le bon type
+
+    Args:
+        nom (str): Le nom du paramètre
+        valeur: La valeur passée
+        type_valide (Types): Le type accepté par la fonction, ou un tuple de types
+
+    Returns:
+        TypeError: L'erreur à lever
+    """
+    if isinstance(type_valide, tuple):
+        noms = " ou ".join(type_.__name__ for type_ in type_valide)
+    else:
+        noms = type_valide.__name__
+    return TypeError(
+        f"Le paramètre {nom} doit être de type {noms}, pas {type(valeur).__name__}"
+    )
+
+
+def verifier_type(nom: str, valeur, type_valide: Types) -> None:
     """
     Permet de vérifier le type d'une valeur passée en argument d'une fonction
 
     Args:
         nom (str): Le nom du paramètre
         valeur: La valeur passée
-        type_valide (Type): Le type accepté par la fonction
+        type_valide (Types): Le type accepté par la fonction, ou un tuple de types
 
     Raises:
         TypeError: La valeur ne correspond pas au type accepté par le paramètre de la fonction
     """
-    ou_erreur(
-        isinstance(valeur, type_valide),
-        TypeError,
-        f"Le paramètre {nom} doit être de type {type_valide.__name__}, pas {type(valeur).__name__}",
-    )
+    if not isinstance(valeur, type_valide):
+        raise erreur_type(nom, valeur, type_valide)
 
 
 def verif_entier_pos(nom: str, valeur: int) -> None:
@@ -51,4 +85,5 @@ def verif_entier_pos(nom: str, valeur: int) -> None:
         ValueError: La valeur n'est pas positive
     """
     verifier_type(nom, valeur, int)
-    ou_erreur(valeur >= 0, ValueError, f"{nom} doit être positif")
+    if valeur < 0:
+        raise ValueError(f"{nom} doit être positif")
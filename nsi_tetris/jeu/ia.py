@@ -0,0 +1,373 @@
+"""Module du joueur automatique, qui cherche les meilleures positions pour les tetriminos"""
+
+from collections import deque
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .erreurs import verif_entier_pos, verifier_type
+from .moteur import Action, Moteur
+from .plateau import Placement, Plateau
+from .regles import TETR_DEFAUT_X, TETR_DEFAUT_Y
+from .tetrimino import Modele, Rotation, Tetrimino
+
+
+class Poids(NamedTuple):
+    """
+    Représente les poids de l'heuristique utilisée pour évaluer un plateau.
+    Les valeurs par défaut proviennent de l'algorithme génétique de Yiyuan Lee:
+    https://codemyroad.wordpress.com/2013/04/14/tetris-ai-the-near-perfect-player/
+    """
+
+    hauteur: float = -0.510066
+    """Poids de la somme des hauteurs des colonnes"""
+    lignes: float = 0.760666
+    """Poids du nombre de lignes effacées"""
+    trous: float = -0.35663
+    """Poids du nombre de cases vides situées sous une case occupée"""
+    bosses: float = -0.184483
+    """Poids de la somme des différences de hauteur entre colonnes voisines"""
+
+
+def evaluer(plateau: Plateau, lignes: int, poids: Poids) -> float:
+    """
+    Évalue un plateau à l'aide de l'heuristique
+
+    Args:
+        plateau (Plateau): Le plateau à évaluer
+        lignes (int): Le nombre de lignes effacées pour obtenir ce plateau
+        poids (Poids): Les poids de l'heuristique
+
+    Returns:
+        float: La valeur du plateau, plus elle est grande meilleur est le plateau
+    """
+    nombre_lignes = plateau.forme()[0]
+    hauteurs = plateau.hauteurs()
+
+    # Une case vide est un trou si une case de sa colonne est occupée plus haut
+    trous = 0
+    couvertes = 0
+    for masque in plateau.masques():
+        trous += (couvertes & ~masque).bit_count()
+        couvertes |= masque
+
+    hauteur = nombre_lignes * len(hauteurs) - sum(hauteurs)
+    bosses = sum(abs(a - b) for a, b in zip(hauteurs, hauteurs[1:]))
+
+    return (
+        poids.hauteur * hauteur
+        + poids.lignes * lignes
+        + poids.trous * trous
+        + poids.bosses * bosses
+    )
+
+
+def apparaitre(plateau: Plateau, modele: Modele) -> Optional[Tetrimino]:
+    """
+    Crée un tetrimino à sa position d'apparition, comme le fait le moteur
+
+    Args:
+        plateau (Plateau): Le plateau dans lequel le tetrimino apparaît
+        modele (Modele): Le modèle du tetrimino
+
+    Returns:
+        Optional[Tetrimino]: Le tetrimino, ou None si sa position est obstruée
+    """
+    tetr = Tetrimino(modele, TETR_DEFAUT_X, TETR_DEFAUT_Y)
+    if plateau.est_obstrue(tetr):
+        return None
+
+    tetr.set_position(y=TETR_DEFAUT_Y + 1)
+    if plateau.est_obstrue(tetr):
+        tetr.set_position(y=TETR_DEFAUT_Y)
+
+    return tetr
+
+
+def poser(
+    plateau: Plateau, tetrimino: Tetrimino, placement: Placement
+) -> Tuple[Plateau, int]:
+    """
+    Renvoie un clone du plateau dans lequel le tetrimino est verrouillé à une position
+
+    Args:
+        plateau (Plateau): Le plateau de départ, qui n'est pas modifié
+        tetrimino (Tetrimino): Le tetrimino à poser, qui n'est pas modifié
+        placement (Placement): La position du tetrimino
+
+    Returns:
+        Tuple[Plateau, int]: Le nouveau plateau et le nombre de lignes effacées
+    """
+    rotation, tetr_x, tetr_y = tetrimino.get_rotation(), *tetrimino.get_position()
+    tetrimino.set_rotation(placement.rotation)
+    tetrimino.set_position(placement.x, placement.y)
+
+    copie = plateau.cloner()
+    copie.verrouiller(tetrimino)
+    lignes = copie.effacer_lignes()
+
+    tetrimino.set_rotation(rotation)
+    tetrimino.set_position(tetr_x, tetr_y)
+    return copie, lignes
+
+
+def chemin(
+    plateau: Plateau, tetrimino: Tetrimino, placement: Placement
+) -> Optional[List[Action]]:
+    """
+    Renvoie une suite d'actions amenant un tetrimino à une position puis le verrouillant.
+    On essaie d'abord de tourner, déplacer puis faire tomber le tetrimino, et on ne fait
+    une recherche complète que si la position nécessite de glisser sous une case occupée.
+
+    Args:
+        plateau (Plateau): Le plateau
+        tetrimino (Tetrimino): Le tetrimino, qui n'est pas modifié
+        placement (Placement): La position à atteindre
+
+    Returns:
+        Optional[List[Action]]: Les actions à jouer, ou None si la position est inaccessible
+    """
+    etats = tetrimino.get_etats()
+    essai = Tetrimino((etats[Rotation.BASE.value].forme, tetrimino.get_couleur()))
+    depart = (tetrimino.get_rotation().value, *tetrimino.get_position())
+    cible = (placement.rotation.value, placement.x, placement.y)
+
+    def obstrue(rotation: int, x: int, y: int) -> bool:
+        essai.set_rotation(Rotation(rotation))
+        essai.set_position(x, y)
+        return plateau.est_obstrue(essai)
+
+    # Chemin direct : rotations, déplacements horizontaux puis chute
+    rotation, x, y = depart
+    actions = []
+    tours = (cible[0] - rotation) % 4
+    sens_horaire = tours != 3
+    for _ in range(tours if sens_horaire else 1):
+        rotation = (rotation + (1 if sens_horaire else -1)) % 4
+        actions.append(
+            Action.TOURNER_HORAIRE if sens_horaire else Action.TOURNER_ANTIHORAIRE
+        )
+        if obstrue(rotation, x, y):
+            break
+    else:
+        pas = 1 if cible[1] > x else -1
+        while x != cible[1] and not obstrue(rotation, x + pas, y):
+            x += pas
+            actions.append(Action.DROITE if pas == 1 else Action.GAUCHE)
+
+        if x == cible[1]:
+            essai.set_rotation(Rotation(rotation))
+            essai.set_position(x, y)
+            if plateau.fantome(essai) == cible[2]:
+                actions.append(Action.CHUTE)
+                return actions
+
+    # Recherche en largeur sur les états (rotation, x, y)
+    mouvements = (
+        (Action.GAUCHE, 0, -1, 0),
+        (Action.DROITE, 0, 1, 0),
+        (Action.TOURNER_HORAIRE, 1, 0, 0),
+        (Action.TOURNER_ANTIHORAIRE, -1, 0, 0),
+        (Action.DESCENDRE, 0, 0, 1),
+    )
+    precedents: Dict[Tuple[int, int, int], Tuple[Tuple[int, int, int], Action]] = {}
+    file = deque([depart])
+    visites = {depart}
+    while file:
+        etat = file.popleft()
+        if etat == cible:
+            actions = [Action.CHUTE]
+            while etat != depart:
+                etat, action = precedents[etat]
+                actions.append(action)
+            actions.reverse()
+            return actions
+
+        rotation, x, y = etat
+        for action, d_rotation, d_x, d_y in mouvements:
+            suivant = ((rotation + d_rotation) % 4, x + d_x, y + d_y)
+            if suivant not in visites and not obstrue(*suivant):
+                visites.add(suivant)
+                precedents[suivant] = (etat, action)
+                file.append(suivant)
+
+    return None
+
+
+class Autojoueur:
+    """
+    Représente un joueur automatique.
+
+    Le joueur cherche la meilleure position du tetrimino actuel en tenant compte des
+    prochains tetriminos du sac, à l'aide d'une recherche en faisceau : à chaque étape,
+    seuls les meilleurs plateaux sont conservés pour poser le tetrimino suivant.
+    Un autojoueur peut être utilisé directement comme politique de simulation.
+    """
+
+    def __init__(
+        self,
+        poids=Poids(),
+        apercu=1,
+        largeur=4,
+        budget=0.005,
+        taille_cache=100_000,
+    ) -> None:
+        """
+        Args:
+            poids (Poids, optional): Les poids de l'heuristique
+            apercu (int, optional): Le nombre de prochains tetriminos pris en compte
+            largeur (int, optional): Le nombre de plateaux conservés à chaque étape
+            budget (float, optional): Le temps de réflexion maximal par tetrimino,
+                en secondes
+            taille_cache (int, optional): Le nombre maximal de plateaux dont
+                l'évaluation est conservée
+
+        Raises:
+            TypeError: Le type d'un des paramètres est invalide
+            ValueError: largeur est inférieure à 1, ou un des autres paramètres
+                est négatif
+        """
+        # Préconditions
+        verifier_type("poids", poids, Poids)
+        verif_entier_pos("apercu", apercu)
+        verif_entier_pos("largeur", largeur)
+        verifier_type("budget", budget, (int, float))
+        verif_entier_pos("taille_cache", taille_cache)
+        if largeur < 1:
+            raise ValueError("La largeur doit être supérieure ou égale à 1")
+        if budget < 0:
+            raise ValueError("Le budget doit être positif")
+
+        self.__poids = poids
+        self.__apercu = apercu
+        self.__largeur = largeur
+        self.__budget = budget
+        self.__taille_cache = taille_cache
+
+        # Table de transposition : évaluation des plateaux déjà rencontrés
+        self.__cache: Dict[int, float] = {}
+
+        # Position choisie pour le tetrimino actuel
+        self.__tetr_plan: Optional[Tetrimino] = None
+        self.__placement: Optional[Placement] = None
+
+    def __evaluer(self, plateau: Plateau, lignes: int) -> float:
+        """Évalue un plateau en utilisant la table de transposition"""
+        cle = plateau.empreinte()
+        valeur = self.__cache.get(cle)
+        if valeur is None:
+            if len(self.__cache) >= self.__taille_cache:
+                self.__cache.clear()
+
+            # Les lignes sont comptées à part car elles ne dépendent pas du plateau obtenu
+            valeur = evaluer(plateau, 0, self.__poids)
+            self.__cache[cle] = valeur
+
+        return valeur + self.__poids.lignes * lignes
+
+    def choisir(
+        self,
+        plateau: Plateau,
+        tetrimino: Tetrimino,
+        suivants: Tuple[Modele, ...] = (),
+    ) -> Optional[Placement]:
+        """
+        Choisit la position du tetrimino actuel
+
+        Args:
+            plateau (Plateau): Le plateau
+            tetrimino (Tetrimino): Le tetrimino à placer
+            suivants (Tuple[Modele, ...], optional): Les modèles des prochains tetriminos
+
+        Returns:
+            Optional[Placement]: La meilleure position trouvée,
+            ou None si le tetrimino ne peut être placé nulle part
+        """
+        echeance = perf_counter() + self.__budget
+
+        # Un noeud du faisceau contient sa valeur, le premier placement qui y mène,
+        # le plateau obtenu et le nombre total de lignes effacées
+        faisceau: List[Tuple[float, Placement, Plateau, int]] = []
+        for placement in plateau.placements(tetrimino):
+            enfant, lignes = poser(plateau, tetrimino, placement)
+            faisceau.append((self.__evaluer(enfant, lignes), placement, enfant, lignes))
+
+        if not faisceau:
+            return None
+
+        faisceau.sort(key=lambda noeud: noeud[0], reverse=True)
+        meilleur = faisceau[0][1]
+
+        expire = False
+        for modele in suivants[: self.__apercu]:
+            faisceau = faisceau[: self.__largeur]
+            suivant: Dict[int, Tuple[float, Placement, Plateau, int]] = {}
+            for _, premier, parent, lignes_parent in faisceau:
+                tetr = apparaitre(parent, modele)
+                if tetr is None:
+                    continue
+
+                # L'échéance est vérifiée après chaque placement : un seul parent
+                # peut avoir plusieurs dizaines de placements à évaluer
+                for placement in parent.placements(tetr):
+                    enfant, lignes = poser(parent, tetr, placement)
+                    lignes += lignes_parent
+                    valeur = self.__evaluer(enfant, lignes)
+
+                    # Les plateaux identiques atteints par des chemins différents
+                    # ne sont conservés qu'une fois
+                    cle = enfant.empreinte()
+                    if cle not in suivant or suivant[cle][0] < valeur:
+                        suivant[cle] = (valeur, premier, enfant, lignes)
+
+                    if perf_counter() > echeance:
+                        expire = True
+                        break
+
+                if expire:
+                    break
+
+            if not suivant:
+                break
+
+            faisceau = sorted(
+                suivant.values(), key=lambda noeud: noeud[0], reverse=True
+            )
+            meilleur = faisceau[0][1]
+            if expire:
+                break
+
+        return meilleur
+
+    def __call__(self, moteur: Moteur) -> Action:
+        """
+        Renvoie la prochaine action à jouer, ce qui permet d'utiliser l'autojoueur
+        comme politique de simulation
+
+        Args:
+            moteur (Moteur): Le moteur de la partie
+
+        Returns:
+            Action: L'action à jouer
+        """
+        plateau = moteur.get_plateau()
+        tetrimino = moteur.get_tetrimino()
+
+        # Pour un nouveau tetrimino, on choisit sa position
+        if tetrimino is not self.__tetr_plan:
+            self.__tetr_plan = tetrimino
+            self.__placement = self.choisir(
+                plateau, tetrimino, moteur.get_sac().apercu(max(self.__apercu, 1))
+            )
+
+        if self.__placement is None:
+            return Action.CHUTE
+
+        # Le chemin est recalculé à chaque action, car la gravité peut déplacer le
+        # tetrimino entre deux actions. Dans le cas courant, le chemin direct ne coûte
+        # que quelques tests de collision.
+        actions = chemin(plateau, tetrimino, self.__placement)
+        if actions is None:
+            self.__placement = None
+            return Action.CHUTE
+
+        return actions[0]
@@ -1,7 +1,10 @@
 """Module du jeu"""
 
 import sys
-from typing import List
+from argparse import ArgumentParser
+from random import randrange
+from time import perf_counter
+from typing import Callable, List, Optional, Set, Tuple
 
 from pygame.time import Clock
 from pygame.rect import Rect
@@ -16,6 +19,7 @@ from pygame.locals import (
     K_UP,
     K_z,
     K_SPACE,
+    K_F3,
 )
 from pygame import (
     draw,
@@ -25,185 +29,282 @@ from pygame import (
     quit as pygame_quit,
 )
 
-from nsi_tetris.jeu.sac import Sac
-from nsi_tetris.jeu.plateau import Plateau
-from nsi_tetris.jeu.tetrimino import Tetrimino
-from nsi_tetris.jeu.erreurs import verifier_type
+from nsi_tetris.jeu.moteur import Action, Moteur
+from nsi_tetris.jeu.archive import Archive
+from nsi_tetris.jeu.cadence import Cadence
+from nsi_tetris.jeu.enregistrement import Enregistreur
+from nsi_tetris.jeu.erreurs import verif_entier_pos, verifier_type
+from nsi_tetris.jeu.profilage import (
+    AFFICHER,
+    AFFICHER_TETRIMINO,
+    AFFICHER_TEXTE,
+    AVANCER,
+    DESSINER,
+    Profileur,
+)
 from nsi_tetris.jeu.constantes import (
     BLANC,
+    FREQUENCE_LOGIQUE,
     MODELES_TETRIMINOS,
     TAILLE_BORDURE,
-    TETR_DEFAUT_X,
-    TETR_DEFAUT_Y,
     TAILLE_FENETRE,
     IPS,
+    RENDU_PARTIEL,
     TAILLE_CASE,
-    SCORES,
     NOIR,
 )
 from nsi_tetris.jeu.affichage import (
-    afficher_plateau,
+    SurfacePlateau,
+    afficher_profil,
     afficher_tetrimino,
     afficher_texte,
     centrer,
 )
 
+# Une surface à dessiner et sa position
+Calque = Tuple[Surface, Tuple[int, int]]
 
-class Jeu:
-    """Représente l'état actuel du jeu"""
+# Nombre d'images entre deux mises à jour de l'affichage des mesures
+PERIODE_PROFIL = 30
+
+# Actions du moteur associées à chaque touche
+TOUCHES = {
+    K_LEFT: Action.GAUCHE,
+    K_RIGHT: Action.DROITE,
+    K_DOWN: Action.DESCENDRE,
+    K_UP: Action.TOURNER_HORAIRE,
+    K_z: Action.TOURNER_ANTIHORAIRE,
+    K_SPACE: Action.CHUTE,
+}
 
-    def __init__(self) -> None:
-        self.__plateau = Plateau()
-        self.__sac = Sac(list(MODELES_TETRIMINOS.values()))
-        self.__score = 0
-        self.__chronometre = 0
+
+class Jeu:
+    """
+    Représente l'état actuel du jeu.
+
+    Les règles sont appliquées par le moteur : le jeu se contente de traduire les
+    évènements pygame en actions et d'afficher l'état de la partie.
+    Les actions jouées sont enregistrées pour pouvoir rejouer chaque partie.
+
+    Avec un profileur, la durée de chaque phase des images est mesurée, et la touche
+    F3 affiche ou masque les mesures à l'écran. Sans profileur, seule une comparaison
+    à None par appel d'avancer et d'afficher est ajoutée.
+    """
+
+    def __init__(
+        self,
+        sauvegarde: Optional[Callable[[bytes], None]] = None,
+        profileur: Optional[Profileur] = None,
+        superposition=False,
+    ) -> None:
+        """
+        Args:
+            sauvegarde (Callable[[bytes], None], optional): La fonction appelée avec
+                l'enregistrement de chaque partie terminée
+            profileur (Profileur, optional): Le profileur qui mesure les images
+            superposition (bool, optional): True pour afficher les mesures du profileur
+
+        Raises:
+            TypeError: Le type de profileur est invalide
+        """
+        graine = randrange(1 << 32)
+        self.__moteur = Moteur(list(MODELES_TETRIMINOS.values()), graine=graine)
+        self.__enregistreur = Enregistreur(graine)
+        self.__sauvegarde = sauvegarde
         self.__pause = False
-        self.__perdu = False
-        self.__nouveau_tetr()
 
-    def __nouveau_tetr(self) -> None:
-        # On crée le prochain tetrimino
-        modele = self.__sac.depiler()
-        tetr = Tetrimino(modele, TETR_DEFAUT_X, TETR_DEFAUT_Y)
+        self.__superposition = superposition
+        self.__profil: Optional[Tuple[int, Surface]] = None
+        self.set_profileur(profileur)
 
-        # Si la position initiale du tetrimino est obstruée, le joueur a perdu
-        if self.__plateau.est_obstrue(tetr):
-            self.__perdu = True
-        else:
-            # On fait descendre le tetrimino d'une ligne si c'est possible,
-            # conformément au système de génération de Tetris
-            tetr_y = tetr.get_position()[1]
-            tetr.set_position(y=tetr_y + 1)
-            if self.__plateau.est_obstrue(tetr):
-                tetr.set_position(y=tetr_y)
+        # La surface du plateau est mise à jour par le plateau lui-même
+        self.__surface_plateau = SurfacePlateau(self.__moteur.get_plateau())
+
+        # Calques de l'image précédente, pour l'affichage partiel
+        self.__cles_precedentes: Optional[Set[tuple]] = None
+        self.__surface_affichee: Optional[Surface] = None
+
+    def est_en_pause(self) -> bool:
+        """Renvoie True si le jeu est en pause"""
+        return self.__pause
+
+    def get_profileur(self) -> Optional[Profileur]:
+        """Renvoie le profileur qui mesure les images, ou None s'il n'y en a pas"""
+        return self.__profileur
 
-            self.__tetr_actuel = tetr
+    def set_profileur(self, profileur: Optional[Profileur]) -> None:
+        """
+        Change le profileur qui mesure les images
 
-    def avancer(self, evenements: List[events.Event]) -> None:
+        Args:
+            profileur (Profileur, optional): Le profileur, ou None pour ne plus mesurer
+
+        Raises:
+            TypeError: Le type de profileur est invalide
+        """
         # Précondition
+        if profileur is not None:
+            verifier_type("profileur", profileur, Profileur)
+
+        self.__profileur = profileur
+        self.__profil = None
+
+        # Les fonctions d'affichage ne sont enveloppées qu'en présence d'un profileur
+        if profileur is None:
+            self.__afficher_tetrimino = afficher_tetrimino
+            self.__afficher_texte = afficher_texte
+        else:
+            self.__afficher_tetrimino = profileur.chronometrer(
+                AFFICHER_TETRIMINO, afficher_tetrimino
+            )
+            self.__afficher_texte = profileur.chronometrer(
+                AFFICHER_TEXTE, afficher_texte
+            )
+
+    def avancer(self, evenements: List[events.Event], ticks=1) -> None:
+        """
+        Applique les évènements reçus puis fait avancer le temps du jeu
+
+        Args:
+            evenements (List[events.Event]): Les évènements pygame reçus
+            ticks (int, optional): Le nombre de ticks de la logique du jeu à jouer,
+                donné par la cadence
+
+        Raises:
+            TypeError: Le type de evenements ou de ticks est invalide
+            ValueError: ticks est négatif
+        """
+        # Préconditions
         verifier_type("evenements", evenements, list)
+        verif_entier_pos("ticks", ticks)
+
+        profileur = self.__profileur
+        if profileur is not None:
+            debut = perf_counter()
 
         # Gestion des évènements
         for evenement in evenements:
             if evenement.type == KEYDOWN:
-                if self.__perdu:
+                if evenement.key == K_F3:
+                    # Les mesures ne peuvent être affichées sans être prises
+                    self.__superposition = not self.__superposition
+                    if self.__superposition and self.__profileur is None:
+                        self.set_profileur(Profileur())
+                elif self.__moteur.est_perdu():
                     # On réinitialise l'état du jeu
-                    self.__init__()  # pylint: disable=unnecessary-dunder-call
+                    # pylint: disable=unnecessary-dunder-call
+                    self.__init__(
+                        self.__sauvegarde, self.__profileur, self.__superposition
+                    )
                 else:
                     if evenement.key == K_ESCAPE:
                         self.__pause = not self.__pause
 
-                    if not self.__pause:
-                        if evenement.key == K_LEFT:
-                            self.__plateau.deplacer_gauche(self.__tetr_actuel)
-
-                        if evenement.key == K_RIGHT:
-                            self.__plateau.deplacer_droite(self.__tetr_actuel)
-
-                        if evenement.key == K_DOWN:
-                            self.__chronometre = IPS
+                    if not self.__pause and evenement.key in TOUCHES:
+                        action = TOUCHES[evenement.key]
+                        self.__enregistreur.ajouter(self.__moteur.get_ticks(), action)
+                        self.__moteur.jouer(action)
 
-                        if evenement.key == K_UP:
-                            self.__plateau.tourner_tetrimino(self.__tetr_actuel, True)
+        # On fait avancer le temps
+        for _ in range(ticks):
+            if self.__moteur.est_perdu() or self.__pause:
+                break
 
-                        if evenement.key == K_z:
-                            self.__plateau.tourner_tetrimino(self.__tetr_actuel, False)
+            resultat = self.__moteur.jouer(Action.TICK)
+            self.__enregistreur.suivre(self.__moteur)
+            if resultat.perdu and self.__sauvegarde is not None:
+                self.__sauvegarde(self.enregistrement())
 
-                        if evenement.key == K_SPACE:
-                            fantome = self.__plateau.fantome(self.__tetr_actuel)
-                            self.__tetr_actuel.set_position(y=fantome)
-                            self.__chronometre = IPS
+        if profileur is not None:
+            profileur.ajouter(AVANCER, perf_counter() - debut)
 
-        # On incrémente le chronomètre
-        if not (self.__perdu or self.__pause):
-            self.__chronometre += 1
+    def enregistrement(self) -> bytes:
+        """
+        Renvoie l'enregistrement de la partie en cours, qui peut être rejoué avec
+        enregistrement.rejouer
 
-        # Lorsque le délai est écoulé, on actualise le tetrimino
-        if self.__chronometre >= IPS:
-            self.__chronometre = 0
+        Returns:
+            bytes: Les données de l'enregistrement
+        """
+        return self.__enregistreur.terminer(self.__moteur)
 
-            tetr_y = self.__tetr_actuel.get_position()[1]
-            fantome = self.__plateau.fantome(self.__tetr_actuel)
+    def __calques(self, surface: Surface) -> Tuple[Rect, List[Calque]]:
+        """
+        Calcule la disposition de l'image à afficher sur une surface
 
-            if tetr_y == fantome:
-                # Le tetrimino touche le sol, on le verrouille
-                self.__plateau.verrouiller(self.__tetr_actuel)
-
-                # On verifie si des lignes sont completées
-                lignes_completees = self.__plateau.lignes_completes()
-                nombre_lignes = len(lignes_completees)
-                if nombre_lignes > 0:
-                    self.__score += SCORES[nombre_lignes]
-                    for indice in lignes_completees:
-                        self.__plateau.effacer_ligne(indice)
-
-                self.__nouveau_tetr()
-            else:
-                # Le tetrimino peut continuer, on le fait descendre
-                self.__tetr_actuel.set_position(y=tetr_y + 1)
-
-    def afficher(self, surface: Surface) -> None:
-        # Précondition
-        verifier_type("surface", surface, Surface)
+        Args:
+            surface (Surface): La surface sur laquelle le jeu est affiché
 
-        # On efface le contenu de la fenêtre
-        surface.fill(NOIR)
+        Returns:
+            Tuple[Rect, List[Calque]]: Le rectangle de la bordure de la grille, et les
+            surfaces à dessiner par dessus le fond, dans l'ordre, avec leur position
+        """
+        plateau = self.__moteur.get_plateau()
+        tetr_actuel = self.__moteur.get_tetrimino()
 
         # On récupère la taille et les coordonnées de la grille
-        lignes, colonnes = self.__plateau.forme()
+        lignes, colonnes = plateau.forme()
         largeur_grille = colonnes * TAILLE_CASE
         hauteur_grille = lignes * TAILLE_CASE
 
         grille_x = (surface.get_width() - largeur_grille) // 2
         grille_y = (surface.get_height() - hauteur_grille) // 2
 
-        # Affichage du plateau
+        # Bordure du plateau
         rect_bordure = Rect(
             grille_x - TAILLE_BORDURE,
             grille_y - TAILLE_BORDURE,
             largeur_grille + TAILLE_BORDURE * 2,
             hauteur_grille + TAILLE_BORDURE * 2,
         )
-        draw.rect(surface, BLANC, rect_bordure, TAILLE_BORDURE, TAILLE_BORDURE)
-        plateau = afficher_plateau(self.__plateau)
-        surface.blit(plateau, (grille_x, grille_y))
-
-        # Affichage du tetrimino en cours de chute
-        tetr_surf = afficher_tetrimino(self.__tetr_actuel)
-        tetr_x, tetr_y = self.__tetr_actuel.get_position()
-        surface.blit(
-            tetr_surf,
-            (grille_x + tetr_x * TAILLE_CASE, grille_y + tetr_y * TAILLE_CASE),
+
+        # Plateau
+        calques: List[Calque] = [
+            (self.__surface_plateau.get_surface(), (grille_x, grille_y))
+        ]
+
+        # Tetrimino en cours de chute
+        tetr_x, tetr_y = tetr_actuel.get_position()
+        calques.append(
+            (
+                self.__afficher_tetrimino(tetr_actuel),
+                (grille_x + tetr_x * TAILLE_CASE, grille_y + tetr_y * TAILLE_CASE),
+            )
         )
 
-        # Affichage du fantome du tetrimino
-        fantome_y = self.__plateau.fantome(self.__tetr_actuel)
-        fantome_surf = afficher_tetrimino(self.__tetr_actuel)
-        fantome_surf.set_alpha(100)
-        surface.blit(
-            fantome_surf,
-            (grille_x + tetr_x * TAILLE_CASE, grille_y + fantome_y * TAILLE_CASE),
+        # Fantome du tetrimino
+        fantome_y = plateau.fantome(tetr_actuel)
+        calques.append(
+            (
+                self.__afficher_tetrimino(tetr_actuel, 100),
+                (grille_x + tetr_x * TAILLE_CASE, grille_y + fantome_y * TAILLE_CASE),
+            )
         )
 
-        # On affiche le score
-        texte_score = afficher_texte(f"Score: {self.__score}", 24)
-        surface.blit(
-            texte_score,
+        # Score et niveau
+        texte_score = self.__afficher_texte(
+            f"Score: {self.__moteur.get_score()}  Niveau: {self.__moteur.get_niveau()}",
+            24,
+        )
+        calques.append(
             (
-                surface.get_rect().centerx - texte_score.get_rect().centerx,
-                grille_y + TAILLE_BORDURE,
-            ),
+                texte_score,
+                (
+                    surface.get_rect().centerx - texte_score.get_rect().centerx,
+                    grille_y + TAILLE_BORDURE,
+                ),
+            )
         )
 
-        # Affichage du texte pause
+        # Texte pause
         if self.__pause:
-            texte_pause = afficher_texte("PAUSE", 48, NOIR)
-            surface.blit(texte_pause, centrer(surface, texte_pause))
+            texte_pause = self.__afficher_texte("PAUSE", 48, NOIR)
+            calques.append((texte_pause, centrer(surface, texte_pause)))
 
-        # Affichage de l'écran de fin
-        if self.__perdu:
-            texte_perdu = afficher_texte("PERDU", 48, NOIR)
-            texte_recommencer = afficher_texte(
+        # Écran de fin
+        if self.__moteur.est_perdu():
+            texte_perdu = self.__afficher_texte("PERDU", 48, NOIR)
+            texte_recommencer = self.__afficher_texte(
                 "Appuyez sur n'importe quelle touche pour recommencer",
                 24,
                 NOIR,
@@ -214,33 +315,189 @@ class Jeu:
                 centrer(surface, texte_recommencer), rect_recommencer.size
             )
 
-            surface.blit(
-                texte_perdu,
-                centrer(surface, texte_perdu),
-            )
-            surface.blit(
-                texte_recommencer,
-                rect_recommencer.move(0, 32).topleft,
+            calques.append((texte_perdu, centrer(surface, texte_perdu)))
+            calques.append((texte_recommencer, rect_recommencer.move(0, 32).topleft))
+
+        # Mesures du profileur, redessinées périodiquement pour rester lisibles
+        if self.__superposition and self.__profileur is not None:
+            images = self.__profileur.get_images()
+            if self.__profil is None or images - self.__profil[0] >= PERIODE_PROFIL:
+                self.__profil = (images, afficher_profil(self.__profileur))
+            calques.append((self.__profil[1], (TAILLE_BORDURE, TAILLE_BORDURE)))
+
+        return rect_bordure, calques
+
+    @staticmethod
+    def __dessiner(surface: Surface, rect_bordure: Rect, calques: List[Calque]) -> None:
+        """Dessine l'image, en se limitant à la zone de découpe de la surface"""
+        surface.fill(NOIR)
+        draw.rect(surface, BLANC, rect_bordure, TAILLE_BORDURE, TAILLE_BORDURE)
+        surface.blits(calques, False)
+
+    def afficher(self, surface: Surface, partiel=False) -> List[Rect]:
+        """
+        Affiche le jeu sur une surface et renvoie les zones modifiées, à transmettre
+        à display.update.
+
+        En mode partiel, seules les zones qui ont changé depuis l'image précédente
+        (position du tetrimino et de son fantome, lignes du plateau, score, textes)
+        sont redessinées. La surface ne doit alors pas être modifiée entre deux appels.
+
+        Args:
+            surface (Surface): La surface sur laquelle afficher le jeu
+            partiel (bool, optional): True pour ne redessiner que les zones modifiées
+
+        Raises:
+            TypeError: Le type de surface est invalide
+
+        Returns:
+            List[Rect]: Les zones de la surface modifiées
+        """
+        # Précondition
+        verifier_type("surface", surface, Surface)
+
+        profileur = self.__profileur
+        if profileur is None:
+            return self.__afficher(surface, partiel)
+
+        debut = perf_counter()
+        zones = self.__afficher(surface, partiel, profileur)
+        profileur.ajouter(AFFICHER, perf_counter() - debut)
+        profileur.terminer_image()
+        return zones
+
+    def __afficher(
+        self, surface: Surface, partiel: bool, profileur: Optional[Profileur] = None
+    ) -> List[Rect]:
+        """Affiche le jeu sur une surface, en mesurant le dessin avec le profileur"""
+        rect_bordure, calques = self.__calques(surface)
+        modifications_plateau = self.__surface_plateau.vider_modifications()
+
+        # Chaque calque est identifié par sa surface (partagée par les caches tant que
+        # son contenu ne change pas) et par le rectangle qu'il occupe
+        cles = {
+            (calque, *calque.get_rect(topleft=position)) for calque, position in calques
+        }
+        precedentes = self.__cles_precedentes
+        self.__cles_precedentes = cles
+
+        if profileur is not None:
+            debut = perf_counter()
+
+        if not partiel or precedentes is None or surface is not self.__surface_affichee:
+            self.__surface_affichee = surface
+            self.__dessiner(surface, rect_bordure, calques)
+            zones = [surface.get_rect()]
+        else:
+            zones = self.__dessiner_zones(
+                surface,
+                rect_bordure,
+                calques,
+                cles ^ precedentes,
+                modifications_plateau,
             )
 
+        if profileur is not None:
+            profileur.ajouter(DESSINER, perf_counter() - debut)
+
+        return zones
+
+    def __dessiner_zones(
+        self,
+        surface: Surface,
+        rect_bordure: Rect,
+        calques: List[Calque],
+        cles_modifiees: Set[tuple],
+        modifications_plateau: Optional[Rect],
+    ) -> List[Rect]:
+        """Redessine les zones de l'image qui ont changé depuis l'image précédente"""
+
+        # Les calques apparus ou disparus doivent être redessinés à leur ancienne
+        # et à leur nouvelle position, ainsi que les lignes modifiées du plateau
+        zones = [Rect(cle[1:]) for cle in cles_modifiees]
+        if modifications_plateau is not None:
+            zones.append(modifications_plateau.move(calques[0][1]))
+
+        zones = fusionner(zones)
+        for zone in zones:
+            surface.set_clip(zone)
+            self.__dessiner(surface, rect_bordure, calques)
+        surface.set_clip(None)
+
+        return zones
+
+
+def fusionner(zones: List[Rect]) -> List[Rect]:
+    """
+    Fusionne les rectangles qui se chevauchent, pour ne pas redessiner deux fois
+    la même zone
+
+    Args:
+        zones (List[Rect]): Les rectangles à fusionner
+
+    Returns:
+        List[Rect]: Des rectangles disjoints couvrant toutes les zones
+    """
+    resultat: List[Rect] = []
+    for zone in zones:
+        zone = Rect(zone)
+        indice = zone.collidelist(resultat)
+        while indice != -1:
+            zone.union_ip(resultat.pop(indice))
+            indice = zone.collidelist(resultat)
+        resultat.append(zone)
+
+    return resultat
+
 
 if __name__ == "__main__":
+    analyseur = ArgumentParser(description="Tetris")
+    analyseur.add_argument(
+        "--archive",
+        metavar="FICHIER",
+        help="ajoute chaque partie terminée à cette archive",
+    )
+    analyseur.add_argument(
+        "--profil",
+        action="store_true",
+        help="mesure les images dès le lancement et écrit les mesures à la fermeture",
+    )
+    arguments = analyseur.parse_args()
+
     # Initialisation
     pygame_init()
     fenetre = display.set_mode(TAILLE_FENETRE)
     horloge = Clock()
-    jeu = Jeu()
+    cadence = Cadence(FREQUENCE_LOGIQUE)
+
+    # Les parties ne sont archivées que si un fichier est donné
+    archive = Archive(arguments.archive) if arguments.archive else None
+
+    # Sans --profil, la touche F3 active les mesures
+    jeu = Jeu(
+        archive.ajouter if archive is not None else None,
+        Profileur() if arguments.profil else None,
+    )
 
     # Boucle du jeu
     while True:
         _evenements = events.get()
         for _evenement in _evenements:
             if _evenement.type == QUIT:
+                _profileur = jeu.get_profileur()
+                if _profileur is not None:
+                    for _phase, _centiles in _profileur.resume().items():
+                        print(_phase, *(f"{c * 1000:.2f} ms" for c in _centiles))
+                    print("dépassements", _profileur.depassements(True))
+                if archive is not None:
+                    archive.fermer()
                 pygame_quit()
                 sys.exit(0)
 
-        jeu.avancer(_evenements)
-        jeu.afficher(fenetre)
+        # Le temps passé en pause n'est pas rattrapé à la reprise
+        if jeu.est_en_pause():
+            cadence.reinitialiser()
 
-        display.update()
+        jeu.avancer(_evenements, cadence.ticks())
+        display.update(jeu.afficher(fenetre, RENDU_PARTIEL))
         horloge.tick(IPS)
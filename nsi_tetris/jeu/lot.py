@@ -0,0 +1,230 @@
+"""
+Module du plateau par lot, qui représente plusieurs plateaux dans un seul tableau numpy
+afin de les faire évoluer tous ensemble sans boucle Python par plateau
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .erreurs import verif_entier_pos, verifier_type
+from .regles import GRILLE_LIGNES, GRILLE_COLONNES
+from .tetrimino import Forme
+
+# Taille du carré dans lequel sont placées les formes de tetriminos
+TAILLE_FORME = 4
+
+
+def tableau_forme(forme: Forme) -> np.ndarray:
+    """
+    Convertit une forme de tetrimino en tableau booléen de 4 cases sur 4,
+    en complétant les formes plus petites par des cases vides
+
+    Args:
+        forme (Forme): La forme à convertir
+
+    Raises:
+        ValueError: La forme est plus grande que 4 cases sur 4
+
+    Returns:
+        np.ndarray: Le tableau correspondant à la forme
+    """
+    tableau = np.asarray(forme, dtype=bool)
+    if tableau.ndim != 2 or max(tableau.shape) > TAILLE_FORME:
+        raise ValueError(
+            f"La forme doit tenir dans un carré de {TAILLE_FORME} cases de côté"
+        )
+
+    resultat = np.zeros((TAILLE_FORME, TAILLE_FORME), dtype=bool)
+    resultat[: tableau.shape[0], : tableau.shape[1]] = tableau
+    return resultat
+
+
+def tableau_formes(formes: Sequence[Forme]) -> np.ndarray:
+    """
+    Convertit une liste de formes en tableau booléen de forme (nombre, 4, 4)
+
+    Args:
+        formes (Sequence[Forme]): Les formes à convertir
+
+    Returns:
+        np.ndarray: Le tableau correspondant aux formes
+    """
+    return np.stack([tableau_forme(forme) for forme in formes])
+
+
+class PlateauxLot:
+    """
+    Représente un lot de plateaux de même taille.
+
+    Les grilles sont stockées dans un tableau de forme (plateaux, lignes + 10, colonnes)
+    où 0 représente une case vide et toute autre valeur une case occupée (par exemple
+    l'indice du modèle du tetrimino plus un, pour pouvoir retrouver sa couleur).
+    Les tetriminos sont décrits par des tableaux de forme (plateaux, 4, 4) et leurs
+    positions par des tableaux d'entiers de taille égale au nombre de plateaux.
+    """
+
+    def __init__(
+        self,
+        plateaux: int,
+        lignes=GRILLE_LIGNES,
+        colonnes=GRILLE_COLONNES,
+    ) -> None:
+        verif_entier_pos("plateaux", plateaux)
+        verif_entier_pos("lignes", lignes)
+        verif_entier_pos("colonnes", colonnes)
+
+        self.__plateaux = plateaux
+        self.__lignes = lignes + 10
+        self.__colonnes = colonnes
+        self.__grilles = np.zeros((plateaux, self.__lignes, colonnes), dtype=np.uint8)
+
+        # Tableaux réutilisés par toutes les opérations
+        self.__indices = np.arange(plateaux)
+        self.__decalages = np.arange(TAILLE_FORME)
+
+    def forme(self) -> Tuple[int, int, int]:
+        """
+        Renvoie la forme du lot au format (plateaux, lignes, colonnes).
+        Le nombre de lignes inclut les 10 lignes supplémentaires en haut de chaque grille.
+
+        Returns:
+            Tuple[int, int, int]: La forme du lot
+        """
+        return self.__plateaux, self.__lignes, self.__colonnes
+
+    def grilles(self) -> np.ndarray:
+        """
+        Renvoie les grilles du lot.
+
+        Returns:
+            np.ndarray: Une vue en lecture seule des grilles
+        """
+        vue = self.__grilles.view()
+        vue.flags.writeable = False
+        return vue
+
+    def __cases(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Renvoie les coordonnées des cases couvertes par le carré 4x4 de chaque tetrimino,
+        ramenées dans la grille, ainsi qu'un masque des cases réellement dans la grille.
+
+        Args:
+            x (np.ndarray): Les coordonnées en x des tetriminos
+            y (np.ndarray): Les coordonnées en y des tetriminos
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Les lignes (plateaux, 4, 1),
+            les colonnes (plateaux, 1, 4) et le masque (plateaux, 4, 4)
+        """
+        lignes = np.asarray(y)[:, None] + self.__decalages
+        colonnes = np.asarray(x)[:, None] + self.__decalages
+
+        dedans = ((lignes >= 0) & (lignes < self.__lignes))[:, :, None] & (
+            (colonnes >= 0) & (colonnes < self.__colonnes)
+        )[:, None, :]
+
+        lignes = np.clip(lignes, 0, self.__lignes - 1)[:, :, None]
+        colonnes = np.clip(colonnes, 0, self.__colonnes - 1)[:, None, :]
+        return lignes, colonnes, dedans
+
+    def est_obstrue(
+        self, formes: np.ndarray, x: np.ndarray, y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Indique pour chaque plateau si son tetrimino est hors de la grille
+        ou dans une position obstruée.
+
+        Args:
+            formes (np.ndarray): Les formes des tetriminos, de forme (plateaux, 4, 4)
+            x (np.ndarray): Les coordonnées en x des tetriminos
+            y (np.ndarray): Les coordonnées en y des tetriminos
+
+        Returns:
+            np.ndarray: Un tableau booléen valant True pour les positions obstruées
+        """
+        lignes, colonnes, dedans = self.__cases(x, y)
+        occupees = self.__grilles[self.__indices[:, None, None], lignes, colonnes] != 0
+        return (np.asarray(formes, dtype=bool) & (occupees | ~dedans)).any(axis=(1, 2))
+
+    def verrouiller(
+        self,
+        formes: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        valeurs: np.ndarray,
+        actifs: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Ajoute les tetriminos au contenu des grilles. Les cases situées hors
+        de la grille sont ignorées.
+
+        Args:
+            formes (np.ndarray): Les formes des tetriminos, de forme (plateaux, 4, 4)
+            x (np.ndarray): Les coordonnées en x des tetriminos
+            y (np.ndarray): Les coordonnées en y des tetriminos
+            valeurs (np.ndarray): La valeur (non nulle) écrite dans les cases
+                de chaque tetrimino
+            actifs (np.ndarray, optional): Un masque des plateaux concernés, tous par défaut
+        """
+        lignes, colonnes, dedans = self.__cases(x, y)
+        cases = np.asarray(formes, dtype=bool) & dedans
+        if actifs is not None:
+            cases &= np.asarray(actifs, dtype=bool)[:, None, None]
+
+        plateau, ligne, colonne = np.nonzero(cases)
+        self.__grilles[
+            plateau,
+            lignes[plateau, ligne, 0],
+            colonnes[plateau, 0, colonne],
+        ] = np.asarray(valeurs, dtype=np.uint8)[plateau]
+
+    def lignes_completes(self) -> np.ndarray:
+        """
+        Renvoie un tableau booléen de forme (plateaux, lignes) indiquant les lignes pleines.
+
+        Returns:
+            np.ndarray: Les lignes pleines de chaque plateau
+        """
+        return (self.__grilles != 0).all(axis=2)
+
+    def effacer_lignes(self) -> np.ndarray:
+        """
+        Efface les lignes pleines de tous les plateaux et fait descendre les lignes situées
+        au dessus, en une seule opération pour tout le lot.
+
+        Returns:
+            np.ndarray: Le nombre de lignes effacées sur chaque plateau
+        """
+        pleines = self.lignes_completes()
+        nombres = pleines.sum(axis=1)
+        touches = np.flatnonzero(nombres)
+        if touches.size == 0:
+            return nombres
+
+        # Un tri stable place les lignes pleines en haut de la grille en conservant
+        # l'ordre des autres lignes, il suffit ensuite de vider les lignes du haut.
+        # Les grilles sont modifiées sur place pour que les vues renvoyées par grilles
+        # restent valides.
+        ordre = np.argsort(~pleines[touches], axis=1, kind="stable")
+        self.__grilles[touches] = np.take_along_axis(
+            self.__grilles[touches], ordre[:, :, None], axis=1
+        )
+        self.__grilles[np.arange(self.__lignes) < nombres[:, None]] = 0
+
+        return nombres
+
+    def reinitialiser(self, actifs: Optional[np.ndarray] = None) -> None:
+        """
+        Vide les grilles de certains plateaux, par exemple à la fin de leur partie.
+
+        Args:
+            actifs (np.ndarray, optional): Un masque des plateaux à vider, tous par défaut
+        """
+        if actifs is None:
+            self.__grilles[:] = 0
+        else:
+            verifier_type("actifs", actifs, np.ndarray)
+            self.__grilles[actifs] = 0
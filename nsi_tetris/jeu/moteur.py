@@ -0,0 +1,429 @@
+"""Module du moteur de jeu, qui applique les règles sans dépendre de l'affichage"""
+
+from typing import List, NamedTuple, Optional
+from enum import Enum
+from random import Random
+
+from .erreurs import erreur_type, verif_entier_pos, verifier_type
+from .plateau import Grille, Plateau
+from .sac import Sac
+from .tetrimino import Modele, Rotation, Tetrimino
+from .regles import (
+    COULEUR_DECHETS,
+    GRAVITES,
+    GRILLE_COLONNES,
+    GRILLE_LIGNES,
+    LIGNES_PAR_NIVEAU,
+    MODELES_NOMMES,
+    PRECISION_GRAVITE,
+    SCORES,
+    TETR_DEFAUT_X,
+    TETR_DEFAUT_Y,
+)
+
+
+class Action(Enum):
+    """
+    Représente une action appliquée au moteur
+
+    - Gauche et Droite déplacent le tetrimino d'une case
+    - Tourner_horaire et Tourner_antihoraire tournent le tetrimino
+    - Descendre fait descendre le tetrimino au prochain tick
+    - Chute fait tomber le tetrimino tout en bas, il est verrouillé au prochain tick
+    - Tick fait avancer le temps d'une unité
+    """
+
+    GAUCHE = 0
+    DROITE = 1
+    TOURNER_HORAIRE = 2
+    TOURNER_ANTIHORAIRE = 3
+    DESCENDRE = 4
+    CHUTE = 5
+    TICK = 6
+
+
+class Resultat(NamedTuple):
+    """Représente le résultat d'une action"""
+
+    lignes: int
+    """Le nombre de lignes effacées"""
+    score: int
+    """Les points gagnés"""
+    perdu: bool
+    """True si la partie est terminée"""
+
+
+class EtatMoteur(NamedTuple):
+    """
+    Représente l'état complet d'une partie à un instant donné, qui permet de la
+    reprendre sans rejouer les ticks précédents
+    """
+
+    ticks: int
+    """Le nombre de ticks écoulés"""
+    fractions: int
+    """Les fractions de case de gravité accumulées"""
+    score: int
+    """Le score"""
+    lignes: int
+    """Le nombre de lignes effacées"""
+    pieces: int
+    """Le nombre de tetriminos apparus, et donc piochés dans le sac"""
+    perdu: bool
+    """True si la partie est terminée"""
+    grille: Grille
+    """Le contenu de la grille"""
+    modele: int
+    """L'indice du modèle du tetrimino en cours de chute"""
+    x: int
+    """La coordonnée en x du tetrimino"""
+    y: int
+    """La coordonnée en y du tetrimino"""
+    rotation: Rotation
+    """L'état de rotation du tetrimino"""
+
+
+# Les résultats sans effet sont partagés pour éviter de créer un objet à chaque action
+_RESULTAT_NUL = Resultat(0, 0, False)
+_RESULTAT_PERDU = Resultat(0, 0, True)
+
+
+class Moteur:
+    """
+    Représente l'état d'une partie et applique les règles du jeu.
+
+    Le moteur n'utilise pas pygame : il reçoit des actions abstraites et renvoie
+    leur résultat, ce qui permet de simuler des parties sans affichage.
+
+    La gravité est accumulée en fractions de case à chaque tick, et le tetrimino descend
+    d'autant de cases entières qu'il en a accumulé, sans dépasser la position de son
+    fantome : une gravité de plusieurs cases par tick ne coûte donc pas plus cher.
+    """
+
+    def __init__(
+        self,
+        modeles: Optional[List[Modele]] = None,
+        lignes=GRILLE_LIGNES,
+        colonnes=GRILLE_COLONNES,
+        delai: Optional[int] = None,
+        graine: Optional[int] = None,
+        niveau=1,
+    ) -> None:
+        """
+        Args:
+            modeles (List[Modele], optional): Les modèles de tetriminos, par défaut
+                les modèles nommés des règles
+            lignes (int, optional): Le nombre de lignes visibles de la grille
+            colonnes (int, optional): Le nombre de colonnes de la grille
+            delai (int, optional): Le nombre de ticks entre deux descentes du tetrimino.
+                Par défaut, la gravité dépend du niveau.
+            graine (int, optional): La graine du générateur aléatoire du sac, qui permet
+                de rejouer exactement la même suite de tetriminos. Elle est nécessaire
+                pour utiliser la méthode restaurer.
+            niveau (int, optional): Le niveau de départ, qui augmente ensuite toutes
+                les LIGNES_PAR_NIVEAU lignes effacées
+
+        Raises:
+            TypeError: Le type de delai ou de niveau est invalide
+            ValueError: delai est négatif, ou niveau est inférieur à 1
+        """
+        # Préconditions
+        if modeles is None:
+            modeles = list(MODELES_NOMMES.values())
+
+        if delai is not None:
+            verif_entier_pos("delai", delai)
+
+        verif_entier_pos("niveau", niveau)
+        if niveau < 1:
+            raise ValueError("Le niveau doit être supérieur ou égal à 1")
+
+        self.__plateau = Plateau(lignes, colonnes)
+        self.__modeles = modeles
+        self.__sac = Sac(modeles, Random(graine))
+        self.__graine = graine
+
+        # Avec un délai fixe, une case vaut delai fractions et chaque tick en ajoute une.
+        # Sinon, la gravité en fractions de case par tick est donnée par le niveau.
+        self.__delai = delai
+        self.__niveau_depart = niveau
+        self.__niveau = niveau
+        if delai is None:
+            self.__unite = PRECISION_GRAVITE
+            self.__gravite = GRAVITES[min(niveau, len(GRAVITES)) - 1]
+        else:
+            self.__unite = max(1, delai)
+            self.__gravite = 1
+        self.__fractions = 0
+        self.__score = 0
+        self.__lignes = 0
+        self.__pieces = 0
+        self.__ticks = 0
+        self.__perdu = False
+        self.__nouveau_tetr()
+
+    def __nouveau_tetr(self) -> None:
+        # On crée le prochain tetrimino
+        modele = self.__sac.depiler()
+        tetr = Tetrimino(modele, TETR_DEFAUT_X, TETR_DEFAUT_Y)
+        self.__pieces += 1
+
+        # Si la position initiale du tetrimino est obstruée, le joueur a perdu
+        if self.__plateau.est_obstrue(tetr):
+            self.__perdu = True
+        else:
+            # On fait descendre le tetrimino d'une ligne si c'est possible,
+            # conformément au système de génération de Tetris
+            tetr_y = tetr.get_position()[1]
+            tetr.set_position(y=tetr_y + 1)
+            if self.__plateau.est_obstrue(tetr):
+                tetr.set_position(y=tetr_y)
+
+            self.__tetr_actuel = tetr
+            self.__modele_actuel = modele
+
+    def get_plateau(self) -> Plateau:
+        """Renvoie le plateau de la partie"""
+        return self.__plateau
+
+    def get_graine(self) -> Optional[int]:
+        """Renvoie la graine du générateur aléatoire du sac"""
+        return self.__graine
+
+    def get_modeles(self) -> List[Modele]:
+        """Renvoie les modèles de tetriminos de la partie"""
+        return self.__modeles
+
+    def get_sac(self) -> Sac:
+        """Renvoie le sac dans lequel sont piochés les tetriminos"""
+        return self.__sac
+
+    def get_tetrimino(self) -> Tetrimino:
+        """Renvoie le tetrimino en cours de chute"""
+        return self.__tetr_actuel
+
+    def get_modele(self) -> Modele:
+        """Renvoie le modèle du tetrimino en cours de chute"""
+        return self.__modele_actuel
+
+    def get_score(self) -> int:
+        """Renvoie le score actuel"""
+        return self.__score
+
+    def get_lignes(self) -> int:
+        """Renvoie le nombre total de lignes effacées"""
+        return self.__lignes
+
+    def get_niveau(self) -> int:
+        """Renvoie le niveau actuel"""
+        return self.__niveau
+
+    def get_gravite(self) -> float:
+        """Renvoie la gravité actuelle, en cases par tick"""
+        return self.__gravite / self.__unite
+
+    def get_pieces(self) -> int:
+        """Renvoie le nombre de tetriminos apparus depuis le début de la partie"""
+        return self.__pieces
+
+    def get_ticks(self) -> int:
+        """Renvoie le nombre de ticks écoulés depuis le début de la partie"""
+        return self.__ticks
+
+    def est_perdu(self) -> bool:
+        """Renvoie True si la partie est terminée"""
+        return self.__perdu
+
+    def etat(self) -> EtatMoteur:
+        """
+        Renvoie l'état complet de la partie
+
+        Returns:
+            EtatMoteur: L'état de la partie
+        """
+        tetr = self.__tetr_actuel
+        tetr_x, tetr_y = tetr.get_position()
+        return EtatMoteur(
+            self.__ticks,
+            self.__fractions,
+            self.__score,
+            self.__lignes,
+            self.__pieces,
+            self.__perdu,
+            self.__plateau.grille(),
+            self.__modeles.index(self.__modele_actuel),
+            tetr_x,
+            tetr_y,
+            tetr.get_rotation(),
+        )
+
+    def restaurer(self, etat: EtatMoteur) -> None:
+        """
+        Remplace l'état de la partie par un état renvoyé par la méthode etat d'un moteur
+        créé avec les mêmes paramètres. Le sac est recréé à partir de la graine, puis
+        on y pioche autant de modèles que de tetriminos apparus : le moteur doit donc
+        avoir été créé avec une graine.
+
+        Args:
+            etat (EtatMoteur): L'état à restaurer
+
+        Raises:
+            TypeError: Le type de etat est invalide
+            ValueError: Le moteur n'a pas de graine, ou l'état ne correspond pas
+                aux paramètres du moteur
+        """
+        # Préconditions
+        verifier_type("etat", etat, EtatMoteur)
+        if self.__graine is None:
+            raise ValueError(
+                "Seul un moteur créé avec une graine peut être restauré, "
+                "sinon la suite des tetriminos serait différente"
+            )
+
+        self.__plateau.restaurer(etat.grille)
+
+        self.__sac = Sac(self.__modeles, Random(self.__graine))
+        self.__sac.tirer(etat.pieces)
+
+        tetr = Tetrimino(self.__modeles[etat.modele], etat.x, etat.y)
+        tetr.set_rotation(etat.rotation)
+        self.__tetr_actuel = tetr
+        self.__modele_actuel = self.__modeles[etat.modele]
+
+        self.__ticks = etat.ticks
+        self.__fractions = etat.fractions
+        self.__score = etat.score
+        self.__lignes = etat.lignes
+        self.__pieces = etat.pieces
+        self.__perdu = etat.perdu
+        self.__changer_niveau()
+
+    def jouer(self, action: Action) -> Resultat:
+        """
+        Applique une action à la partie
+
+        Args:
+            action (Action): L'action à appliquer
+
+        Raises:
+            TypeError: Le type de action est invalide
+
+        Returns:
+            Resultat: Le résultat de l'action
+        """
+        # Précondition
+        if __debug__ and not isinstance(action, Action):
+            raise erreur_type("action", action, Action)
+
+        if self.__perdu:
+            return _RESULTAT_PERDU
+
+        if action is Action.TICK:
+            return self.__tick()
+
+        plateau = self.__plateau
+        tetr = self.__tetr_actuel
+        if action is Action.GAUCHE:
+            plateau.deplacer_gauche(tetr)
+        elif action is Action.DROITE:
+            plateau.deplacer_droite(tetr)
+        elif action is Action.TOURNER_HORAIRE:
+            plateau.tourner_tetrimino(tetr, True)
+        elif action is Action.TOURNER_ANTIHORAIRE:
+            plateau.tourner_tetrimino(tetr, False)
+        elif action is Action.DESCENDRE:
+            self.__accelerer()
+        elif action is Action.CHUTE:
+            tetr.set_position(y=plateau.fantome(tetr))
+            self.__accelerer()
+
+        return _RESULTAT_NUL
+
+    def recevoir_lignes(self, nombre: int, trou: int) -> bool:
+        """
+        Ajoute des lignes en bas de la grille, envoyées par l'adversaire en multijoueur.
+        Le tetrimino en cours de chute remonte s'il est recouvert, et la partie est
+        perdue si des cases sortent de la grille ou si le tetrimino ne peut pas remonter.
+        Ces lignes ne sont pas des actions : une partie qui en reçoit ne peut donc pas
+        être enregistrée.
+
+        Args:
+            nombre (int): Le nombre de lignes à ajouter
+            trou (int): L'indice de la colonne laissée vide dans les lignes ajoutées
+
+        Raises:
+            TypeError: Le type de nombre ou de trou est invalide
+            ValueError: nombre ou trou ne correspond pas à la grille
+
+        Returns:
+            bool: True si la partie est perdue
+        """
+        if self.__perdu or nombre == 0:
+            return self.__perdu
+
+        plateau = self.__plateau
+        if plateau.ajouter_lignes(nombre, trou, COULEUR_DECHETS):
+            self.__perdu = True
+            return True
+
+        tetr = self.__tetr_actuel
+        tetr_y = tetr.get_position()[1]
+        for montee in range(nombre + 1):
+            if tetr_y - montee < 0:
+                break
+
+            tetr.set_position(y=tetr_y - montee)
+            if not plateau.est_obstrue(tetr):
+                return False
+
+        tetr.set_position(y=tetr_y)
+        self.__perdu = True
+        return True
+
+    def __accelerer(self) -> None:
+        """Garantit que le tetrimino descende ou soit verrouillé au prochain tick"""
+        self.__fractions = max(self.__fractions, self.__unite - self.__gravite)
+
+    def __changer_niveau(self) -> None:
+        """Met à jour le niveau et la gravité en fonction du nombre de lignes effacées"""
+        niveau = self.__niveau_depart + self.__lignes // LIGNES_PAR_NIVEAU
+        if niveau != self.__niveau:
+            self.__niveau = niveau
+            if self.__delai is None:
+                self.__gravite = GRAVITES[min(niveau, len(GRAVITES)) - 1]
+
+    def __tick(self) -> Resultat:
+        """Fait avancer le temps d'une unité et fait descendre le tetrimino si nécessaire"""
+        self.__ticks += 1
+
+        # On accumule la gravité, et tant qu'elle ne fait pas une case, il ne se passe rien
+        cases, self.__fractions = divmod(
+            self.__fractions + self.__gravite, self.__unite
+        )
+        if cases == 0:
+            return _RESULTAT_NUL
+
+        plateau = self.__plateau
+        tetr = self.__tetr_actuel
+        tetr_y = tetr.get_position()[1]
+        fantome_y = plateau.fantome(tetr)
+        if tetr_y != fantome_y:
+            # Le tetrimino peut continuer, on le fait descendre sans dépasser le sol
+            tetr.set_position(y=min(fantome_y, tetr_y + cases))
+            return _RESULTAT_NUL
+
+        # Le tetrimino touche le sol, on le verrouille
+        self.__fractions = 0
+        plateau.verrouiller(tetr)
+
+        # On efface les lignes completées
+        nombre_lignes = plateau.effacer_lignes()
+        points = 0
+        if nombre_lignes > 0:
+            points = SCORES[nombre_lignes]
+            self.__score += points
+            self.__lignes += nombre_lignes
+            self.__changer_niveau()
+
+        self.__nouveau_tetr()
+        return Resultat(nombre_lignes, points, self.__perdu)
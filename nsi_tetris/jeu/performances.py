@@ -0,0 +1,382 @@
+"""
+Module des mesures de performances du moteur et de l'affichage.
+
+Chaque mesure répète une opération sur un état construit avec des graines fixes, et
+conserve la durée de la meilleure répétition, moins sensible aux autres programmes.
+Les résultats sont écrits au format JSON et comparés à un fichier de référence : une
+opération plus lente que la référence au delà de la tolérance est une régression, et
+le programme se termine alors avec le code 1.
+
+    python -m nsi_tetris.jeu.performances --sortie resultats.json
+    python -m nsi_tetris.jeu.performances --enregistrer
+"""
+
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from argparse import ArgumentParser
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from pygame.font import init as font_init
+from pygame.surface import Surface
+
+from .constantes import TAILLE_FENETRE
+from .erreurs import verif_entier_pos
+from .ia import Autojoueur
+from .jeu import Jeu
+from .moteur import Action, Moteur
+from .plateau import Plateau
+from .regles import MODELES_NOMMES
+from .sac import Sac
+from .simulation import jouer_partie, politique_chute
+from .tetrimino import Tetrimino
+
+# Fichier de référence, à mettre à jour avec --enregistrer sur la machine de mesure
+REFERENCE = Path(__file__).with_name("performances.json")
+
+# Une opération est une régression si elle est plus lente que la référence de 25 %
+TOLERANCE = 0.25
+
+# Une préparation construit l'état d'une mesure et renvoie l'opération à répéter,
+# avec son nombre d'itérations par répétition
+Preparation = Callable[[], Tuple[Callable[[], object], int]]
+
+
+class Mesure(NamedTuple):
+    """Représente le résultat d'une mesure"""
+
+    nom: str
+    """Le nom de l'opération mesurée"""
+    iterations: int
+    """Le nombre d'itérations de chaque répétition"""
+    duree: float
+    """La durée d'une itération en secondes, lors de la meilleure répétition"""
+
+
+def mesurer(
+    nom: str, operation: Callable[[], object], iterations: int, repetitions=5
+) -> Mesure:
+    """
+    Mesure la durée d'une opération
+
+    Args:
+        nom (str): Le nom de l'opération
+        operation (Callable[[], object]): L'opération à répéter
+        iterations (int): Le nombre d'itérations de chaque répétition
+        repetitions (int, optional): Le nombre de répétitions
+
+    Raises:
+        TypeError: Le type de iterations ou de repetitions est invalide
+        ValueError: iterations ou repetitions est inférieur à 1
+
+    Returns:
+        Mesure: La durée d'une itération lors de la meilleure répétition
+    """
+    # Préconditions
+    verif_entier_pos("iterations", iterations)
+    verif_entier_pos("repetitions", repetitions)
+    if iterations < 1 or repetitions < 1:
+        raise ValueError("iterations et repetitions doivent être supérieurs à 0")
+
+    durees = timeit.repeat(operation, number=iterations, repeat=repetitions)
+    return Mesure(nom, iterations, min(durees) / iterations)
+
+
+def milieu_partie(graine=0, pieces=40) -> Moteur:
+    """
+    Renvoie le moteur d'une partie jouée par l'autojoueur, sans limite de temps
+    de réflexion pour que la partie ne dépende que de la graine
+
+    Args:
+        graine (int, optional): La graine de la partie
+        pieces (int, optional): Le nombre de tetriminos à poser
+
+    Returns:
+        Moteur: Le moteur de la partie
+    """
+    moteur = Moteur(graine=graine)
+    joueur = Autojoueur(budget=float("inf"))
+    while moteur.get_pieces() < pieces and not moteur.est_perdu():
+        action = joueur(moteur)
+        if action is not Action.TICK:
+            moteur.jouer(action)
+        moteur.jouer(Action.TICK)
+
+    return moteur
+
+
+def _est_obstrue():
+    moteur = milieu_partie()
+    plateau, tetrimino = moteur.get_plateau(), moteur.get_tetrimino()
+    return lambda: plateau.est_obstrue(tetrimino), 200_000
+
+
+def _fantome():
+    moteur = milieu_partie()
+    plateau, tetrimino = moteur.get_plateau(), moteur.get_tetrimino()
+    return lambda: plateau.fantome(tetrimino), 100_000
+
+
+def _plateau_quatre_lignes() -> Tuple[Plateau, Tetrimino]:
+    """Renvoie un plateau et un I qui, une fois verrouillé, complète quatre lignes"""
+    plateau = Plateau()
+    lignes, colonnes = plateau.forme()
+    couleur = MODELES_NOMMES["O"][1]
+    grille = [[None] * colonnes for _ in range(lignes)]
+    for ligne in grille[-4:]:
+        ligne[:-1] = [couleur] * (colonnes - 1)
+    plateau.restaurer(grille)
+
+    tetrimino = Tetrimino(MODELES_NOMMES["I"])
+    for placement in plateau.placements(tetrimino):
+        tetrimino.set_rotation(placement.rotation)
+        tetrimino.set_position(placement.x, placement.y)
+        sauvegarde = plateau.sauvegarder()
+        plateau.verrouiller(tetrimino)
+        complet = len(plateau.lignes_completes()) == 4
+        plateau.annuler(sauvegarde)
+        if complet:
+            return plateau, tetrimino
+
+    raise RuntimeError("Aucun placement du I ne complète quatre lignes")
+
+
+def _effacer_ligne():
+    plateau, tetrimino = _plateau_quatre_lignes()
+    sauvegarde = plateau.sauvegarder()
+
+    def operation():
+        plateau.annuler(sauvegarde)
+        plateau.verrouiller(tetrimino)
+        for indice in plateau.lignes_completes():
+            plateau.effacer_ligne(indice)
+
+    return operation, 20_000
+
+
+def _effacer_lignes():
+    plateau, tetrimino = _plateau_quatre_lignes()
+    sauvegarde = plateau.sauvegarder()
+
+    def operation():
+        plateau.annuler(sauvegarde)
+        plateau.verrouiller(tetrimino)
+        plateau.effacer_lignes()
+
+    return operation, 20_000
+
+
+def _tourner():
+    tetrimino = Tetrimino(MODELES_NOMMES["T"])
+    return tetrimino.tourner, 500_000
+
+
+def _depiler():
+    sac = Sac(list(MODELES_NOMMES.values()), random.Random(0))
+    return sac.depiler, 500_000
+
+
+def _parties():
+    # Chaque répétition joue les mêmes dix parties
+    graines = cycle(range(10))
+    return lambda: jouer_partie(politique_chute, next(graines)), 10
+
+
+def _parties_autojoueur():
+    # Sans temps de réflexion, l'autojoueur ne dépend que de la partie ; la durée
+    # est limitée car il ne perd presque jamais
+    graines = cycle(range(3))
+    return lambda: jouer_partie(Autojoueur(budget=0), next(graines), 2_000), 3
+
+
+def _jeu_affiche(partiel: bool):
+    font_init()
+    random.seed(0)
+    jeu = Jeu()
+    surface = Surface(TAILLE_FENETRE)
+    jeu.afficher(surface)
+
+    def operation():
+        jeu.avancer([], 1)
+        jeu.afficher(surface, partiel)
+
+    return operation
+
+
+def _afficher():
+    return _jeu_affiche(False), 500
+
+
+def _afficher_partiel():
+    return _jeu_affiche(True), 2_000
+
+
+# Mesures disponibles, dans l'ordre d'exécution
+MESURES: Dict[str, Preparation] = {
+    "plateau.est_obstrue": _est_obstrue,
+    "plateau.fantome": _fantome,
+    "plateau.verrouiller+effacer_ligne": _effacer_ligne,
+    "plateau.verrouiller+effacer_lignes": _effacer_lignes,
+    "tetrimino.tourner": _tourner,
+    "sac.depiler": _depiler,
+    "simulation.jouer_partie": _parties,
+    "simulation.jouer_partie_autojoueur": _parties_autojoueur,
+    "jeu.afficher": _afficher,
+    "jeu.afficher_partiel": _afficher_partiel,
+}
+
+
+def executer(
+    noms: Optional[List[str]] = None, echelle=1.0, repetitions=5
+) -> List[Mesure]:
+    """
+    Exécute des mesures
+
+    Args:
+        noms (List[str], optional): Les noms des mesures, toutes par défaut
+        echelle (float, optional): Le facteur appliqué au nombre d'itérations,
+            pour obtenir des mesures plus rapides mais moins précises
+        repetitions (int, optional): Le nombre de répétitions de chaque mesure
+
+    Raises:
+        KeyError: Une des mesures n'existe pas
+
+    Returns:
+        List[Mesure]: Les résultats des mesures
+    """
+    if noms is None:
+        noms = list(MESURES)
+
+    preparations = [(nom, MESURES[nom]) for nom in noms]
+    resultats = []
+    for nom, preparation in preparations:
+        operation, iterations = preparation()
+        iterations = max(1, round(iterations * echelle))
+        resultats.append(mesurer(nom, operation, iterations, repetitions))
+
+    return resultats
+
+
+def comparer(
+    mesures: List[Mesure], reference: Dict[str, float], tolerance=TOLERANCE
+) -> Dict[str, dict]:
+    """
+    Compare des mesures aux durées de référence
+
+    Args:
+        mesures (List[Mesure]): Les mesures
+        reference (Dict[str, float]): Les durées de référence, indexées par nom
+        tolerance (float, optional): Le ralentissement relatif toléré
+
+    Returns:
+        Dict[str, dict]: Pour chaque mesure présente dans la référence, la durée de
+        référence, le rapport entre la durée mesurée et celle de référence, et
+        si la mesure est une régression
+    """
+    comparaison = {}
+    for mesure in mesures:
+        duree_reference = reference.get(mesure.nom)
+        if duree_reference is None:
+            continue
+
+        rapport = mesure.duree / duree_reference
+        comparaison[mesure.nom] = {
+            "reference": duree_reference,
+            "rapport": round(rapport, 3),
+            "regression": rapport > 1 + tolerance,
+        }
+
+    return comparaison
+
+
+def vers_json(mesures: List[Mesure]) -> dict:
+    """
+    Renvoie le contenu JSON des résultats de mesures
+
+    Args:
+        mesures (List[Mesure]): Les mesures
+
+    Returns:
+        dict: Les résultats, avec l'environnement dans lequel ils ont été obtenus
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "optimise": not __debug__,
+        "mesures": {
+            mesure.nom: {
+                "iterations": mesure.iterations,
+                "duree": mesure.duree,
+                "par_seconde": 1 / mesure.duree,
+            }
+            for mesure in mesures
+        },
+    }
+
+
+def lire_reference(chemin: os.PathLike) -> Dict[str, float]:
+    """
+    Lit les durées d'un fichier de résultats
+
+    Args:
+        chemin (os.PathLike): Le chemin du fichier écrit par vers_json
+
+    Raises:
+        OSError: Le fichier ne peut pas être lu
+        ValueError: Le fichier n'est pas un fichier de résultats
+
+    Returns:
+        Dict[str, float]: Les durées, indexées par nom de mesure
+    """
+    with open(chemin, encoding="utf-8") as fichier:
+        contenu = json.load(fichier)
+
+    try:
+        return {
+            nom: float(mesure["duree"]) for nom, mesure in contenu["mesures"].items()
+        }
+    except (AttributeError, KeyError, TypeError) as erreur:
+        raise ValueError("Le fichier n'est pas un fichier de résultats") from erreur
+
+
+if __name__ == "__main__":
+    analyseur = ArgumentParser(description="Mesure les performances du jeu")
+    analyseur.add_argument("noms", nargs="*", metavar="nom", help=", ".join(MESURES))
+    analyseur.add_argument("-s", "--sortie", type=Path, default=None)
+    analyseur.add_argument("-r", "--reference", type=Path, default=REFERENCE)
+    analyseur.add_argument("-t", "--tolerance", type=float, default=TOLERANCE)
+    analyseur.add_argument("-e", "--echelle", type=float, default=1.0)
+    analyseur.add_argument("--enregistrer", action="store_true")
+    arguments = analyseur.parse_args()
+    for _nom in arguments.noms:
+        if _nom not in MESURES:
+            analyseur.error(f"mesure inconnue : {_nom}")
+
+    _mesures = executer(arguments.noms or None, arguments.echelle)
+    _resultats = vers_json(_mesures)
+
+    _regressions = []
+    if not arguments.enregistrer and arguments.reference.exists():
+        _comparaison = comparer(
+            _mesures, lire_reference(arguments.reference), arguments.tolerance
+        )
+        _resultats["comparaison"] = _comparaison
+        _regressions = [nom for nom, c in _comparaison.items() if c["regression"]]
+
+    _texte = json.dumps(_resultats, indent=2, ensure_ascii=False)
+    if arguments.enregistrer:
+        arguments.reference.write_text(_texte + "\n", encoding="utf-8")
+    if arguments.sortie is not None:
+        arguments.sortie.write_text(_texte + "\n", encoding="utf-8")
+    else:
+        print(_texte)
+
+    for _nom in _regressions:
+        print(f"Régression : {_nom}", file=sys.stderr)
+    sys.exit(1 if _regressions else 0)
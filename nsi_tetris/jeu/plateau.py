@@ -1,17 +1,118 @@
 """Module du plateau de jeu"""
 
-from typing import List, Tuple, Optional
-from pygame.color import Color
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional
 
-from .erreurs import verif_entier_pos, verifier_type
-from .constantes import GRILLE_LIGNES, GRILLE_COLONNES
-from .tableaux import parcourir
-from .tetrimino import Tetrimino
+from .erreurs import erreur_type, verif_entier_pos, verifier_type
+from .regles import GRILLE_LIGNES, GRILLE_COLONNES
+from .tetrimino import Couleur, Rotation, Tetrimino
 
-Case = Optional[Color]
+Case = Optional[Couleur]
 Ligne = List[Case]
 Grille = List[Ligne]
 
+_MASQUE_64 = (1 << 64) - 1
+
+# Valeur mélangée aux clés des tetriminos pour les distinguer de celles des cases occupées
+_SEL_TETRIMINO = 0x5851F42D4C957F2D
+
+
+def melanger(valeur: int) -> int:
+    """
+    Mélange les bits d'un entier pour obtenir une valeur pseudo-aléatoire de 64 bits,
+    toujours la même pour une même entrée (fonction de finalisation de splitmix64)
+
+    Args:
+        valeur (int): L'entier à mélanger
+
+    Returns:
+        int: La valeur mélangée
+    """
+    valeur = (valeur + 0x9E3779B97F4A7C15) & _MASQUE_64
+    valeur = ((valeur ^ (valeur >> 30)) * 0xBF58476D1CE4E5B9) & _MASQUE_64
+    valeur = ((valeur ^ (valeur >> 27)) * 0x94D049BB133111EB) & _MASQUE_64
+    return valeur ^ (valeur >> 31)
+
+
+# Clés de Zobrist des lignes déjà calculées, indexées par indice de ligne et masque
+_CLES_LIGNES: Dict[Tuple[int, int], int] = {}
+
+
+def cle_ligne(ligne: int, masque: int) -> int:
+    """
+    Renvoie la clé de Zobrist d'une ligne de la grille, c'est-à-dire le ou exclusif
+    des clés de ses cases occupées. La clé d'une ligne vide vaut 0.
+
+    Args:
+        ligne (int): L'indice de la ligne
+        masque (int): Le masque des cases occupées de la ligne
+
+    Returns:
+        int: La clé de 64 bits de la ligne
+    """
+    cle = _CLES_LIGNES.get((ligne, masque))
+    if cle is None:
+        cle = 0
+        reste = masque
+        while reste:
+            colonne = (reste & -reste).bit_length() - 1
+            cle ^= melanger(ligne << 32 | colonne)
+            reste &= reste - 1
+        _CLES_LIGNES[(ligne, masque)] = cle
+
+    return cle
+
+
+class Placement(NamedTuple):
+    """Représente une position finale possible d'un tetrimino"""
+
+    rotation: Rotation
+    """L'état de rotation du tetrimino"""
+    x: int
+    """La coordonnée en x du tetrimino"""
+    y: int
+    """La coordonnée en y du tetrimino"""
+
+
+class SauvegardePlateau(NamedTuple):
+    """
+    Représente l'état d'un plateau à un instant donné, renvoyé par Plateau.sauvegarder.
+    Les lignes de la grille sont partagées avec le plateau, qui les copie avant de les
+    modifier : elles ne doivent donc pas être modifiées directement.
+    """
+
+    grille: Tuple[Ligne, ...]
+    """Les lignes de la grille des couleurs"""
+    masques: Tuple[int, ...]
+    """Les masques des lignes"""
+    hauteurs: Tuple[int, ...]
+    """Les sommets des colonnes"""
+    empreinte: int
+    """L'empreinte de Zobrist du plateau"""
+
+
+class ObservateurPlateau:
+    """
+    Classe de base des objets prévenus des modifications d'un plateau, par exemple
+    pour ne redessiner que les lignes modifiées. Les méthodes ne font rien par défaut.
+    """
+
+    def lignes_modifiees(self, lignes: Tuple[int, ...]) -> None:
+        """
+        Appelée après l'ajout de cases dans certaines lignes de la grille
+
+        Args:
+            lignes (Tuple[int, ...]): Les indices des lignes modifiées
+        """
+
+    def ligne_effacee(self, indice: int) -> None:
+        """
+        Appelée après l'effacement d'une ligne, une fois les lignes situées au dessus
+        descendues d'une case
+
+        Args:
+            indice (int): L'indice de la ligne effacée
+        """
+
 
 class Plateau:
     """
@@ -19,6 +120,10 @@ class Plateau:
 
     La grille mesure en réalité 10 lignes de plus afin de pouvoir gérer les tetriminos
     placés hors de la zone de jeu en fin de partie.
+
+    Chaque ligne est stockée sous la forme d'un masque binaire, ce qui permet de tester
+    les collisions et les lignes complètes avec quelques opérations par ligne.
+    Les couleurs sont conservées à part et ne servent qu'à l'affichage.
     """
 
     def __init__(
@@ -29,26 +134,63 @@ class Plateau:
         verif_entier_pos("lignes", lignes)
         verif_entier_pos("colonnes", colonnes)
 
-        # On crée la grille, en utilisant la valeur None pour les cases vides
+        # On crée la grille des couleurs, en utilisant la valeur None pour les cases vides.
+        # Elle ne sert qu'à l'affichage : les règles du jeu utilisent uniquement les masques.
         self.__colonnes = colonnes
         self.__lignes = lignes + 10
         self.__grille: Grille = [[None] * self.__colonnes for _ in range(self.__lignes)]
 
-    def __hors_limites(self, x: int, y: int) -> bool:
+        # Chaque ligne de la grille est aussi représentée par un entier, où le bit n vaut 1
+        # si la case de la colonne n est occupée
+        self.__plein = (1 << self.__colonnes) - 1
+        self.__masques: List[int] = []
+
+        # Pour chaque colonne, on conserve l'indice de la case occupée la plus haute
+        # (le nombre de lignes si la colonne est vide)
+        self.__hauteurs: List[int] = []
+        self.__synchroniser()
+
+        # Les lignes de la grille peuvent être partagées avec des clones ou des
+        # sauvegardes : le bit n vaut 1 si la ligne n doit être copiée avant d'être modifiée
+        self.__partagees = 0
+
+        # Les observateurs sont prévenus des lignes modifiées
+        self.__observateurs: List[ObservateurPlateau] = []
+
+    def __synchroniser(self) -> None:
+        """Recalcule les masques et les hauteurs à partir de la grille des couleurs"""
+        self.__plein = (1 << self.__colonnes) - 1
+        self.__masques = [
+            sum(1 << colonne for colonne, case in enumerate(ligne) if case is not None)
+            for ligne in self.__grille
+        ]
+        self.__hauteurs = [
+            self.__sommet(colonne, 0) for colonne in range(self.__colonnes)
+        ]
+
+        # L'empreinte de Zobrist est ensuite mise à jour à chaque modification
+        self.__empreinte = 0
+        for indice_ligne, masque in enumerate(self.__masques):
+            self.__empreinte ^= cle_ligne(indice_ligne, masque)
+
+    def __sommet(self, colonne: int, depart: int) -> int:
         """
-        Renvoie True si les coordonnées (x;y) se situent hors de la grille.
-        Si cette fonction renvoie False, alors self.__grille[y][x] existe.
+        Renvoie l'indice de la première case occupée d'une colonne à partir d'une ligne donnée,
+        ou le nombre de lignes de la grille si toutes les cases suivantes sont vides.
 
         Args:
-            x (int): La coordonnée en x
-            y (int): La coordonnée en y
+            colonne (int): L'indice de la colonne
+            depart (int): L'indice de la ligne à partir de laquelle on cherche
 
         Returns:
-            bool: True si les coordonnées sont en dehors de la grille
+            int: L'indice de la première case occupée
         """
-        x_invalide = x < 0 or x >= self.__colonnes
-        y_invalide = y < 0 or y >= self.__lignes
-        return x_invalide or y_invalide
+        bit = 1 << colonne
+        for indice_ligne in range(depart, self.__lignes):
+            if self.__masques[indice_ligne] & bit:
+                return indice_ligne
+
+        return self.__lignes
 
     def __deplacer(self, tetrimino: Tetrimino, colonnes: int) -> bool:
         """
@@ -64,15 +206,7 @@ class Plateau:
 
         Returns:
             bool: True si la position du tetrimino a été modifiée
-
-        Raises:
-            TypeError: Le type de tetrimino est invalide
-            TypeError: Le type de colonnes est invalide
         """
-        # Préconditions
-        verifier_type("tetrimino", tetrimino, Tetrimino)
-        verifier_type("colonnes", colonnes, int)
-
         x_initial = tetrimino.get_position()[0]
         tetrimino.set_position(x=x_initial + colonnes)
         if self.est_obstrue(tetrimino):
@@ -100,6 +234,216 @@ class Plateau:
         """
         return tuple(map(tuple, self.__grille))
 
+    def masques(self) -> Tuple[int, ...]:
+        """
+        Renvoie les masques des lignes de la grille, où le bit n de chaque masque vaut 1
+        si la case de la colonne n est occupée.
+
+        Returns:
+            Tuple[int, ...]: Les masques des lignes, de haut en bas
+        """
+        return tuple(self.__masques)
+
+    def hauteurs(self) -> Tuple[int, ...]:
+        """
+        Renvoie, pour chaque colonne, l'indice de sa case occupée la plus haute
+        (le nombre de lignes si la colonne est vide).
+
+        Returns:
+            Tuple[int, ...]: Les indices des sommets des colonnes
+        """
+        return tuple(self.__hauteurs)
+
+    def empreinte(self, tetrimino: Optional[Tetrimino] = None) -> int:
+        """
+        Renvoie l'empreinte de Zobrist du plateau, un entier de 64 bits mis à jour à chaque
+        modification de la grille. Deux plateaux dont les mêmes cases sont occupées ont la
+        même empreinte, quelles que soient leurs couleurs ; deux plateaux différents ont
+        presque toujours des empreintes différentes.
+
+        Args:
+            tetrimino (Tetrimino, optional): Un tetrimino dont la position est
+                prise en compte dans l'empreinte
+
+        Returns:
+            int: L'empreinte du plateau
+        """
+        if tetrimino is None:
+            return self.__empreinte
+
+        tetr_x, tetr_y = tetrimino.get_position()
+        empreinte = self.__empreinte
+        for ligne, colonne in tetrimino.get_etat().cases:
+            case = ((ligne + tetr_y) & 0xFFFF) << 16 | ((colonne + tetr_x) & 0xFFFF)
+            empreinte ^= melanger(case ^ _SEL_TETRIMINO)
+
+        return empreinte
+
+    def ligne(self, indice: int) -> Tuple[Case, ...]:
+        """
+        Renvoie le contenu d'une ligne de la grille.
+
+        Args:
+            indice (int): L'indice de la ligne
+
+        Returns:
+            Tuple[Case, ...]: Une copie immutable de la ligne
+        """
+        return tuple(self.__grille[indice])
+
+    def ajouter_observateur(self, observateur: ObservateurPlateau) -> None:
+        """
+        Ajoute un observateur prévenu des modifications de la grille
+
+        Args:
+            observateur (ObservateurPlateau): L'observateur à ajouter
+
+        Raises:
+            TypeError: Le type de observateur est invalide
+        """
+        # Précondition
+        verifier_type("observateur", observateur, ObservateurPlateau)
+
+        self.__observateurs.append(observateur)
+
+    def retirer_observateur(self, observateur: ObservateurPlateau) -> None:
+        """
+        Retire un observateur ajouté auparavant
+
+        Args:
+            observateur (ObservateurPlateau): L'observateur à retirer
+
+        Raises:
+            ValueError: L'observateur n'observe pas ce plateau
+        """
+        self.__observateurs.remove(observateur)
+
+    def copier(self) -> "Plateau":
+        """
+        Renvoie une copie indépendante du plateau, sans ses observateurs.
+
+        Returns:
+            Plateau: La copie du plateau
+        """
+        return self.__dupliquer([ligne.copy() for ligne in self.__grille], 0)
+
+    def cloner(self) -> "Plateau":
+        """
+        Renvoie une copie du plateau, sans ses observateurs, qui partage les lignes de sa
+        grille avec l'original : chaque ligne n'est copiée que lorsque l'un des deux
+        plateaux la modifie. Cloner un plateau ne coûte donc que la copie de quelques
+        listes de références, contrairement à copier.
+
+        Returns:
+            Plateau: Le clone du plateau
+        """
+        self.__partagees = (1 << self.__lignes) - 1
+        return self.__dupliquer(self.__grille.copy(), self.__partagees)
+
+    def __dupliquer(self, grille: Grille, partagees: int) -> "Plateau":
+        """
+        Renvoie une copie du plateau sans ses observateurs, qui utilise une grille donnée
+
+        Args:
+            grille (Grille): La grille de la copie, dont les lignes peuvent être partagées
+            partagees (int): Les lignes de la grille partagées avec ce plateau
+
+        Returns:
+            Plateau: La copie du plateau
+        """
+        # pylint: disable=protected-access,unused-private-member
+        copie = Plateau.__new__(Plateau)
+        copie.__colonnes = self.__colonnes
+        copie.__lignes = self.__lignes
+        copie.__plein = self.__plein
+        copie.__grille = grille
+        copie.__masques = self.__masques.copy()
+        copie.__hauteurs = self.__hauteurs.copy()
+        copie.__empreinte = self.__empreinte
+        copie.__partagees = partagees
+        copie.__observateurs = []
+        return copie
+
+    def sauvegarder(self) -> SauvegardePlateau:
+        """
+        Renvoie l'état actuel du plateau, qui pourra être rétabli avec annuler.
+        Comme pour cloner, les lignes de la grille ne sont pas copiées.
+
+        Returns:
+            SauvegardePlateau: L'état du plateau
+        """
+        self.__partagees = (1 << self.__lignes) - 1
+        return SauvegardePlateau(
+            tuple(self.__grille),
+            tuple(self.__masques),
+            tuple(self.__hauteurs),
+            self.__empreinte,
+        )
+
+    def annuler(self, sauvegarde: SauvegardePlateau) -> None:
+        """
+        Rétablit un état du plateau renvoyé par sauvegarder, ce qui annule toutes les
+        modifications faites depuis. Seules les lignes modifiées depuis la sauvegarde
+        sont signalées aux observateurs.
+
+        Args:
+            sauvegarde (SauvegardePlateau): L'état à rétablir
+
+        Raises:
+            TypeError: Le type de sauvegarde est invalide
+            ValueError: La sauvegarde ne provient pas d'un plateau de la même forme
+        """
+        # Préconditions
+        verifier_type("sauvegarde", sauvegarde, SauvegardePlateau)
+        if (len(sauvegarde.masques), len(sauvegarde.hauteurs)) != self.forme():
+            raise ValueError("La sauvegarde doit provenir d'un plateau de même forme")
+
+        lignes: Tuple[int, ...] = ()
+        if self.__observateurs:
+            lignes = tuple(
+                indice
+                for indice, (actuelle, ancienne) in enumerate(
+                    zip(self.__grille, sauvegarde.grille)
+                )
+                if actuelle is not ancienne
+            )
+
+        # La sauvegarde peut être rétablie plusieurs fois, ses lignes restent partagées
+        self.__grille = list(sauvegarde.grille)
+        self.__masques = list(sauvegarde.masques)
+        self.__hauteurs = list(sauvegarde.hauteurs)
+        self.__empreinte = sauvegarde.empreinte
+        self.__partagees = (1 << self.__lignes) - 1
+
+        if lignes:
+            for observateur in self.__observateurs:
+                observateur.lignes_modifiees(lignes)
+
+    def restaurer(self, grille: Grille) -> None:
+        """
+        Remplace le contenu de la grille, par exemple pour reprendre une partie
+        à partir d'un instantané. Toutes les lignes sont signalées aux observateurs.
+
+        Args:
+            grille (Grille): Le nouveau contenu, de la même forme que la grille
+
+        Raises:
+            ValueError: La forme de grille ne correspond pas à celle du plateau
+        """
+        # Précondition
+        if len(grille) != self.__lignes or any(
+            len(ligne) != self.__colonnes for ligne in grille
+        ):
+            raise ValueError("La grille doit avoir la même forme que le plateau")
+
+        self.__grille = [list(ligne) for ligne in grille]
+        self.__partagees = 0
+        self.__synchroniser()
+
+        lignes = tuple(range(self.__lignes))
+        for observateur in self.__observateurs:
+            observateur.lignes_modifiees(lignes)
+
     def est_obstrue(self, tetrimino: Tetrimino) -> bool:
         """
         Renvoie True si un tetrimino est hors de la grille ou dans une position obstruée.
@@ -114,17 +458,31 @@ class Plateau:
             TypeError: La valeur passée en argument n'est pas un tetrimino
         """
         # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
 
         tetr_x, tetr_y = tetrimino.get_position()
-        for case, ligne, colonne in parcourir(tetrimino.get_forme()):
-            if case != 0:
-                case_x = colonne + tetr_x
-                case_y = ligne + tetr_y
-                if (
-                    self.__hors_limites(case_x, case_y)
-                    or self.__grille[case_y][case_x] is not None
-                ):
+        lignes, (gauche, haut, droite, bas) = tetrimino.get_masques()
+
+        # On vérifie d'abord que les cases occupées du tetrimino sont dans la grille
+        if (
+            tetr_x + gauche < 0
+            or tetr_x + droite >= self.__colonnes
+            or tetr_y + haut < 0
+            or tetr_y + bas >= self.__lignes
+        ):
+            return True
+
+        # Puis on compare chaque ligne du tetrimino avec la ligne correspondante de la grille.
+        # Si x est négatif, seules des colonnes vides de la forme sont perdues par le décalage.
+        masques = self.__masques
+        if tetr_x >= 0:
+            for ligne, masque, _ in lignes:
+                if masques[tetr_y + ligne] & (masque << tetr_x):
+                    return True
+        else:
+            for ligne, masque, _ in lignes:
+                if masques[tetr_y + ligne] & (masque >> -tetr_x):
                     return True
 
         return False
@@ -140,15 +498,36 @@ class Plateau:
             TypeError: La valeur passée en argument n'est pas un tetrimino
         """
         # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
 
         tetr_x, tetr_y = tetrimino.get_position()
         couleur = tetrimino.get_couleur()
-        for case, ligne, colonne in parcourir(tetrimino.get_forme()):
-            if case != 0:
+        for ligne, _, colonnes in tetrimino.get_masques()[0]:
+            case_y = ligne + tetr_y
+            rangee = self.__grille[case_y]
+            # Une ligne partagée est copiée avant d'être modifiée
+            if self.__partagees >> case_y & 1:
+                rangee = rangee.copy()
+                self.__grille[case_y] = rangee
+                self.__partagees &= ~(1 << case_y)
+
+            ancien_masque = self.__masques[case_y]
+            for colonne in colonnes:
                 case_x = colonne + tetr_x
-                case_y = ligne + tetr_y
-                self.__grille[case_y][case_x] = couleur
+                rangee[case_x] = couleur
+                self.__masques[case_y] |= 1 << case_x
+                if case_y < self.__hauteurs[case_x]:
+                    self.__hauteurs[case_x] = case_y
+
+            self.__empreinte ^= cle_ligne(case_y, ancien_masque) ^ cle_ligne(
+                case_y, self.__masques[case_y]
+            )
+
+        if self.__observateurs:
+            lignes = tuple(ligne + tetr_y for ligne, _, _ in tetrimino.get_masques()[0])
+            for observateur in self.__observateurs:
+                observateur.lignes_modifiees(lignes)
 
     def lignes_completes(self) -> Tuple[int, ...]:
         """
@@ -157,10 +536,11 @@ class Plateau:
         Returns:
             Tuple[int, ...]: Un tuple d'indices correspondant aux lignes pleines
         """
+        plein = self.__plein
         return tuple(
             indice_ligne
-            for indice_ligne in range(self.__lignes)
-            if None not in self.__grille[indice_ligne]
+            for indice_ligne, masque in enumerate(self.__masques)
+            if masque == plein
         )
 
     def effacer_ligne(self, indice: int) -> None:
@@ -179,17 +559,195 @@ class Plateau:
         if not 0 <= indice < self.__lignes:
             raise ValueError("indice doit correspondre à une ligne de la grille")
 
-        # On efface la ligne
-        ligne_vide: Ligne = [None] * self.__colonnes
-        self.__grille[indice] = ligne_vide.copy()
+        # La ligne effacée disparait de l'empreinte, et les lignes non vides situées
+        # au dessus (à partir du sommet de la plus haute colonne) descendent d'une ligne
+        empreinte = self.__empreinte ^ cle_ligne(indice, self.__masques[indice])
+        for indice_ligne in range(min(self.__hauteurs), indice):
+            masque = self.__masques[indice_ligne]
+            if masque:
+                empreinte ^= cle_ligne(indice_ligne, masque)
+                empreinte ^= cle_ligne(indice_ligne + 1, masque)
+        self.__empreinte = empreinte
+
+        # On retire la ligne et on ajoute une ligne vide en haut de la grille,
+        # ce qui fait descendre toutes les lignes situées au dessus
+        del self.__grille[indice]
+        self.__grille.insert(0, [None] * self.__colonnes)
+
+        del self.__masques[indice]
+        self.__masques.insert(0, 0)
+
+        # Les lignes partagées situées au dessus descendent aussi, la nouvelle ligne
+        # du haut appartient au plateau
+        partagees = self.__partagees
+        self.__partagees = (partagees >> (indice + 1) << (indice + 1)) | (
+            (partagees & ((1 << indice) - 1)) << 1
+        )
+
+        # Les colonnes dont le sommet est au dessus de la ligne effacée descendent d'une case,
+        # et celles dont le sommet était sur cette ligne doivent chercher leur nouveau sommet
+        for colonne, hauteur in enumerate(self.__hauteurs):
+            if hauteur < indice:
+                self.__hauteurs[colonne] = hauteur + 1
+            elif hauteur == indice:
+                self.__hauteurs[colonne] = self.__sommet(colonne, indice + 1)
 
-        # On part de l'indice de la ligne effacée et on remonte jusqu'en haut de la
-        # grille pour faire descendre les lignes du dessus
-        for indice_sup in reversed(range(indice)):
-            self.__grille[indice_sup + 1] = self.__grille[indice_sup]
+        for observateur in self.__observateurs:
+            observateur.ligne_effacee(indice)
 
-        # On efface la première ligne
-        self.__grille[0] = ligne_vide.copy()
+    def effacer_lignes(self, indices: Optional[Iterable[int]] = None) -> int:
+        """
+        Efface plusieurs lignes de la grille et fait descendre les lignes situées au dessus,
+        en reconstruisant la grille en une seule passe. Par défaut, les lignes effacées sont
+        les lignes complètes, ce qui évite de parcourir la grille une seconde fois.
+
+        Les observateurs sont prévenus de chaque ligne effacée, de haut en bas, comme si
+        les lignes avaient été effacées une par une avec effacer_ligne.
+
+        Args:
+            indices (Iterable[int], optional): Les indices des lignes à effacer,
+                par défaut les lignes complètes
+
+        Raises:
+            TypeError: Le type d'un des indices est invalide
+            ValueError: Un des indices se situe en dehors de la grille
+
+        Returns:
+            int: Le nombre de lignes effacées
+        """
+        masques = self.__masques
+        if indices is None:
+            plein = self.__plein
+            effacees = [
+                indice for indice, masque in enumerate(masques) if masque == plein
+            ]
+        else:
+            # Préconditions
+            effacees = list(set(indices))
+            for indice in effacees:
+                verifier_type("indice", indice, int)
+                if not 0 <= indice < self.__lignes:
+                    raise ValueError(
+                        "indice doit correspondre à une ligne de la grille"
+                    )
+            effacees.sort()
+
+        if not effacees:
+            return 0
+
+        # On parcourt la grille de bas en haut : chaque ligne conservée descend du nombre
+        # de lignes effacées situées en dessous d'elle. Les lignes situées au dessus de la
+        # plus haute colonne et de la plus haute ligne effacée sont vides, elles descendent
+        # toutes ensemble.
+        debut = min(*self.__hauteurs, effacees[0])
+        grille = self.__grille
+        anciennes_partagees = self.__partagees
+        a_effacer = set(effacees)
+        lignes_conservees: Grille = []
+        masques_conserves: List[int] = []
+        partagees = 0
+        empreinte = self.__empreinte
+        destination = self.__lignes - 1
+        for indice in range(self.__lignes - 1, debut - 1, -1):
+            masque = masques[indice]
+            if indice in a_effacer:
+                empreinte ^= cle_ligne(indice, masque)
+                continue
+
+            if masque and destination != indice:
+                empreinte ^= cle_ligne(indice, masque) ^ cle_ligne(destination, masque)
+            lignes_conservees.append(grille[indice])
+            masques_conserves.append(masque)
+            partagees |= (anciennes_partagees >> indice & 1) << destination
+            destination -= 1
+
+        # Des lignes vides apparaissent en haut de la grille
+        nombre = len(effacees)
+        lignes_conservees.reverse()
+        masques_conserves.reverse()
+        self.__grille = (
+            [[None] * self.__colonnes for _ in range(nombre)]
+            + grille[:debut]
+            + lignes_conservees
+        )
+        self.__masques = [0] * nombre + masques[:debut] + masques_conserves
+        self.__partagees = partagees | (
+            (anciennes_partagees & ((1 << debut) - 1)) << nombre
+        )
+        self.__empreinte = empreinte
+
+        # Les lignes ne peuvent que descendre, le nouveau sommet de chaque colonne
+        # se trouve donc à partir de son ancien sommet
+        for colonne, hauteur in enumerate(self.__hauteurs):
+            if hauteur < self.__lignes:
+                self.__hauteurs[colonne] = self.__sommet(colonne, hauteur)
+
+        for observateur in self.__observateurs:
+            for indice in effacees:
+                observateur.ligne_effacee(indice)
+
+        return nombre
+
+    def ajouter_lignes(self, nombre: int, trou: int, couleur: Couleur) -> bool:
+        """
+        Fait monter le contenu de la grille et ajoute en bas des lignes remplies sauf
+        une case, par exemple les lignes envoyées par l'adversaire en multijoueur.
+        Toutes les lignes sont signalées aux observateurs.
+
+        Args:
+            nombre (int): Le nombre de lignes à ajouter
+            trou (int): L'indice de la colonne laissée vide dans les lignes ajoutées
+            couleur (Couleur): La couleur des cases ajoutées
+
+        Raises:
+            TypeError: Le type de nombre ou de trou est invalide
+            ValueError: nombre dépasse la hauteur de la grille, ou trou ne correspond
+                pas à une colonne
+
+        Returns:
+            bool: True si des cases occupées sont sorties par le haut de la grille
+        """
+        # Préconditions
+        verif_entier_pos("nombre", nombre)
+        verif_entier_pos("trou", trou)
+        if nombre > self.__lignes or trou >= self.__colonnes:
+            raise ValueError("nombre et trou doivent correspondre à la grille")
+
+        if nombre == 0:
+            return False
+
+        deborde = any(self.__masques[:nombre])
+
+        # Les lignes partagées montent avec le reste de la grille
+        ligne_ajoutee = [couleur] * self.__colonnes
+        ligne_ajoutee[trou] = None
+        self.__grille = self.__grille[nombre:] + [
+            ligne_ajoutee.copy() for _ in range(nombre)
+        ]
+        self.__masques = (
+            self.__masques[nombre:] + [self.__plein & ~(1 << trou)] * nombre
+        )
+        self.__partagees >>= nombre
+
+        # Toutes les lignes changent d'indice, l'empreinte est donc recalculée
+        self.__empreinte = 0
+        for indice_ligne in range(min(self.__hauteurs) - nombre, self.__lignes):
+            if indice_ligne >= 0:
+                self.__empreinte ^= cle_ligne(
+                    indice_ligne, self.__masques[indice_ligne]
+                )
+
+        for colonne, hauteur in enumerate(self.__hauteurs):
+            if nombre <= hauteur < self.__lignes:
+                self.__hauteurs[colonne] = hauteur - nombre
+            else:
+                self.__hauteurs[colonne] = self.__sommet(colonne, 0)
+
+        lignes = tuple(range(self.__lignes))
+        for observateur in self.__observateurs:
+            observateur.lignes_modifiees(lignes)
+
+        return deborde
 
     def deplacer_gauche(self, tetrimino: Tetrimino) -> bool:
         """
@@ -209,7 +767,8 @@ class Plateau:
             TypeError: Le type de tetrimino est invalide
         """
         # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
 
         return self.__deplacer(tetrimino, -1)
 
@@ -231,7 +790,8 @@ class Plateau:
             TypeError: Le type de tetrimino est invalide
         """
         # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
 
         return self.__deplacer(tetrimino, 1)
 
@@ -253,9 +813,11 @@ class Plateau:
         Raises:
             TypeError: Le type de tetrimino est invalide
         """
-        # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
-        verifier_type("sens_horaire", sens_horaire, bool)
+        # Préconditions
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
+        if __debug__ and not isinstance(sens_horaire, bool):
+            raise erreur_type("sens_horaire", sens_horaire, bool)
 
         tetrimino.tourner(sens_horaire)
 
@@ -277,10 +839,32 @@ class Plateau:
             int: La plus grande coordonnée en y non obstruée pour ce tetrimino
         """
         # Précondition
-        verifier_type("tetrimino", tetrimino, Tetrimino)
-
-        # On conserve la position initiale du tetrimino
-        position_depart = tetrimino.get_position()[1]
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
+
+        tetr_x, position_depart = tetrimino.get_position()
+        etat = tetrimino.get_etat()
+        gauche, haut, droite, _ = etat.limites
+
+        # Si le tetrimino est dans la grille et au dessus du sommet de chacune de ses colonnes,
+        # sa position d'arrivée se déduit directement des hauteurs des colonnes
+        if (
+            tetr_x + gauche >= 0
+            and tetr_x + droite < self.__colonnes
+            and position_depart + haut >= 0
+        ):
+            hauteurs = self.__hauteurs
+            arrivee = self.__lignes
+            for colonne, bas in etat.profil:
+                hauteur = hauteurs[tetr_x + colonne]
+                if hauteur <= position_depart + bas:
+                    break
+                arrivee = min(arrivee, hauteur - 1 - bas)
+            else:
+                return arrivee
+
+        # Sinon (tetrimino sous une case occupée ou hors de la grille),
+        # on conserve la position initiale du tetrimino
 
         # On fait descendre le tetrimino jusqu'à ce que sa position soit obstruée
         tetr_y = position_depart
@@ -293,3 +877,105 @@ class Plateau:
 
         # On renvoie la dernière position non obstruée
         return tetr_y - 1
+
+    def placements(self, tetrimino: Tetrimino) -> Tuple[Placement, ...]:
+        """
+        Renvoie toutes les positions dans lesquelles un tetrimino peut être verrouillé
+        en partant de sa position actuelle, à l'aide des déplacements, des rotations
+        et de la descente d'une case.
+        Les positions occupant les mêmes cases (par symétrie de la forme) ne sont
+        renvoyées qu'une fois.
+
+        Args:
+            tetrimino (Tetrimino): Le tetrimino à placer
+
+        Returns:
+            Tuple[Placement, ...]: Les positions finales distinctes du tetrimino
+
+        Raises:
+            TypeError: Le type de tetrimino est invalide
+        """
+        # Précondition
+        if __debug__ and not isinstance(tetrimino, Tetrimino):
+            raise erreur_type("tetrimino", tetrimino, Tetrimino)
+
+        if self.est_obstrue(tetrimino):
+            return ()
+
+        etats = tetrimino.get_etats()
+        tetr_x, tetr_y = tetrimino.get_position()
+
+        # On parcourt les états (rotation, x, y) ligne par ligne, en représentant pour
+        # chaque rotation l'ensemble des x atteignables par un entier où le bit x + marge
+        # vaut 1. Les lignes de la grille sont décalées de la même marge et entourées
+        # de murs, ce qui permet de tester toutes les colonnes d'une ligne en même temps.
+        marge = max(len(ligne) for etat in etats for ligne in etat.forme)
+        largeur = self.__colonnes + marge
+        tous = (1 << largeur) - 1
+        murs = ((1 << marge) - 1) | (((1 << marge) - 1) << largeur)
+        lignes = [(masque << marge) | murs for masque in self.__masques]
+        nombre_lignes = self.__lignes
+        plein = (1 << (largeur + marge)) - 1
+
+        def libres(rotation: int, y: int) -> int:
+            """Renvoie l'ensemble des x pour lesquels l'état (rotation, x, y) est libre"""
+            obstrues = 0
+            for ligne, colonne in etats[rotation].cases:
+                case_y = y + ligne
+                if 0 <= case_y < nombre_lignes:
+                    obstrues |= lignes[case_y] >> colonne
+                else:
+                    obstrues |= plein
+            return ~obstrues & tous
+
+        atteints = [0, 0, 0, 0]
+        atteints[tetrimino.get_rotation().value] = 1 << (tetr_x + marge)
+        libres_ligne = [libres(rotation, tetr_y) for rotation in range(4)]
+
+        resultat: Dict[Tuple[int, int, int], Placement] = {}
+        y = tetr_y
+        while any(atteints):
+            # On étend les états atteints de la ligne avec les déplacements
+            # horizontaux et les rotations jusqu'à ce qu'ils ne changent plus
+            modifie = True
+            while modifie:
+                modifie = False
+                for rotation in range(4):
+                    voisins = (
+                        atteints[(rotation + 1) % 4] | atteints[(rotation - 1) % 4]
+                    )
+                    etendus = atteints[rotation] | (voisins & libres_ligne[rotation])
+                    while True:
+                        suivants = (
+                            etendus | (etendus << 1) | (etendus >> 1)
+                        ) & libres_ligne[rotation]
+                        if suivants == etendus:
+                            break
+                        etendus = suivants
+
+                    if etendus != atteints[rotation]:
+                        atteints[rotation] = etendus
+                        modifie = True
+
+            # Les états qui ne peuvent pas descendre sont des positions finales,
+            # les autres passent à la ligne suivante
+            libres_suivante = [libres(rotation, y + 1) for rotation in range(4)]
+            for rotation in range(4):
+                finaux = atteints[rotation] & ~libres_suivante[rotation]
+                etat = etats[rotation]
+                gauche, haut = etat.limites[:2]
+                while finaux:
+                    bit = finaux & -finaux
+                    finaux ^= bit
+                    x = bit.bit_length() - 1 - marge
+                    cle = (etat.canon, x + gauche, y + haut)
+                    # On garde de préférence l'état de référence parmi les états équivalents
+                    if cle not in resultat or rotation == etat.canon:
+                        resultat[cle] = Placement(Rotation(rotation), x, y)
+
+                atteints[rotation] &= libres_suivante[rotation]
+
+            libres_ligne = libres_suivante
+            y += 1
+
+        return tuple(resultat.values())
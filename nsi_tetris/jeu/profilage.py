@@ -0,0 +1,220 @@
+"""
+Module de mesure du temps passé dans chaque phase des images du jeu.
+
+Le profileur conserve les durées des dernières images dans des tampons circulaires
+de taille fixe : la mémoire utilisée ne dépend pas de la durée de la partie, et
+enregistrer une image ne coûte que quelques écritures dans des tableaux.
+"""
+
+from array import array
+from math import ceil
+from time import perf_counter
+from typing import Callable, Dict, NamedTuple, Tuple, TypeVar
+
+from nsi_tetris.jeu.constantes import IPS
+from nsi_tetris.jeu.erreurs import verif_entier_pos, verifier_type
+
+# Phases mesurées par le jeu. Les phases des fonctions d'affichage sont comprises
+# dans la phase afficher, et la durée d'une image est celle d'avancer et d'afficher
+AVANCER = "avancer"
+AFFICHER = "afficher"
+DESSINER = "dessiner"
+AFFICHER_TETRIMINO = "afficher_tetrimino"
+AFFICHER_TEXTE = "afficher_texte"
+IMAGE = "image"
+PHASES: Tuple[str, ...] = (
+    AVANCER,
+    AFFICHER,
+    DESSINER,
+    AFFICHER_TETRIMINO,
+    AFFICHER_TEXTE,
+)
+
+F = TypeVar("F", bound=Callable)
+
+
+class Centiles(NamedTuple):
+    """Représente les centiles des durées d'une phase, en secondes"""
+
+    p50: float
+    p95: float
+    p99: float
+
+
+class Profileur:
+    """
+    Représente les durées des phases des dernières images affichées.
+
+    Les durées d'une image sont cumulées par phase avec ajouter, puis enregistrées
+    dans les tampons par terminer_image. Une image dont la durée dépasse le budget
+    est comptée comme un dépassement.
+    """
+
+    def __init__(self, capacite=IPS * 10, budget=1 / IPS) -> None:
+        """
+        Args:
+            capacite (int, optional): Le nombre d'images conservées
+            budget (float, optional): La durée maximale d'une image, en secondes
+
+        Raises:
+            TypeError: Le type de capacite ou de budget est invalide
+            ValueError: capacite est inférieure à 1 ou budget est négatif
+        """
+        # Préconditions
+        verif_entier_pos("capacite", capacite)
+        verifier_type("budget", budget, (int, float))
+        if capacite < 1 or budget < 0:
+            raise ValueError(
+                "capacite doit être positive et budget ne pas être négatif"
+            )
+
+        self.__capacite = capacite
+        self.__budget = budget
+
+        # Un tampon par phase, plus un pour la durée totale de chaque image
+        self.__tampons: Dict[str, array] = {
+            phase: array("d", bytes(8 * capacite)) for phase in (*PHASES, IMAGE)
+        }
+        self.__courant = dict.fromkeys(PHASES, 0.0)
+        self.__position = 0
+        self.__images = 0
+        self.__depassements = 0
+
+    def get_budget(self) -> float:
+        """Renvoie la durée maximale d'une image, en secondes"""
+        return self.__budget
+
+    def get_images(self) -> int:
+        """Renvoie le nombre d'images terminées depuis la création du profileur"""
+        return self.__images
+
+    def __len__(self) -> int:
+        """Renvoie le nombre d'images conservées dans les tampons"""
+        return min(self.__images, self.__capacite)
+
+    def ajouter(self, phase: str, duree: float) -> None:
+        """
+        Ajoute une durée à une phase de l'image en cours
+
+        Args:
+            phase (str): La phase, parmi PHASES
+            duree (float): La durée en secondes
+
+        Raises:
+            KeyError: La phase n'existe pas
+        """
+        self.__courant[phase] += duree
+
+    def chronometrer(self, phase: str, fonction: F) -> F:
+        """
+        Renvoie une fonction qui appelle la fonction donnée en ajoutant la durée
+        de chaque appel à une phase
+
+        Args:
+            phase (str): La phase, parmi PHASES
+            fonction (F): La fonction à chronométrer
+
+        Raises:
+            KeyError: La phase n'existe pas
+
+        Returns:
+            F: La fonction chronométrée
+        """
+        if phase not in self.__courant:
+            raise KeyError(phase)
+
+        courant = self.__courant
+
+        def chronometree(*args, **kwargs):
+            debut = perf_counter()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                courant[phase] += perf_counter() - debut
+
+        return chronometree  # type: ignore
+
+    def terminer_image(self) -> None:
+        """Enregistre les durées de l'image en cours et commence une nouvelle image"""
+        position = self.__position
+        courant = self.__courant
+        for phase, duree in courant.items():
+            self.__tampons[phase][position] = duree
+            courant[phase] = 0.0
+
+        duree_image = (
+            self.__tampons[AVANCER][position] + self.__tampons[AFFICHER][position]
+        )
+        self.__tampons[IMAGE][position] = duree_image
+        if duree_image > self.__budget:
+            self.__depassements += 1
+
+        self.__position = (position + 1) % self.__capacite
+        self.__images += 1
+
+    def durees(self, phase=IMAGE) -> array:
+        """
+        Renvoie les durées conservées d'une phase, de la plus ancienne à la plus récente
+
+        Args:
+            phase (str, optional): La phase, parmi PHASES, ou IMAGE pour la durée
+                totale des images
+
+        Raises:
+            KeyError: La phase n'existe pas
+
+        Returns:
+            array: Les durées en secondes
+        """
+        tampon = self.__tampons[phase]
+        if self.__images < self.__capacite:
+            return tampon[: self.__images]
+
+        return tampon[self.__position :] + tampon[: self.__position]
+
+    def centiles(self, phase=IMAGE) -> Centiles:
+        """
+        Calcule les centiles 50, 95 et 99 des durées conservées d'une phase
+
+        Args:
+            phase (str, optional): La phase, parmi PHASES, ou IMAGE pour la durée
+                totale des images
+
+        Raises:
+            KeyError: La phase n'existe pas
+
+        Returns:
+            Centiles: Les centiles en secondes, nuls si aucune image n'est terminée
+        """
+        durees = sorted(self.durees(phase))
+        if not durees:
+            return Centiles(0.0, 0.0, 0.0)
+
+        # Méthode du rang le plus proche
+        return Centiles(*(durees[ceil(len(durees) * q) - 1] for q in (0.5, 0.95, 0.99)))
+
+    def depassements(self, total=False) -> int:
+        """
+        Renvoie le nombre d'images dont la durée a dépassé le budget
+
+        Args:
+            total (bool, optional): True pour compter toutes les images depuis la
+                création du profileur, et pas seulement celles conservées
+
+        Returns:
+            int: Le nombre d'images trop longues
+        """
+        if total:
+            return self.__depassements
+
+        budget = self.__budget
+        return sum(1 for duree in self.durees() if duree > budget)
+
+    def resume(self) -> Dict[str, Centiles]:
+        """
+        Renvoie les centiles de chaque phase et de la durée totale des images
+
+        Returns:
+            Dict[str, Centiles]: Les centiles, indexés par phase
+        """
+        return {phase: self.centiles(phase) for phase in (IMAGE, *PHASES)}
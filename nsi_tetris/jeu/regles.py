@@ -0,0 +1,98 @@
+"""Module contenant les constantes des règles du jeu, utilisables sans affichage"""
+
+from typing import Dict
+
+from .tetrimino import EtatsRotation, Forme, Modele, rotations
+
+# Position par défaut d'un tetrimino
+TETR_DEFAUT_X = 3
+TETR_DEFAUT_Y = 7
+
+# Taille de la grille
+GRILLE_LIGNES = 20
+GRILLE_COLONNES = 10
+
+# Le nombre de ticks de la logique du jeu par seconde, indépendant de l'affichage
+FREQUENCE_LOGIQUE = 60
+
+# La gravité est mesurée en fractions de case par tick : un tetrimino descend d'une case
+# chaque fois que PRECISION_GRAVITE fractions se sont accumulées
+PRECISION_GRAVITE = 1 << 16
+
+# Le nombre de lignes à effacer pour passer au niveau suivant
+LIGNES_PAR_NIVEAU = 10
+
+# La gravité maximale, où le tetrimino tombe de 20 cases par tick (20G)
+GRAVITE_MAX = 20 * PRECISION_GRAVITE
+
+# La gravité de chaque niveau, à partir du niveau 1 : le temps de descente d'une case
+# vaut (0.8 - (niveau - 1) * 0.007) ** (niveau - 1) secondes, comme dans les règles
+# officielles, jusqu'à atteindre la gravité maximale
+GRAVITES = tuple(
+    min(
+        GRAVITE_MAX,
+        round(PRECISION_GRAVITE / ((0.8 - n * 0.007) ** n * FREQUENCE_LOGIQUE)),
+    )
+    for n in range(20)
+)
+
+# Le score que rapporte chaque nombre de lignes
+SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+
+# Le nombre de lignes envoyées à l'adversaire en multijoueur pour chaque nombre
+# de lignes effacées
+DECHETS = {1: 0, 2: 1, 3: 2, 4: 4}
+
+# La couleur des lignes reçues de l'adversaire, un nom de couleur compris par pygame
+COULEUR_DECHETS = "gray"
+
+# Formes des différents tetriminos
+FORMES_TETRIMINOS: Dict[str, Forme] = {
+    "I": (
+        (0, 0, 0, 0),  #
+        (1, 1, 1, 1),  #
+        (0, 0, 0, 0),  #
+        (0, 0, 0, 0),  #
+    ),
+    "O": (
+        (0, 0, 0, 0),  #
+        (0, 1, 1, 0),  #
+        (0, 1, 1, 0),  #
+        (0, 0, 0, 0),  #
+    ),
+    "T": (
+        (0, 1, 0),  #
+        (1, 1, 1),  #
+        (0, 0, 0),  #
+    ),
+    "S": (
+        (0, 1, 1),  #
+        (1, 1, 0),  #
+        (0, 0, 0),  #
+    ),
+    "Z": (
+        (1, 1, 0),  #
+        (0, 1, 1),  #
+        (0, 0, 0),  #
+    ),
+    "J": (
+        (1, 0, 0),  #
+        (1, 1, 1),  #
+        (0, 0, 0),  #
+    ),
+    "L": (
+        (0, 0, 1),  #
+        (1, 1, 1),  #
+        (0, 0, 0),  #
+    ),
+}
+
+# Modèles utilisés sans affichage, où la couleur d'un tetrimino est remplacée par son nom
+MODELES_NOMMES: Dict[str, Modele] = {
+    nom: (forme, nom) for nom, forme in FORMES_TETRIMINOS.items()
+}
+
+# Table des états de rotation de chaque tetrimino, calculée une seule fois au chargement
+TABLE_ROTATIONS: Dict[str, EtatsRotation] = {
+    nom: rotations(forme) for nom, forme in FORMES_TETRIMINOS.items()
+}
@@ -0,0 +1,285 @@
+"""
+Module du protocole réseau des parties multijoueurs.
+
+Les messages sont découpés en trames : la taille du contenu sur 2 octets (gros-boutiste),
+suivie du contenu, dont le premier octet est le type du message. Les entiers de taille
+variable sont écrits avec enregistrement.ecrire_varint.
+
+Le client envoie REJOINDRE pour chercher un adversaire, puis le code de chaque action
+avec ACTION. Le serveur envoie DEBUT au début de la partie, puis ETAT chaque fois que
+le plateau, le tetrimino ou le score d'un des deux joueurs change, avec uniquement
+ce qui a changé, et enfin FIN avec l'indice du gagnant.
+"""
+
+import asyncio
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from .enregistrement import ecrire_varint, lire_varint
+from .erreurs import verif_entier_pos
+from .moteur import Moteur
+
+# Types des messages du client
+REJOINDRE = 0x01
+ACTION = 0x02
+
+# Types des messages du serveur
+DEBUT = 0x10
+ETAT = 0x11
+FIN = 0x12
+
+# Indice du gagnant d'une partie où les deux joueurs ont perdu au même tick
+EGALITE = 0xFF
+
+# Drapeaux des parties d'un message ETAT
+_TETRIMINO = 1
+_LIGNES = 2
+_SCORE = 4
+_PERDU = 8
+
+# Décalage de la position x du tetrimino, qui peut être négative
+_DECALAGE_X = 16
+
+_TAILLE = struct.Struct(">H")
+TAILLE_MAX = 0xFFFF
+
+
+def trame(type_message: int, contenu=b"") -> bytes:
+    """
+    Renvoie la trame d'un message
+
+    Args:
+        type_message (int): Le type du message
+        contenu (bytes, optional): Le contenu du message, après son type
+
+    Raises:
+        ValueError: Le message est trop long pour une trame
+
+    Returns:
+        bytes: La trame, prête à être envoyée
+    """
+    if len(contenu) + 1 > TAILLE_MAX:
+        raise ValueError(f"Un message ne peut pas dépasser {TAILLE_MAX} octets")
+
+    return _TAILLE.pack(len(contenu) + 1) + bytes((type_message,)) + contenu
+
+
+async def lire_trame(lecteur: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """
+    Lit la trame suivante d'un flux
+
+    Args:
+        lecteur (asyncio.StreamReader): Le flux à lire
+
+    Raises:
+        asyncio.IncompleteReadError: Le flux se termine avant la fin de la trame
+        ValueError: La trame est vide
+
+    Returns:
+        Tuple[int, bytes]: Le type du message et son contenu
+    """
+    (taille,) = _TAILLE.unpack(await lecteur.readexactly(_TAILLE.size))
+    if taille == 0:
+        raise ValueError("Une trame doit contenir au moins le type du message")
+
+    donnees = await lecteur.readexactly(taille)
+    return donnees[0], donnees[1:]
+
+
+def message_debut(graine: int, joueur: int) -> bytes:
+    """Renvoie la trame du début d'une partie, envoyée à un des joueurs"""
+    contenu = bytearray()
+    ecrire_varint(contenu, graine)
+    contenu.append(joueur)
+    return trame(DEBUT, bytes(contenu))
+
+
+def lire_debut(contenu: bytes) -> Tuple[int, int]:
+    """
+    Lit le contenu d'un message DEBUT
+
+    Raises:
+        ValueError: Le contenu est tronqué
+
+    Returns:
+        Tuple[int, int]: La graine de la partie et l'indice du joueur
+    """
+    graine, position = lire_varint(contenu, 0)
+    if position >= len(contenu):
+        raise ValueError("Le message DEBUT est tronqué")
+
+    return graine, contenu[position]
+
+
+class Suivi:
+    """
+    Représente ce qu'un client sait de la partie d'un joueur, pour ne lui envoyer
+    que ce qui a changé depuis le message précédent.
+    """
+
+    def __init__(self, moteur: Moteur, joueur: int) -> None:
+        """
+        Args:
+            moteur (Moteur): Le moteur de la partie suivie
+            joueur (int): L'indice du joueur, écrit dans les messages
+        """
+        verif_entier_pos("joueur", joueur)
+
+        self.__moteur = moteur
+        self.__joueur = joueur
+        self.__indices = {
+            id(modele): i for i, modele in enumerate(moteur.get_modeles())
+        }
+
+        # Rien n'a encore été envoyé : le premier message contient tout l'état
+        self.__tetrimino: Optional[Tuple[int, int, int, int]] = None
+        self.__empreinte: Optional[int] = None
+        self.__masques: Tuple[int, ...] = (0,) * moteur.get_plateau().forme()[0]
+        self.__score = -1
+        self.__perdu = False
+
+    def delta(self) -> Optional[bytes]:
+        """
+        Renvoie le contenu du message ETAT décrivant les changements de la partie
+        depuis le dernier appel, ou None si rien n'a changé
+
+        Returns:
+            Optional[bytes]: Le contenu du message, sans son type
+        """
+        moteur = self.__moteur
+        drapeaux = 0
+        corps = bytearray()
+
+        tetr = moteur.get_tetrimino()
+        tetr_x, tetr_y = tetr.get_position()
+        tetrimino = (
+            self.__indices[id(moteur.get_modele())],
+            tetr_x + _DECALAGE_X,
+            tetr_y,
+            tetr.get_rotation().value,
+        )
+        if tetrimino != self.__tetrimino:
+            self.__tetrimino = tetrimino
+            drapeaux |= _TETRIMINO
+            corps += bytes(tetrimino)
+
+        # Les lignes ne sont comparées que si l'empreinte du plateau a changé
+        plateau = moteur.get_plateau()
+        empreinte = plateau.empreinte()
+        if empreinte != self.__empreinte:
+            self.__empreinte = empreinte
+            masques = plateau.masques()
+            modifiees = [
+                (indice, masque)
+                for indice, (masque, ancien) in enumerate(zip(masques, self.__masques))
+                if masque != ancien
+            ]
+            self.__masques = masques
+            if modifiees:
+                drapeaux |= _LIGNES
+                corps.append(len(modifiees))
+                for indice, masque in modifiees:
+                    corps.append(indice)
+                    ecrire_varint(corps, masque)
+
+        score = moteur.get_score()
+        if score != self.__score:
+            self.__score = score
+            drapeaux |= _SCORE
+            ecrire_varint(corps, score)
+            ecrire_varint(corps, moteur.get_lignes())
+
+        if moteur.est_perdu() and not self.__perdu:
+            self.__perdu = True
+            drapeaux |= _PERDU
+
+        if not drapeaux:
+            return None
+
+        entete = bytearray((self.__joueur, drapeaux))
+        ecrire_varint(entete, moteur.get_ticks())
+        return bytes(entete + corps)
+
+
+class Vue:
+    """
+    Représente la partie d'un joueur reconstruite par un client à partir des
+    messages ETAT qui la concernent
+    """
+
+    def __init__(self, lignes: int) -> None:
+        """
+        Args:
+            lignes (int): Le nombre total de lignes de la grille
+        """
+        verif_entier_pos("lignes", lignes)
+
+        self.masques: List[int] = [0] * lignes
+        """Les masques des lignes de la grille"""
+        self.tetrimino: Optional[Tuple[int, int, int, int]] = None
+        """L'indice du modèle, la position et la rotation du tetrimino"""
+        self.ticks = 0
+        """Le tick du dernier message reçu"""
+        self.score = 0
+        """Le score du joueur"""
+        self.lignes = 0
+        """Le nombre de lignes effacées par le joueur"""
+        self.perdu = False
+        """True si le joueur a perdu"""
+
+    def appliquer(self, contenu: bytes, position=0) -> None:
+        """
+        Applique le contenu d'un message ETAT, à partir des drapeaux
+
+        Args:
+            contenu (bytes): Le contenu du message
+            position (int, optional): La position des drapeaux dans le contenu
+
+        Raises:
+            ValueError: Le contenu est tronqué
+        """
+        try:
+            drapeaux = contenu[position]
+            self.ticks, position = lire_varint(contenu, position + 1)
+
+            if drapeaux & _TETRIMINO:
+                modele, tetr_x, tetr_y, rotation = contenu[position : position + 4]
+                self.tetrimino = (modele, tetr_x - _DECALAGE_X, tetr_y, rotation)
+                position += 4
+
+            if drapeaux & _LIGNES:
+                nombre = contenu[position]
+                position += 1
+                for _ in range(nombre):
+                    indice = contenu[position]
+                    self.masques[indice], position = lire_varint(contenu, position + 1)
+
+            if drapeaux & _SCORE:
+                self.score, position = lire_varint(contenu, position)
+                self.lignes, position = lire_varint(contenu, position)
+        except (IndexError, ValueError) as erreur:
+            raise ValueError("Le message ETAT est tronqué") from erreur
+
+        if drapeaux & _PERDU:
+            self.perdu = True
+
+
+def appliquer_etat(vues: Dict[int, Vue], contenu: bytes) -> int:
+    """
+    Applique un message ETAT à la vue du joueur qu'il concerne
+
+    Args:
+        vues (Dict[int, Vue]): Les vues, indexées par indice de joueur
+        contenu (bytes): Le contenu du message
+
+    Raises:
+        ValueError: Le contenu est tronqué ou concerne un joueur inconnu
+
+    Returns:
+        int: L'indice du joueur concerné
+    """
+    if not contenu or contenu[0] not in vues:
+        raise ValueError("Le message ETAT ne concerne aucun joueur connu")
+
+    vues[contenu[0]].appliquer(contenu, 1)
+    return contenu[0]
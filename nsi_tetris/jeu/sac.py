@@ -1,22 +1,39 @@
 """Module du sac dans lequel on pioche aléatoirement les tetriminos"""
 
-from typing import List
-from random import shuffle
+from collections import deque
+from itertools import islice
+from random import Random
+from typing import Deque, Iterator, List, Optional, Tuple
 
-from .erreurs import verifier_type
+from .erreurs import verif_entier_pos, verifier_type
 from .tetrimino import Modele
 
 
 class Sac:
-    """Représente le générateur aléatoire de tetriminos"""
+    """
+    Représente le générateur aléatoire de tetriminos.
 
-    def __init__(self, modeles: List[Modele]) -> None:
+    Le sac utilise son propre générateur aléatoire : deux sacs créés avec des générateurs
+    initialisés avec la même graine produisent exactement la même suite de modèles.
+    """
+
+    def __init__(
+        self, modeles: List[Modele], generateur: Optional[Random] = None
+    ) -> None:
         verifier_type("modeles", modeles, list)
         if len(modeles) < 1:
             raise ValueError("Le sac doit contenir au moins 1 type de tetrimino")
 
-        self.__modeles = modeles
-        self.__contenu: List[Modele] = []
+        if generateur is None:
+            generateur = Random()
+
+        verifier_type("generateur", generateur, Random)
+
+        self.__generateur = generateur
+        self.__contenu: Deque[Modele] = deque()
+
+        # Cette liste est mélangée à chaque remplissage, on la crée donc une seule fois
+        self.__suite = modeles.copy()
 
     def remplir(self, quantite: int) -> None:
         """
@@ -37,9 +54,8 @@ class Sac:
         # Tant qu'il n'y a pas assez de modèles dans le sac,
         # on mélange les modèles et on les ajoute au sac
         while len(self.__contenu) < quantite:
-            suite = self.__modeles.copy()
-            shuffle(suite)
-            self.__contenu += suite
+            self.__generateur.shuffle(self.__suite)
+            self.__contenu.extend(self.__suite)
 
     def depiler(self) -> Modele:
         """Renvoie le modèle du prochain tetrimino
@@ -47,5 +63,66 @@ class Sac:
         Returns:
             Modele: Un modèle de tetrimino
         """
-        self.remplir(1)
-        return self.__contenu.pop(0)
+        if not self.__contenu:
+            self.__generateur.shuffle(self.__suite)
+            self.__contenu.extend(self.__suite)
+
+        return self.__contenu.popleft()
+
+    def tirer(self, nombre: int) -> List[Modele]:
+        """
+        Renvoie les modèles des prochains tetriminos, comme le feraient des appels
+        successifs à depiler, mais en générant directement des séries complètes
+
+        Args:
+            nombre (int): Le nombre de modèles à tirer
+
+        Raises:
+            TypeError: Le type de nombre est invalide
+            ValueError: La valeur de nombre est négative
+
+        Returns:
+            List[Modele]: Les prochains modèles, dans l'ordre
+        """
+        verif_entier_pos("nombre", nombre)
+
+        # On commence par vider le contenu actuel du sac
+        contenu = self.__contenu
+        resultat = list(islice(contenu, nombre))
+        for _ in range(len(resultat)):
+            contenu.popleft()
+
+        # Puis on ajoute des séries mélangées jusqu'à en avoir assez
+        while len(resultat) < nombre:
+            self.__generateur.shuffle(self.__suite)
+            resultat += self.__suite
+
+        # Les modèles en trop restent dans le sac
+        contenu.extend(resultat[nombre:])
+        del resultat[nombre:]
+        return resultat
+
+    def __iter__(self) -> Iterator[Modele]:
+        """
+        Renvoie un itérateur infini sur les prochains modèles. Les modèles sont dépilés
+        un par un, l'itérateur peut donc être mélangé avec depiler et apercu.
+        """
+        while True:
+            yield self.depiler()
+
+    def apercu(self, quantite: int) -> Tuple[Modele, ...]:
+        """
+        Renvoie les prochains modèles qui seront piochés, sans les retirer du sac
+
+        Args:
+            quantite (int): Le nombre de modèles, un entier supérieur ou égal à 1
+
+        Raises:
+            TypeError: Le type de quantite est invalide
+            ValueError: La valeur de quantite est inférieure à 1
+
+        Returns:
+            Tuple[Modele, ...]: Les prochains modèles, dans l'ordre où ils seront piochés
+        """
+        self.remplir(quantite)
+        return tuple(islice(self.__contenu, quantite))
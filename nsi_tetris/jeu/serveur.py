@@ -0,0 +1,325 @@
+"""
+Module du serveur des parties multijoueurs, qui fait jouer les parties sans affichage
+et fait autorité sur leur état : les clients n'envoient que leurs actions.
+
+Toutes les parties d'un processus avancent dans une seule boucle cadencée, sans tâche
+par partie. Les messages sont écrits sans attendre les clients : un client qui ne lit
+pas assez vite est déconnecté et perd sa partie.
+
+    python -m nsi_tetris.jeu.serveur --port 7777
+"""
+
+import asyncio
+from argparse import ArgumentParser
+from collections import deque
+from random import Random
+from time import perf_counter
+from typing import Deque, Dict, List, NamedTuple, Optional, Set
+
+from .cadence import Cadence
+from .erreurs import verif_entier_pos
+from .moteur import Action, Moteur
+from .regles import DECHETS, FREQUENCE_LOGIQUE
+from .reseau import (
+    ACTION,
+    EGALITE,
+    ETAT,
+    FIN,
+    REJOINDRE,
+    Suivi,
+    lire_trame,
+    message_debut,
+    trame,
+)
+
+# Le nombre maximal d'actions en attente par joueur, les suivantes sont ignorées
+ACTIONS_MAX = 16
+
+# La taille maximale des données en attente d'envoi vers un client, en octets
+TAMPON_MAX = 256 * 1024
+
+# Les actions que les clients peuvent envoyer : le temps n'avance qu'avec le serveur
+ACTIONS_CLIENT = {
+    action.value: action for action in Action if action is not Action.TICK
+}
+
+
+class Statistiques(NamedTuple):
+    """Représente l'activité du serveur"""
+
+    connexions: int
+    """Le nombre de clients connectés"""
+    parties: int
+    """Le nombre de parties en cours"""
+    terminees: int
+    """Le nombre de parties terminées depuis le démarrage"""
+    ticks: int
+    """Le nombre de ticks joués depuis le démarrage"""
+    duree_tick: float
+    """La durée moyenne d'un tick de toutes les parties, en secondes"""
+
+
+class Joueur:
+    """Représente un client connecté au serveur"""
+
+    def __init__(self, ecrivain: asyncio.StreamWriter) -> None:
+        self.ecrivain = ecrivain
+        """Le flux vers le client"""
+        self.actions: Deque[Action] = deque()
+        """Les actions reçues, jouées au prochain tick"""
+        self.partie: Optional["Partie"] = None
+        """La partie en cours du joueur"""
+
+    def envoyer(self, donnees: bytes) -> bool:
+        """
+        Envoie des données au client sans attendre qu'elles soient transmises
+
+        Args:
+            donnees (bytes): Les données à envoyer
+
+        Returns:
+            bool: False si le client est déconnecté ou ne lit pas assez vite
+        """
+        ecrivain = self.ecrivain
+        if ecrivain.is_closing():
+            return False
+
+        ecrivain.write(donnees)
+        if ecrivain.transport.get_write_buffer_size() > TAMPON_MAX:
+            ecrivain.close()
+            return False
+
+        return True
+
+
+class Partie:
+    """
+    Représente une partie entre deux joueurs. Les deux joueurs reçoivent la même suite
+    de tetriminos, et les lignes effacées sont envoyées à l'adversaire selon DECHETS.
+    """
+
+    def __init__(self, joueurs: List[Joueur], graine: int) -> None:
+        """
+        Args:
+            joueurs (List[Joueur]): Les deux joueurs
+            graine (int): La graine des sacs et de la position des trous des lignes
+        """
+        self.joueurs = joueurs
+        """Les joueurs, dans l'ordre de leurs indices"""
+        self.graine = graine
+        """La graine de la partie"""
+        self.moteurs = [Moteur(graine=graine) for _ in joueurs]
+        """Les moteurs des parties des joueurs"""
+        self.__suivis = [
+            Suivi(moteur, indice) for indice, moteur in enumerate(self.moteurs)
+        ]
+        self.__aleatoire = Random(graine)
+        self.__colonnes = self.moteurs[0].get_plateau().forme()[1]
+
+        for indice, joueur in enumerate(joueurs):
+            joueur.partie = self
+            joueur.actions.clear()
+            joueur.envoyer(message_debut(graine, indice))
+        self.__diffuser()
+
+    def __diffuser(self) -> None:
+        """Envoie aux deux joueurs les changements des deux parties"""
+        for suivi in self.__suivis:
+            contenu = suivi.delta()
+            if contenu is not None:
+                message = trame(ETAT, contenu)
+                for joueur in self.joueurs:
+                    joueur.envoyer(message)
+
+    def avancer(self) -> Optional[int]:
+        """
+        Joue les actions reçues puis fait avancer le temps d'un tick
+
+        Returns:
+            Optional[int]: L'indice du gagnant si la partie est terminée,
+            EGALITE si les deux joueurs ont perdu au même tick, None sinon
+        """
+        moteurs = self.moteurs
+        for indice, (joueur, moteur) in enumerate(zip(self.joueurs, moteurs)):
+            actions = joueur.actions
+            while actions:
+                moteur.jouer(actions.popleft())
+
+            resultat = moteur.jouer(Action.TICK)
+            dechets = DECHETS.get(resultat.lignes, 0)
+            if dechets:
+                trou = self.__aleatoire.randrange(self.__colonnes)
+                moteurs[1 - indice].recevoir_lignes(dechets, trou)
+
+        self.__diffuser()
+
+        perdus = [moteur.est_perdu() for moteur in moteurs]
+        if all(perdus):
+            return EGALITE
+        if any(perdus):
+            return perdus.index(False)
+        return None
+
+
+class Serveur:
+    """
+    Représente le serveur : il associe les clients deux par deux dans l'ordre de leurs
+    demandes, et fait avancer toutes les parties au même rythme.
+    """
+
+    def __init__(
+        self, frequence=FREQUENCE_LOGIQUE, graine: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            frequence (int, optional): Le nombre de ticks par seconde
+            graine (int, optional): La graine qui donne celle de chaque partie
+
+        Raises:
+            TypeError: Le type de frequence est invalide
+            ValueError: frequence est inférieure à 1
+        """
+        self.__cadence = Cadence(frequence)
+        self.__pas = 1 / frequence
+        self.__aleatoire = Random(graine)
+        self.__joueurs: Set[Joueur] = set()
+        self.__attente: Deque[Joueur] = deque()
+        self.__parties: Set[Partie] = set()
+        self.__terminees = 0
+        self.__ticks = 0
+        self.__duree = 0.0
+
+    def statistiques(self) -> Statistiques:
+        """Renvoie l'activité du serveur"""
+        return Statistiques(
+            len(self.__joueurs),
+            len(self.__parties),
+            self.__terminees,
+            self.__ticks,
+            self.__duree / self.__ticks if self.__ticks else 0.0,
+        )
+
+    async def demarrer(self, hote="127.0.0.1", port=0) -> asyncio.AbstractServer:
+        """
+        Commence à accepter les clients. Les parties n'avancent que pendant l'exécution
+        de la méthode executer.
+
+        Args:
+            hote (str, optional): L'adresse d'écoute
+            port (int, optional): Le port d'écoute, choisi par le système par défaut
+
+        Returns:
+            asyncio.AbstractServer: Le serveur asyncio, qui donne le port utilisé
+        """
+        verif_entier_pos("port", port)
+        return await asyncio.start_server(self.__connexion, hote, port)
+
+    async def executer(self) -> None:
+        """Fait avancer toutes les parties au rythme de la cadence, sans fin"""
+        self.__cadence.reinitialiser()
+        while True:
+            debut = perf_counter()
+            for _ in range(self.__cadence.ticks()):
+                self.avancer()
+            self.__duree += perf_counter() - debut
+
+            # On attend le prochain tick, moins le temps passé à jouer celui-ci
+            await asyncio.sleep(max(0.0, self.__pas - (perf_counter() - debut)))
+
+    def avancer(self) -> None:
+        """Fait avancer toutes les parties d'un tick"""
+        self.__ticks += 1
+        terminees: Dict[Partie, int] = {}
+        for partie in self.__parties:
+            gagnant = partie.avancer()
+            if gagnant is not None:
+                terminees[partie] = gagnant
+
+        for partie, gagnant in terminees.items():
+            self.__terminer(partie, gagnant)
+
+    def __terminer(self, partie: Partie, gagnant: int) -> None:
+        """Envoie le résultat d'une partie à ses joueurs, qui peuvent en rejoindre une autre"""
+        self.__parties.discard(partie)
+        self.__terminees += 1
+        message = trame(FIN, bytes((gagnant,)))
+        for joueur in partie.joueurs:
+            joueur.partie = None
+            joueur.envoyer(message)
+
+    def __rejoindre(self, joueur: Joueur) -> None:
+        """Ajoute un joueur à la file d'attente, et commence une partie si possible"""
+        if joueur.partie is not None or joueur in self.__attente:
+            return
+
+        self.__attente.append(joueur)
+        if len(self.__attente) >= 2:
+            joueurs = [self.__attente.popleft(), self.__attente.popleft()]
+            self.__parties.add(Partie(joueurs, self.__aleatoire.getrandbits(32)))
+
+    def __quitter(self, joueur: Joueur) -> None:
+        """Retire un joueur déconnecté, son adversaire gagne la partie"""
+        self.__joueurs.discard(joueur)
+        if joueur in self.__attente:
+            self.__attente.remove(joueur)
+
+        partie = joueur.partie
+        if partie is not None:
+            self.__terminer(partie, 1 - partie.joueurs.index(joueur))
+
+    async def __connexion(
+        self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter
+    ) -> None:
+        """Reçoit les messages d'un client jusqu'à sa déconnexion"""
+        joueur = Joueur(ecrivain)
+        self.__joueurs.add(joueur)
+        try:
+            while not ecrivain.is_closing():
+                type_message, contenu = await lire_trame(lecteur)
+                if type_message == REJOINDRE:
+                    self.__rejoindre(joueur)
+                elif type_message == ACTION and len(contenu) == 1:
+                    action = ACTIONS_CLIENT.get(contenu[0])
+                    if (
+                        action is not None
+                        and joueur.partie is not None
+                        and len(joueur.actions) < ACTIONS_MAX
+                    ):
+                        joueur.actions.append(action)
+                else:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # La boucle s'arrête : asyncio signalerait sinon chaque connexion annulée
+            pass
+        finally:
+            self.__quitter(joueur)
+            ecrivain.close()
+
+
+async def _principal(hote: str, port: int, frequence: int) -> None:
+    serveur = Serveur(frequence)
+    serveur_asyncio = await serveur.demarrer(hote, port)
+    print("Écoute sur", *(s.getsockname() for s in serveur_asyncio.sockets))
+
+    async def afficher_statistiques():
+        while True:
+            await asyncio.sleep(10)
+            print(serveur.statistiques())
+
+    async with serveur_asyncio:
+        await asyncio.gather(serveur.executer(), afficher_statistiques())
+
+
+if __name__ == "__main__":
+    analyseur = ArgumentParser(description="Serveur des parties multijoueurs")
+    analyseur.add_argument("--hote", default="127.0.0.1")
+    analyseur.add_argument("--port", type=int, default=7777)
+    analyseur.add_argument("--frequence", type=int, default=FREQUENCE_LOGIQUE)
+    arguments = analyseur.parse_args()
+
+    try:
+        asyncio.run(_principal(arguments.hote, arguments.port, arguments.frequence))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,162 @@
+"""Module permettant de simuler des parties sans affichage, en parallèle"""
+
+import os
+import sys
+from argparse import ArgumentParser
+from functools import partial
+from multiprocessing import Pool
+from time import perf_counter
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from .erreurs import verif_entier_pos
+from .moteur import Action, Moteur
+
+# Une politique choisit l'action à jouer avant chaque tick, ou None pour ne rien faire
+Politique = Callable[[Moteur], Optional[Action]]
+
+
+class ResultatPartie(NamedTuple):
+    """Représente le résultat d'une partie simulée"""
+
+    graine: int
+    """La graine utilisée pour piocher les tetriminos"""
+    score: int
+    """Le score final"""
+    lignes: int
+    """Le nombre de lignes effacées"""
+    pieces: int
+    """Le nombre de tetriminos apparus"""
+    duree: float
+    """La durée de la simulation en secondes"""
+
+
+def politique_chute(_: Moteur) -> Action:
+    """Politique la plus simple, qui fait tomber chaque tetrimino directement"""
+    return Action.CHUTE
+
+
+def jouer_partie(
+    politique: Politique,
+    graine: int,
+    ticks_max: Optional[int] = None,
+) -> ResultatPartie:
+    """
+    Joue une partie complète sans limiter la vitesse. À chaque étape, l'action choisie
+    par la politique est jouée puis le temps avance d'un tick.
+
+    Args:
+        politique (Politique): La fonction qui choisit les actions
+        graine (int): La graine utilisée pour piocher les tetriminos
+        ticks_max (int, optional): Le nombre de ticks après lequel la partie est arrêtée.
+            Aucune limite par défaut.
+
+    Returns:
+        ResultatPartie: Le résultat de la partie
+    """
+    debut = perf_counter()
+    moteur = Moteur(graine=graine)
+    jouer = moteur.jouer
+    tick = Action.TICK
+    while not moteur.est_perdu():
+        if ticks_max is not None and moteur.get_ticks() >= ticks_max:
+            break
+
+        action = politique(moteur)
+        if action is not None and action is not tick:
+            jouer(action)
+
+        jouer(tick)
+
+    return ResultatPartie(
+        graine,
+        moteur.get_score(),
+        moteur.get_lignes(),
+        moteur.get_pieces(),
+        perf_counter() - debut,
+    )
+
+
+def jouer_parties(
+    politique: Politique,
+    nombre: int,
+    graine=0,
+    processus: Optional[int] = None,
+    ticks_max: Optional[int] = None,
+) -> Iterator[ResultatPartie]:
+    """
+    Joue plusieurs parties en parallèle et renvoie leurs résultats au fur et à mesure
+    qu'elles se terminent (et donc pas forcément dans l'ordre des graines).
+    La politique doit pouvoir être transmise aux autres processus, il doit donc
+    s'agir d'une fonction définie au niveau d'un module.
+
+    Args:
+        politique (Politique): La fonction qui choisit les actions
+        nombre (int): Le nombre de parties à jouer
+        graine (int, optional): La graine de la première partie, les suivantes utilisent
+            les graines suivantes. 0 par défaut.
+        processus (int, optional): Le nombre de processus, par défaut le nombre de cœurs.
+            Avec un seul processus, les parties sont jouées dans le processus actuel.
+        ticks_max (int, optional): Le nombre maximal de ticks par partie
+
+    Raises:
+        TypeError: Le type de nombre, graine ou processus est invalide
+        ValueError: nombre ou graine est négatif, ou processus est inférieur à 1
+
+    Returns:
+        Iterator[ResultatPartie]: Le résultat de chaque partie
+    """
+    # Préconditions, vérifiées dès l'appel et non à la lecture du premier résultat
+    verif_entier_pos("nombre", nombre)
+    verif_entier_pos("graine", graine)
+    if processus is not None:
+        verif_entier_pos("processus", processus)
+        if processus < 1:
+            raise ValueError("Le nombre de processus doit être supérieur ou égal à 1")
+
+    graines = range(graine, graine + nombre)
+    fonction = partial(jouer_partie, politique, ticks_max=ticks_max)
+
+    if processus == 1:
+        return map(fonction, graines)
+
+    if processus is None:
+        processus = os.cpu_count() or 1
+
+    return _jouer_en_parallele(fonction, graines, processus)
+
+
+def _jouer_en_parallele(
+    fonction: Callable[[int], ResultatPartie], graines: range, processus: int
+) -> Iterator[ResultatPartie]:
+    """Joue les parties dans un groupe de processus créé à la lecture du premier résultat"""
+    # Les parties sont envoyées aux processus par lots pour limiter le coût des échanges,
+    # tout en gardant assez de lots pour répartir la charge et recevoir les résultats
+    # au fil de l'eau
+    taille_lots = max(1, len(graines) // (processus * 16))
+
+    with Pool(processus) as groupe:
+        yield from groupe.imap_unordered(fonction, graines, taille_lots)
+
+
+if __name__ == "__main__":
+    analyseur = ArgumentParser(description="Simule des parties sans affichage")
+    analyseur.add_argument("-n", "--nombre", type=int, default=1000)
+    analyseur.add_argument("-g", "--graine", type=int, default=0)
+    analyseur.add_argument("-p", "--processus", type=int, default=None)
+    arguments = analyseur.parse_args()
+
+    _debut = perf_counter()
+    for _resultat in jouer_parties(
+        politique_chute,
+        arguments.nombre,
+        arguments.graine,
+        arguments.processus,
+    ):
+        print(
+            f"graine={_resultat.graine} score={_resultat.score} "
+            f"lignes={_resultat.lignes} pieces={_resultat.pieces} "
+            f"duree={_resultat.duree:.4f}s"
+        )
+
+    _duree = perf_counter() - _debut
+    print(f"{arguments.nombre / _duree:.1f} parties/s", file=sys.stderr)
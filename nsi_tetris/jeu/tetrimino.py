@@ -1,10 +1,9 @@
 """Module définissant les tetriminos"""
 
-from typing import Optional, Tuple, Literal
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Literal
 from enum import Enum
-from pygame.color import Color
 
-from .erreurs import verifier_type
+from .erreurs import erreur_type, verifier_type
 from .tableaux import tourner
 
 # Définition des types permettant de caractériser un tetrimino
@@ -13,7 +12,62 @@ from .tableaux import tourner
 Bit = Literal[0, 1]
 Ligne = Tuple[Bit, ...]
 Forme = Tuple[Ligne, ...]
-Modele = Tuple[Forme, Color]
+
+# La couleur ne sert qu'à l'affichage : il s'agit d'une couleur pygame dans le jeu,
+# mais n'importe quelle valeur peut être utilisée lorsque le jeu tourne sans affichage
+Couleur = Any
+Modele = Tuple[Forme, Couleur]
+
+# Représentation binaire d'une forme, utilisée par le plateau pour les tests de collision.
+# Chaque ligne occupée de la forme est décrite par son indice, son masque (le bit n correspond
+# à la colonne n) et les indices des colonnes occupées.
+# Les limites correspondent aux coordonnées (gauche, haut, droite, bas) des cases occupées.
+LigneBinaire = Tuple[int, int, Tuple[int, ...]]
+Limites = Tuple[int, int, int, int]
+Masques = Tuple[Tuple[LigneBinaire, ...], Limites]
+
+# Les masques ne dépendent que de la forme, on les calcule donc une seule fois par forme
+_CACHE_MASQUES: Dict[Forme, Masques] = {}
+
+
+def masques_forme(forme: Forme) -> Masques:
+    """
+    Renvoie la représentation binaire d'une forme de tetrimino.
+    Le résultat est mis en cache, les appels suivants avec la même forme sont donc gratuits.
+
+    Args:
+        forme (Forme): La forme à convertir
+
+    Returns:
+        Masques: Les lignes binaires de la forme et les limites de ses cases occupées
+    """
+    resultat = _CACHE_MASQUES.get(forme)
+    if resultat is not None:
+        return resultat
+
+    lignes = []
+    colonnes_occupees = []
+    for indice_ligne, ligne in enumerate(forme):
+        colonnes = tuple(colonne for colonne, bit in enumerate(ligne) if bit != 0)
+        if colonnes:
+            masque = sum(1 << colonne for colonne in colonnes)
+            lignes.append((indice_ligne, masque, colonnes))
+            colonnes_occupees += colonnes
+
+    if lignes:
+        limites = (
+            min(colonnes_occupees),
+            lignes[0][0],
+            max(colonnes_occupees),
+            lignes[-1][0],
+        )
+    else:
+        # Une forme vide n'occupe aucune case, ses limites sont donc vides
+        limites = (0, 0, -1, -1)
+
+    resultat = (tuple(lignes), limites)
+    _CACHE_MASQUES[forme] = resultat
+    return resultat
 
 
 class Rotation(Enum):
@@ -35,6 +89,109 @@ class Rotation(Enum):
     SECOND = 3
 
 
+# États obtenus après une rotation, indexés par la valeur de l'état de départ
+_ROTATIONS_HORAIRES = (Rotation.BASE, Rotation.DROITE, Rotation.SECOND, Rotation.GAUCHE)
+_ROTATIONS_ANTIHORAIRES = (
+    Rotation.SECOND,
+    Rotation.GAUCHE,
+    Rotation.BASE,
+    Rotation.DROITE,
+)
+
+
+class EtatRotation(NamedTuple):
+    """Caractéristiques précalculées d'une forme dans un état de rotation donné"""
+
+    forme: Forme
+    """La forme tournée"""
+    cases: Tuple[Tuple[int, int], ...]
+    """Les coordonnées (ligne, colonne) des cases occupées"""
+    limites: Limites
+    """Les coordonnées (gauche, haut, droite, bas) des cases occupées"""
+    masques: Masques
+    """La représentation binaire de la forme"""
+    profil: Tuple[Tuple[int, int], ...]
+    """Pour chaque colonne occupée, son indice et l'indice de sa case occupée la plus basse"""
+    canon: int
+    """
+    La valeur de l'état de référence parmi ceux occupant les mêmes cases à une translation
+    près, c'est-à-dire le premier dans l'ordre des rotations horaires depuis l'état de base
+    (par exemple, les états de base et second du tetrimino S sont équivalents)
+    """
+
+
+# Les quatre états d'une forme sont indexés par la valeur de l'état de rotation
+EtatsRotation = Tuple[EtatRotation, EtatRotation, EtatRotation, EtatRotation]
+
+_TABLE_ROTATIONS: Dict[Forme, EtatsRotation] = {}
+
+
+def rotations(forme: Forme) -> EtatsRotation:
+    """
+    Renvoie les quatre états de rotation d'une forme, indexés par la valeur de Rotation,
+    la forme passée en argument correspondant à l'état de base.
+    Le résultat est mis en cache, les appels suivants avec la même forme sont donc gratuits.
+
+    Args:
+        forme (Forme): La forme de base
+
+    Returns:
+        EtatsRotation: Les états de rotation de la forme
+    """
+    resultat = _TABLE_ROTATIONS.get(forme)
+    if resultat is not None:
+        return resultat
+
+    # On tourne la forme dans le sens horaire à partir de l'état de base
+    formes = {}
+    forme_actuelle = forme
+    rotation = Rotation.BASE
+    for _ in range(4):
+        formes[rotation] = forme_actuelle
+        forme_actuelle = tourner(forme_actuelle)
+        rotation = _ROTATIONS_HORAIRES[rotation.value]
+
+    # Les états sont créés dans l'ordre des rotations horaires depuis l'état de base,
+    # ce qui permet de choisir l'état de référence des états équivalents
+    etats: Dict[Rotation, EtatRotation] = {}
+    canons: Dict[Tuple[Tuple[int, int], ...], int] = {}
+    for rotation, forme_tournee in formes.items():
+        masques = masques_forme(forme_tournee)
+        cases = tuple(
+            (ligne, colonne)
+            for ligne, _, colonnes in masques[0]
+            for colonne in colonnes
+        )
+        profil: Dict[int, int] = {}
+        for ligne, colonne in cases:
+            profil[colonne] = max(profil.get(colonne, ligne), ligne)
+
+        # Les cases ramenées au coin de leurs limites permettent de repérer les états
+        # équivalents par symétrie
+        gauche, haut = masques[1][:2]
+        normalisees = tuple(
+            (ligne - haut, colonne - gauche) for ligne, colonne in cases
+        )
+
+        etats[rotation] = EtatRotation(
+            forme_tournee,
+            cases,
+            masques[1],
+            masques,
+            tuple(sorted(profil.items())),
+            canons.setdefault(normalisees, rotation.value),
+        )
+
+    resultat = (
+        etats[Rotation.GAUCHE],
+        etats[Rotation.BASE],
+        etats[Rotation.DROITE],
+        etats[Rotation.SECOND],
+    )
+    _TABLE_ROTATIONS[forme] = resultat
+    return resultat
+
+
 class Tetrimino:
     """
     Représente un tetrimino.
@@ -62,17 +219,19 @@ class Tetrimino:
             )
 
         # Création des attributs
-        self.__forme, self.__couleur = modele
+        forme, self.__couleur = modele
+        self.__etats = rotations(forme)
         self.__x = x
         self.__y = y
         self.__rotation = Rotation.BASE
+        self.__etat = self.__etats[Rotation.BASE.value]
 
     def __repr__(self) -> str:
         # On commence par le nom de la classe et la position du tetrimino
         resultat = f"Tetrimino({self.__x}, {self.__y})\n"
 
         # On ajoute la forme
-        for ligne in self.__forme:
+        for ligne in self.__etat.forme:
             for bit in ligne:
                 # On choisit le caractère approprié et on le multiplie par deux
                 # pour compenser le fait que les caractères sont plus grands en hauteur
@@ -85,12 +244,24 @@ class Tetrimino:
 
     def get_forme(self) -> Forme:
         """Renvoie la forme du tetrimino"""
-        return self.__forme
+        return self.__etat.forme
 
-    def get_couleur(self) -> Color:
+    def get_couleur(self) -> Couleur:
         """Renvoie la couleur du tetrimino"""
         return self.__couleur
 
+    def get_masques(self) -> Masques:
+        """Renvoie la représentation binaire de la forme actuelle du tetrimino"""
+        return self.__etat.masques
+
+    def get_etat(self) -> EtatRotation:
+        """Renvoie les caractéristiques précalculées de l'état de rotation actuel"""
+        return self.__etat
+
+    def get_etats(self) -> EtatsRotation:
+        """Renvoie les caractéristiques précalculées des quatre états de rotation"""
+        return self.__etats
+
     def get_position(self) -> Tuple[int, int]:
         """Renvoie la position du tetrimino"""
         return self.__x, self.__y
@@ -117,11 +288,13 @@ class Tetrimino:
             TypeError: Le type de y est invalide
         """
         if x is not None:
-            verifier_type("x", x, int)
+            if __debug__ and not isinstance(x, int):
+                raise erreur_type("x", x, int)
             self.__x = x
 
         if y is not None:
-            verifier_type("y", y, int)
+            if __debug__ and not isinstance(y, int):
+                raise erreur_type("y", y, int)
             self.__y = y
 
     def tourner(self, sens_horaire=True) -> None:
@@ -132,8 +305,26 @@ class Tetrimino:
             sens_horaire (bool, optional): Le sens de rotation, où True correspond au sens \
                 des aiguilles d'une montre et False au sens inverse.
         """
-        self.__forme = tourner(self.__forme, sens_horaire)
+        # Les formes tournées sont précalculées, il suffit donc de changer d'état
+        if sens_horaire:
+            self.__rotation = _ROTATIONS_HORAIRES[self.__rotation.value]
+        else:
+            self.__rotation = _ROTATIONS_ANTIHORAIRES[self.__rotation.value]
+
+        self.__etat = self.__etats[self.__rotation.value]
+
+    def set_rotation(self, rotation: Rotation) -> None:
+        """
+        Modifie directement l'état de rotation du tetrimino
+
+        Args:
+            rotation (Rotation): Le nouvel état de rotation
+
+        Raises:
+            TypeError: Le type de rotation est invalide
+        """
+        if __debug__ and not isinstance(rotation, Rotation):
+            raise erreur_type("rotation", rotation, Rotation)
 
-        # Astuce pour modifier l'état de rotation simplement à l'aide de valeurs numériques
-        k = -1 if sens_horaire else 1
-        self.__rotation = Rotation((self.__rotation.value - k) % 4)
+        self.__rotation = rotation
+        self.__etat = self.__etats[rotation.value]
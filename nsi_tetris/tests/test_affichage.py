@@ -0,0 +1,152 @@
+"""Module contenant les tests du module affichage"""
+
+import os
+import unittest
+
+# Les surfaces sont dessinées sans fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+from pygame.color import Color
+
+from nsi_tetris.jeu.affichage import (
+    CacheSprites,
+    CacheTextes,
+    afficher_profil,
+    afficher_texte,
+)
+from nsi_tetris.jeu.constantes import MODELES_TETRIMINOS
+from nsi_tetris.jeu.profilage import PHASES, Profileur
+from nsi_tetris.jeu.tetrimino import Tetrimino
+
+
+def setUpModule():
+    # Seules les polices sont nécessaires : initialiser tout pygame démarre des fils
+    # d'exécution qui bloquent les processus créés ensuite par les autres tests
+    pygame.font.init()
+
+
+class TestCacheSprites(unittest.TestCase):
+    """Tests de la classe CacheSprites"""
+
+    def test_partage(self):
+        """Vérifie qu'un même tetrimino n'est dessiné qu'une fois"""
+        cache = CacheSprites()
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["T"])
+        surface = cache.obtenir(tetrimino)
+        self.assertIs(cache.obtenir(Tetrimino(MODELES_TETRIMINOS["T"], 5, 5)), surface)
+        self.assertIsNot(cache.obtenir(tetrimino, 100), surface)
+        self.assertEqual(len(cache), 2)
+
+        tetrimino.tourner()
+        self.assertIsNot(cache.obtenir(tetrimino), surface)
+        self.assertEqual(len(cache), 3)
+
+    def test_eviction(self):
+        """Vérifie que la surface utilisée le moins récemment est supprimée"""
+        cache = CacheSprites(2)
+        i, o, t = (Tetrimino(MODELES_TETRIMINOS[nom]) for nom in "IOT")
+        surface_i = cache.obtenir(i)
+        surface_o = cache.obtenir(o)
+
+        # I est utilisé à nouveau, c'est donc O qui est supprimé à l'ajout de T
+        self.assertIs(cache.obtenir(i), surface_i)
+        cache.obtenir(t)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.obtenir(i), surface_i)
+        self.assertIsNot(cache.obtenir(o), surface_o)
+
+    def test_taille_case(self):
+        """Vérifie que changer la taille des cases invalide les surfaces"""
+        cache = CacheSprites(taille_case=10)
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["O"])
+        surface = cache.obtenir(tetrimino)
+
+        cache.set_taille_case(10)
+        self.assertIs(cache.obtenir(tetrimino), surface)
+
+        cache.set_taille_case(20)
+        self.assertEqual(cache.get_taille_case(), 20)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(
+            cache.obtenir(tetrimino).get_size(),
+            (surface.get_width() * 2, surface.get_height() * 2),
+        )
+
+    def test_erreurs(self):
+        """Vérifie que la classe lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            CacheSprites("test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            CacheSprites().set_taille_case(-1)
+
+
+class TestCacheTextes(unittest.TestCase):
+    """Tests de la classe CacheTextes"""
+
+    def test_partage(self):
+        """Vérifie qu'un texte qui ne change pas n'est dessiné qu'une fois"""
+        cache = CacheTextes()
+        surface = cache.obtenir("Score: 0", 24)
+        self.assertIs(cache.obtenir("Score: 0", 24), surface)
+        self.assertIsNot(cache.obtenir("Score: 0", 48), surface)
+        self.assertIsNot(cache.obtenir("Score: 0", 24, Color("black")), surface)
+        self.assertIs(cache.police(24), cache.police(24))
+        self.assertEqual(len(cache), 3)
+
+    def test_eviction(self):
+        """Vérifie que la surface utilisée le moins récemment est supprimée"""
+        cache = CacheTextes(2)
+        surface_zero = cache.obtenir("Score: 0", 24)
+        surface_cent = cache.obtenir("Score: 100", 24)
+
+        # Le score 0 est utilisé à nouveau, c'est donc le score 100 qui est supprimé
+        self.assertIs(cache.obtenir("Score: 0", 24), surface_zero)
+        cache.obtenir("Score: 200", 24)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.obtenir("Score: 0", 24), surface_zero)
+        self.assertIsNot(cache.obtenir("Score: 100", 24), surface_cent)
+
+    def test_invalider(self):
+        """Vérifie que l'invalidation supprime les polices et les surfaces"""
+        cache = CacheTextes()
+        police = cache.police(24)
+        cache.obtenir("Score: 0", 24)
+
+        cache.invalider()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNot(cache.police(24), police)
+
+    def test_afficher_texte(self):
+        """Vérifie que le texte du score affiché à chaque image provient du cache"""
+        surface = afficher_texte("Score: 40  Niveau: 1", 24)
+        self.assertIs(afficher_texte("Score: 40  Niveau: 1", 24), surface)
+
+        with self.assertRaises(TypeError):
+            afficher_texte("Score: 40", 24, (0, 0, 0))  # type: ignore
+
+        with self.assertRaises(ValueError):
+            afficher_texte("Score: 40", -1)
+
+
+class TestAfficherProfil(unittest.TestCase):
+    """Tests de la fonction afficher_profil"""
+
+    def test_resultat(self):
+        """Vérifie qu'une ligne est dessinée par phase, plus l'image et le budget"""
+        surface = afficher_profil(Profileur(), 14)
+        police = pygame.font.Font(pygame.font.get_default_font(), 14)
+        self.assertEqual(
+            surface.get_height(), police.get_linesize() * (len(PHASES) + 2)
+        )
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            afficher_profil("test")  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Module contenant les tests du module archive"""
+
+import os
+import tempfile
+import unittest
+
+from nsi_tetris.jeu.archive import Archive, LecteurArchive, chemin_index
+from nsi_tetris.jeu.enregistrement import reprendre
+from nsi_tetris.tests.test_enregistrement import partie_enregistree
+
+
+class TestArchive(unittest.TestCase):
+    """Tests de l'écriture et de la lecture d'une archive"""
+
+    def setUp(self):
+        dossier = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(dossier.cleanup)
+        self.chemin = os.path.join(dossier.name, "parties.nta")
+
+    def test_enregistrements(self):
+        """Vérifie que les parties ajoutées sont relues à l'identique"""
+        parties = [partie_enregistree(graine, 200) for graine in range(3)]
+        with Archive(self.chemin) as archive:
+            for numero, donnees in enumerate(parties[:2]):
+                self.assertEqual(archive.ajouter(donnees), numero)
+
+        with Archive(self.chemin) as archive:
+            self.assertEqual(len(archive), 2)
+            archive.ajouter(parties[2])
+
+        with LecteurArchive(self.chemin) as lecteur:
+            self.assertEqual(len(lecteur), 3)
+            for numero, donnees in enumerate(parties):
+                self.assertEqual(lecteur.enregistrement(numero), donnees)
+
+            with self.assertRaises(IndexError):
+                lecteur.enregistrement(3)
+
+    def test_moteur(self):
+        """Vérifie que la partie est reprise au bon tick"""
+        donnees = partie_enregistree(5, 800)
+        with Archive(self.chemin) as archive:
+            archive.ajouter(donnees)
+
+        with LecteurArchive(self.chemin) as lecteur:
+            for tick in (0, 100, 450, 799):
+                self.assertEqual(
+                    lecteur.moteur(0, tick).etat(), reprendre(donnees, tick).etat()
+                )
+
+    def test_index_partiel(self):
+        """Vérifie qu'une position incomplète à la fin de l'index est supprimée"""
+        parties = [partie_enregistree(graine, 200) for graine in range(2)]
+        with Archive(self.chemin) as archive:
+            archive.ajouter(parties[0])
+
+        with open(chemin_index(self.chemin), "ab") as index:
+            index.write(b"\x00\x01\x02")
+
+        with Archive(self.chemin) as archive:
+            self.assertEqual(len(archive), 1)
+            self.assertEqual(archive.ajouter(parties[1]), 1)
+
+        with LecteurArchive(self.chemin) as lecteur:
+            self.assertEqual(len(lecteur), 2)
+            self.assertEqual(lecteur.enregistrement(1), parties[1])
+
+    def test_erreurs(self):
+        """Vérifie qu'un fichier qui n'est pas une archive est refusé"""
+        with open(self.chemin, "wb") as fichier:
+            fichier.write(b"test")
+
+        with self.assertRaises(ValueError):
+            LecteurArchive(self.chemin)
+
+
+if __name__ == "__main__":
+    unittest.main()
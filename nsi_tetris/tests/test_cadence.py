@@ -0,0 +1,83 @@
+"""Module contenant les tests du module cadence"""
+
+import unittest
+
+from nsi_tetris.jeu.cadence import Cadence
+
+
+class Horloge:
+    """Horloge contrôlée par les tests"""
+
+    def __init__(self) -> None:
+        self.temps = 0.0
+
+    def __call__(self) -> float:
+        return self.temps
+
+
+class TestConstructeur(unittest.TestCase):
+    """Tests du constructeur"""
+
+    def test_erreurs(self):
+        """Vérifie que le constructeur renvoie les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Cadence("test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Cadence(0)
+
+        with self.assertRaises(ValueError):
+            Cadence(60, 0)
+
+
+class TestTicks(unittest.TestCase):
+    """Tests de la méthode ticks"""
+
+    def test_pas_fixe(self):
+        """Vérifie que le nombre de ticks dépend du temps écoulé et non des appels"""
+        horloge = Horloge()
+        cadence = Cadence(8, horloge=horloge)
+
+        horloge.temps = 0.0625
+        self.assertEqual(cadence.ticks(), 0)
+
+        horloge.temps = 0.4375
+        self.assertEqual(cadence.ticks(), 3)
+
+        horloge.temps = 1.0
+        self.assertEqual(cadence.ticks(), 5)
+
+    def test_rattrapage(self):
+        """Vérifie que le retard au delà du rattrapage maximal est abandonné"""
+        horloge = Horloge()
+        cadence = Cadence(4, 4, horloge)
+
+        horloge.temps = 10.0
+        self.assertEqual(cadence.ticks(), 4)
+
+        horloge.temps = 10.25
+        self.assertEqual(cadence.ticks(), 1)
+
+    def test_illimitee(self):
+        """Vérifie qu'une cadence illimitée ne dépend pas de l'horloge"""
+        cadence = Cadence(None, 100, lambda: 0.0)
+        self.assertIsNone(cadence.get_frequence())
+        self.assertEqual(cadence.ticks(), 100)
+        self.assertEqual(cadence.ticks(), 100)
+
+
+class TestReinitialiser(unittest.TestCase):
+    """Tests de la méthode reinitialiser"""
+
+    def test_fonctionnement(self):
+        """Vérifie que le temps écoulé avant la réinitialisation est oublié"""
+        horloge = Horloge()
+        cadence = Cadence(10, horloge=horloge)
+
+        horloge.temps = 0.5
+        cadence.reinitialiser()
+        self.assertEqual(cadence.ticks(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
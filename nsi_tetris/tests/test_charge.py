@@ -0,0 +1,28 @@
+"""Module contenant les tests du module charge"""
+
+import asyncio
+import unittest
+
+from nsi_tetris.jeu.charge import charger
+
+
+class TestCharger(unittest.TestCase):
+    """Tests de la fonction charger"""
+
+    def test_local(self):
+        """Vérifie qu'un test de charge court se déroule sans erreur"""
+        rapport = asyncio.run(charger("127.0.0.1", 0, 3, 0.5, 50.0, local=True))
+        self.assertEqual(rapport.clients, 6)
+        self.assertEqual(rapport.erreurs, 0)
+        self.assertGreaterEqual(rapport.parties, 6)
+        self.assertGreater(rapport.messages_par_seconde, 0)
+        self.assertGreater(rapport.actions_par_seconde, 0)
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            asyncio.run(charger("127.0.0.1", 0, "", 0.5))  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
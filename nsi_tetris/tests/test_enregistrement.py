@@ -0,0 +1,163 @@
+"""Module contenant les tests du module enregistrement"""
+
+import unittest
+
+from nsi_tetris.jeu.enregistrement import (
+    Enregistreur,
+    ecrire_varint,
+    lire,
+    lire_varint,
+    rejouer,
+    reprendre,
+)
+from nsi_tetris.jeu.ia import Autojoueur
+from nsi_tetris.jeu.moteur import Action, Moteur
+
+
+def partie_enregistree(graine: int, ticks: int, intervalle=100) -> bytes:
+    """
+    Joue une partie avec l'autojoueur en enregistrant ses actions
+
+    Args:
+        graine (int): La graine de la partie
+        ticks (int): Le nombre de ticks à jouer
+        intervalle (int, optional): Le nombre de ticks entre deux instantanés
+
+    Returns:
+        bytes: L'enregistrement de la partie
+    """
+    moteur = Moteur(graine=graine)
+    enregistreur = Enregistreur(graine, intervalle=intervalle)
+    joueur = Autojoueur(budget=0)
+    while moteur.get_ticks() < ticks and not moteur.est_perdu():
+        action = joueur(moteur)
+        if action is not None and action is not Action.TICK:
+            enregistreur.ajouter(moteur.get_ticks(), action)
+            moteur.jouer(action)
+        moteur.jouer(Action.TICK)
+        enregistreur.suivre(moteur)
+
+    return enregistreur.terminer(moteur)
+
+
+class TestVarint(unittest.TestCase):
+    """Tests des fonctions ecrire_varint et lire_varint"""
+
+    def test_aller_retour(self):
+        """Vérifie que les entiers écrits sont relus à l'identique"""
+        tampon = bytearray()
+        valeurs = [0, 1, 127, 128, 300, 1 << 40]
+        for valeur in valeurs:
+            ecrire_varint(tampon, valeur)
+
+        self.assertEqual(len(tampon), 1 + 1 + 1 + 2 + 2 + 6)
+
+        position = 0
+        for valeur in valeurs:
+            lue, position = lire_varint(tampon, position)
+            self.assertEqual(lue, valeur)
+
+    def test_erreurs(self):
+        """Vérifie qu'un entier tronqué est détecté"""
+        with self.assertRaises(ValueError):
+            lire_varint(b"\x80", 0)
+
+
+class TestAjouter(unittest.TestCase):
+    """Tests de la méthode ajouter"""
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        enregistreur = Enregistreur(0)
+        with self.assertRaises(TypeError):
+            enregistreur.ajouter(0, "")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            enregistreur.ajouter(0, Action.TICK)
+
+        enregistreur.ajouter(5, Action.GAUCHE)
+        with self.assertRaises(ValueError):
+            enregistreur.ajouter(4, Action.GAUCHE)
+
+    def test_taille(self):
+        """Vérifie qu'une action rapprochée n'occupe que deux octets"""
+        enregistreur = Enregistreur(0)
+        taille = len(enregistreur)
+        enregistreur.ajouter(100, Action.CHUTE)
+        self.assertEqual(len(enregistreur), taille + 2)
+
+
+class TestLire(unittest.TestCase):
+    """Tests de la fonction lire"""
+
+    def test_resultat(self):
+        """Vérifie que le contenu de l'enregistrement est relu"""
+        moteur = Moteur(graine=3)
+        enregistreur = Enregistreur(3)
+        enregistreur.ajouter(0, Action.GAUCHE)
+        enregistreur.ajouter(2, Action.CHUTE)
+        moteur.jouer(Action.TICK)
+        moteur.jouer(Action.TICK)
+
+        enregistrement = lire(enregistreur.terminer(moteur))
+        self.assertEqual(enregistrement.graine, 3)
+        self.assertEqual(
+            enregistrement.actions, [(0, Action.GAUCHE), (2, Action.CHUTE)]
+        )
+
+    def test_erreurs(self):
+        """Vérifie que des données invalides sont détectées"""
+        with self.assertRaises(ValueError):
+            lire(b"test")
+
+        donnees = Enregistreur(0).terminer(Moteur(graine=0))
+        with self.assertRaises(ValueError):
+            lire(donnees[:-1])
+
+
+class TestRejouer(unittest.TestCase):
+    """Tests de la fonction rejouer"""
+
+    def test_fonctionnement(self):
+        """Vérifie qu'une partie rejouée donne le même résultat"""
+        donnees = partie_enregistree(7, 3000)
+        enregistrement = lire(donnees)
+        self.assertGreater(enregistrement.score, 0)
+
+        moteur = rejouer(donnees)
+        self.assertEqual(moteur.get_score(), enregistrement.score)
+        self.assertEqual(moteur.get_ticks(), enregistrement.ticks)
+
+    def test_erreurs(self):
+        """Vérifie qu'un enregistrement modifié est détecté"""
+        donnees = bytearray(partie_enregistree(7, 500))
+        donnees[-1] ^= 1
+        with self.assertRaises(ValueError):
+            rejouer(bytes(donnees))
+
+
+class TestReprendre(unittest.TestCase):
+    """Tests de la fonction reprendre"""
+
+    def test_instantanes(self):
+        """Vérifie que reprendre depuis un instantané donne le même état"""
+        donnees = partie_enregistree(3, 1000)
+        instantanes = lire(donnees).instantanes
+        self.assertEqual([tick for tick, _ in instantanes][:3], [100, 200, 300])
+
+        for tick in (150, 300, 999):
+            instantane = max(i for i in instantanes if i[0] <= tick)
+            self.assertEqual(
+                reprendre(donnees, tick, instantane).etat(),
+                reprendre(donnees, tick).etat(),
+            )
+
+    def test_erreurs(self):
+        """Vérifie qu'un instantané postérieur au tick demandé est refusé"""
+        donnees = partie_enregistree(3, 300)
+        with self.assertRaises(ValueError):
+            reprendre(donnees, 50, lire(donnees).instantanes[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
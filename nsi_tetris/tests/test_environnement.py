@@ -0,0 +1,176 @@
+"""Module contenant les tests du module environnement"""
+
+import unittest
+
+import numpy as np
+
+from nsi_tetris.jeu.environnement import Environnement, EnvironnementLot
+from nsi_tetris.jeu.moteur import Action
+
+
+def cases_occupees(environnement: Environnement) -> np.ndarray:
+    """Renvoie les cases occupées du plateau, calculées à partir de sa grille"""
+    grille = environnement.get_moteur().get_plateau().grille()
+    return np.array([[case is not None for case in ligne] for ligne in grille])
+
+
+class TestReset(unittest.TestCase):
+    """Tests de la méthode reset"""
+
+    def test_observation(self):
+        """Vérifie la forme et le contenu de l'observation initiale"""
+        environnement = Environnement(apercu=3)
+        observation, infos = environnement.reset(4)
+        moteur = environnement.get_moteur()
+        modeles = moteur.get_modeles()
+
+        self.assertEqual(infos["graine"], 4)
+        self.assertEqual(observation.plateau.shape, moteur.get_plateau().forme())
+        self.assertFalse(observation.plateau.any())
+        self.assertEqual(
+            list(observation.tetrimino),
+            [
+                modeles.index(moteur.get_modele()),
+                *moteur.get_tetrimino().get_position(),
+                moteur.get_tetrimino().get_rotation().value,
+            ],
+        )
+        self.assertEqual(
+            [modeles[i] for i in observation.apercu],
+            list(moteur.get_sac().apercu(3)),
+        )
+
+    def test_graine(self):
+        """Vérifie qu'une même graine donne la même partie"""
+        environnement = Environnement()
+        premiere, _ = environnement.reset(7)
+        environnement.step(Action.CHUTE.value)
+        seconde, _ = environnement.reset(7)
+        for tableau_a, tableau_b in zip(premiere, seconde):
+            np.testing.assert_array_equal(tableau_a, tableau_b)
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Environnement().reset("test")  # type: ignore
+
+
+class TestStep(unittest.TestCase):
+    """Tests de la méthode step"""
+
+    def test_plateau(self):
+        """Vérifie que le plateau observé suit les tetriminos verrouillés"""
+        environnement = Environnement()
+        environnement.reset(0)
+        perdu = False
+        while not perdu:
+            observation, _, perdu, tronque, _ = environnement.step(Action.CHUTE.value)
+            self.assertFalse(tronque)
+            np.testing.assert_array_equal(
+                observation.plateau, cases_occupees(environnement)
+            )
+
+        self.assertTrue(environnement.get_moteur().est_perdu())
+
+    def test_recompense(self):
+        """Vérifie que la récompense est le nombre de points gagnés"""
+        environnement = Environnement()
+        environnement.reset(1)
+        total = 0.0
+        for action in np.random.default_rng(1).integers(0, 7, 5000):
+            _, recompense, perdu, _, infos = environnement.step(int(action))
+            total += recompense
+            self.assertEqual(total, infos["score"])
+            if perdu:
+                break
+
+    def test_tronque(self):
+        """Vérifie qu'une partie est interrompue après ticks_max ticks"""
+        environnement = Environnement(ticks_max=3)
+        environnement.reset(0)
+        self.assertFalse(environnement.step(Action.TICK.value)[3])
+        self.assertFalse(environnement.step(Action.TICK.value)[3])
+        self.assertTrue(environnement.step(Action.TICK.value)[3])
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        environnement = Environnement()
+        for action in (-1, len(Action)):
+            with self.assertRaises(ValueError):
+                environnement.step(action)
+
+        with self.assertRaises(ValueError):
+            Environnement(apercu=0)
+
+
+class TestStepBatch(unittest.TestCase):
+    """Tests de la méthode step_batch"""
+
+    def test_parties(self):
+        """Vérifie que chaque partie du lot se déroule comme une partie seule"""
+        lot = EnvironnementLot(3, ticks_max=400)
+        observations, infos = lot.reset(10)
+        np.testing.assert_array_equal(infos["graine"], [10, 11, 12])
+        self.assertEqual(observations.apercu.shape, (3, 5))
+
+        seules = [Environnement(ticks_max=400) for _ in range(3)]
+        for graine, environnement in enumerate(seules, 10):
+            environnement.reset(graine)
+
+        # Les parties seules ne sont comparées que jusqu'à leur fin
+        terminees = set()
+        actions = np.random.default_rng(2).integers(0, 7, (500, 3))
+        for ligne in actions:
+            observations, recompenses, perdues, tronquees, _ = lot.step_batch(ligne)
+            for indice, environnement in enumerate(seules):
+                if indice in terminees:
+                    continue
+
+                attendu = environnement.step(int(ligne[indice]))
+                self.assertEqual(recompenses[indice], attendu[1])
+                self.assertEqual(perdues[indice], attendu[2])
+                self.assertEqual(tronquees[indice], attendu[3])
+                if attendu[2] or attendu[3]:
+                    terminees.add(indice)
+                else:
+                    np.testing.assert_array_equal(
+                        observations.plateau[indice], attendu[0].plateau
+                    )
+                    np.testing.assert_array_equal(
+                        observations.tetrimino[indice], attendu[0].tetrimino
+                    )
+
+        self.assertEqual(terminees, {0, 1, 2})
+
+    def test_nouvelle_partie(self):
+        """Vérifie qu'une partie terminée est remplacée par la graine suivante"""
+        lot = EnvironnementLot(2)
+        lot.reset(0)
+        chute = [Action.CHUTE.value] * 2
+        while True:
+            observations, _, perdues, _, infos = lot.step_batch(chute)
+            if perdues.any():
+                break
+
+        indice = int(np.argmax(perdues))
+        self.assertEqual(lot.get_moteurs()[indice].get_graine(), 2)
+        self.assertFalse(observations.plateau[indice].any())
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        lot = EnvironnementLot(2)
+        with self.assertRaises(ValueError):
+            lot.step_batch([0])
+
+        with self.assertRaises(ValueError):
+            lot.step_batch([0, 7])
+
+        with self.assertRaises(ValueError):
+            EnvironnementLot(0)
+
+        with self.assertRaises(ValueError):
+            EnvironnementLot(2, apercu=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
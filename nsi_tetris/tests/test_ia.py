@@ -0,0 +1,111 @@
+"""Module contenant les tests du module ia"""
+
+import unittest
+
+from nsi_tetris.jeu.ia import Autojoueur, Poids, chemin, evaluer
+from nsi_tetris.jeu.moteur import Action, Moteur
+from nsi_tetris.jeu.plateau import Placement, Plateau
+from nsi_tetris.jeu.regles import MODELES_NOMMES
+from nsi_tetris.jeu.simulation import jouer_partie
+from nsi_tetris.jeu.tetrimino import Rotation, Tetrimino
+
+
+class TestEvaluer(unittest.TestCase):
+    """Tests de la fonction evaluer"""
+
+    def test_resultat(self):
+        """Vérifie le calcul de chaque critère de l'heuristique"""
+        plateau = Plateau(2, 4)
+        tetrimino = Tetrimino(MODELES_NOMMES["T"], 0, 9)
+        tetrimino.tourner()
+        tetrimino.tourner()
+        plateau.verrouiller(tetrimino)
+
+        # Le T retourné laisse deux trous et des colonnes de hauteurs 2, 2, 2, 0
+        self.assertEqual(evaluer(plateau, 0, Poids(1, 0, 0, 0)), 6)
+        self.assertEqual(evaluer(plateau, 0, Poids(0, 0, 1, 0)), 2)
+        self.assertEqual(evaluer(plateau, 0, Poids(0, 0, 0, 1)), 2)
+        self.assertEqual(evaluer(plateau, 3, Poids(0, 1, 0, 0)), 3)
+
+
+class TestChemin(unittest.TestCase):
+    """Tests de la fonction chemin"""
+
+    def test_direct(self):
+        """Vérifie le chemin vers une position accessible par une simple chute"""
+        plateau = Plateau()
+        tetrimino = Tetrimino(MODELES_NOMMES["L"], 3, 8)
+        actions = chemin(plateau, tetrimino, Placement(Rotation.GAUCHE, 0, 27))
+        self.assertEqual(
+            actions,
+            [
+                Action.TOURNER_ANTIHORAIRE,
+                Action.GAUCHE,
+                Action.GAUCHE,
+                Action.GAUCHE,
+                Action.CHUTE,
+            ],
+        )
+
+    def test_glissement(self):
+        """Vérifie le chemin vers une position située sous une case occupée"""
+        moteur = Moteur([MODELES_NOMMES["O"]], lignes=4, colonnes=6)
+        plateau = moteur.get_plateau()
+        bloc = Tetrimino(MODELES_NOMMES["O"], 1, 9)
+        plateau.verrouiller(bloc)
+
+        tetrimino = moteur.get_tetrimino()
+        placement = Placement(Rotation.BASE, 1, 11)
+        self.assertIn(placement, plateau.placements(tetrimino))
+
+        actions = chemin(plateau, tetrimino, placement)
+        self.assertEqual(actions[-1], Action.CHUTE)
+        for action in actions[:-1]:
+            moteur.jouer(action)
+            if action is Action.DESCENDRE:
+                moteur.jouer(Action.TICK)
+
+        self.assertEqual(tetrimino.get_position(), (1, 11))
+
+    def test_inaccessible(self):
+        """Vérifie qu'une position inaccessible ne donne aucun chemin"""
+        plateau = Plateau()
+        tetrimino = Tetrimino(MODELES_NOMMES["O"], 3, 8)
+        self.assertIsNone(chemin(plateau, tetrimino, Placement(Rotation.BASE, 3, 2)))
+
+
+class TestAutojoueur(unittest.TestCase):
+    """Tests de la classe Autojoueur"""
+
+    def test_erreurs(self):
+        """Vérifie que le constructeur lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Autojoueur(poids=(1, 2, 3, 4))  # type: ignore
+
+        with self.assertRaises(TypeError):
+            Autojoueur(budget="1")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Autojoueur(largeur=0)
+
+        with self.assertRaises(ValueError):
+            Autojoueur(budget=-1)
+
+    def test_choisir(self):
+        """Vérifie que le joueur complète une ligne lorsque c'est possible"""
+        plateau = Plateau(2, 4)
+        plateau.verrouiller(Tetrimino(MODELES_NOMMES["O"], -1, 9))
+        plateau.verrouiller(Tetrimino(MODELES_NOMMES["O"], 1, 9))
+
+        tetrimino = Tetrimino(MODELES_NOMMES["I"], 0, 0)
+        placement = Autojoueur().choisir(plateau, tetrimino)
+        self.assertEqual(placement, Placement(Rotation.BASE, 0, 8))
+
+    def test_partie(self):
+        """Vérifie que le joueur efface des lignes au cours d'une partie"""
+        resultat = jouer_partie(Autojoueur(), 0, ticks_max=300)
+        self.assertGreater(resultat.lignes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
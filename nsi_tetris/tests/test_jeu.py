@@ -0,0 +1,185 @@
+"""Module contenant les tests du module jeu"""
+
+import os
+import random
+import unittest
+
+# Le jeu est affiché sans fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from nsi_tetris.jeu.constantes import TAILLE_FENETRE
+from nsi_tetris.jeu.ia import Autojoueur
+from nsi_tetris.jeu.jeu import TOUCHES, Jeu, fusionner
+from nsi_tetris.jeu.profilage import AFFICHER_TETRIMINO, AVANCER, DESSINER, Profileur
+
+
+def setUpModule():
+    # Seules les polices sont nécessaires : initialiser tout pygame démarre des fils
+    # d'exécution qui bloquent les processus créés ensuite par les autres tests
+    pygame.font.init()
+
+
+class TestAfficher(unittest.TestCase):
+    """Tests de la méthode afficher"""
+
+    def test_partiel(self):
+        """Vérifie que l'affichage partiel donne la même image qu'un affichage complet"""
+        aleatoire = random.Random(1)
+        random.seed(1)
+        touches = {action: touche for touche, action in TOUCHES.items()}
+
+        surface = Surface(TAILLE_FENETRE)
+        reference = Surface(TAILLE_FENETRE)
+        jeu = Jeu()
+        # L'autojoueur efface des lignes bien plus souvent que des touches au hasard
+        # pylint: disable=protected-access
+        moteur = jeu._Jeu__moteur  # type: ignore
+        joueur = Autojoueur(budget=0)
+        for image in range(1500):
+            evenements = []
+            if aleatoire.random() < 0.01:
+                touche = pygame.K_ESCAPE
+            else:
+                touche = touches.get(joueur(moteur))
+            if touche is not None:
+                evenements.append(pygame.event.Event(pygame.KEYDOWN, key=touche))
+            jeu.avancer(evenements, aleatoire.randint(0, 3))
+            moteur = jeu._Jeu__moteur  # type: ignore
+
+            jeu.afficher(surface, True)
+
+            # L'affichage complet sur une autre surface force l'image suivante
+            # à être complète, on ne compare donc qu'une image sur dix
+            if image % 10 == 9:
+                jeu.afficher(reference)
+                self.assertEqual(
+                    pygame.image.tobytes(surface, "RGB"),
+                    pygame.image.tobytes(reference, "RGB"),
+                    f"image {image}",
+                )
+
+    def test_complet(self):
+        """Vérifie que l'affichage complet renvoie toute la surface"""
+        surface = Surface(TAILLE_FENETRE)
+        jeu = Jeu()
+        self.assertEqual(jeu.afficher(surface, True), [surface.get_rect()])
+        self.assertEqual(jeu.afficher(surface), [surface.get_rect()])
+
+        # Sans modification, aucune zone n'est redessinée
+        self.assertEqual(jeu.afficher(surface, True), [])
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Jeu().afficher("test")  # type: ignore
+
+
+class TestAvancer(unittest.TestCase):
+    """Tests de la méthode avancer"""
+
+    def test_pause(self):
+        """Vérifie que la touche échap met le jeu en pause et le reprend"""
+        jeu = Jeu()
+        echap = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)]
+        self.assertFalse(jeu.est_en_pause())
+
+        jeu.avancer(echap)
+        self.assertTrue(jeu.est_en_pause())
+
+        # Le temps n'avance pas pendant la pause
+        enregistrement = jeu.enregistrement()
+        jeu.avancer([], 10)
+        self.assertEqual(jeu.enregistrement(), enregistrement)
+
+        jeu.avancer(echap)
+        self.assertFalse(jeu.est_en_pause())
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Jeu().avancer(())  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Jeu().avancer([], -1)
+
+
+class TestProfileur(unittest.TestCase):
+    """Tests de la mesure des images par le profileur"""
+
+    def test_phases(self):
+        """Vérifie que chaque image est mesurée et que ses phases sont renseignées"""
+        profileur = Profileur()
+        jeu = Jeu(profileur=profileur)
+        surface = Surface(TAILLE_FENETRE)
+        for _ in range(5):
+            jeu.avancer([], 1)
+            jeu.afficher(surface, True)
+
+        self.assertEqual(profileur.get_images(), 5)
+        for phase in (AVANCER, DESSINER, AFFICHER_TETRIMINO):
+            self.assertGreater(profileur.durees(phase)[0], 0, phase)
+
+        jeu.set_profileur(None)
+        jeu.afficher(surface, True)
+        self.assertEqual(profileur.get_images(), 5)
+
+    def test_superposition(self):
+        """Vérifie que F3 active les mesures et affiche ou masque la superposition"""
+        f3 = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)]
+        surface = Surface(TAILLE_FENETRE)
+        jeu = Jeu()
+        jeu.afficher(surface, True)
+
+        jeu.avancer(f3)
+        self.assertIsNotNone(jeu.get_profileur())
+        self.assertNotEqual(jeu.afficher(surface, True), [])
+        self.assertFalse(jeu.est_en_pause())
+
+        # Masquer la superposition redessine la zone qu'elle occupait
+        jeu.afficher(surface, True)
+        jeu.avancer(f3)
+        self.assertNotEqual(jeu.afficher(surface, True), [])
+        self.assertIsNotNone(jeu.get_profileur())
+
+    def test_erreurs(self):
+        """Vérifie que le profileur doit être un Profileur"""
+        with self.assertRaises(TypeError):
+            Jeu(profileur="test")  # type: ignore
+
+        with self.assertRaises(TypeError):
+            Jeu().set_profileur("test")  # type: ignore
+
+
+class TestFusionner(unittest.TestCase):
+    """Tests de la fonction fusionner"""
+
+    def test_disjoints(self):
+        """Vérifie que les rectangles disjoints sont conservés"""
+        zones = [Rect(0, 0, 10, 10), Rect(20, 0, 10, 10)]
+        self.assertEqual(fusionner(zones), zones)
+
+    def test_chevauchement(self):
+        """Vérifie que les rectangles qui se chevauchent sont réunis"""
+        self.assertEqual(
+            fusionner([Rect(0, 0, 10, 10), Rect(5, 5, 10, 10)]), [Rect(0, 0, 15, 15)]
+        )
+
+    def test_chaine(self):
+        """Vérifie qu'une réunion qui touche un autre rectangle est à nouveau réunie"""
+        zones = [Rect(0, 0, 10, 10), Rect(20, 20, 10, 10), Rect(8, 8, 14, 14)]
+        self.assertEqual(fusionner(zones), [Rect(0, 0, 30, 30)])
+
+    def test_copie(self):
+        """Vérifie que les rectangles passés ne sont pas modifiés"""
+        zone = Rect(0, 0, 10, 10)
+        fusionner([zone, Rect(5, 5, 10, 10)])
+        self.assertEqual(zone, Rect(0, 0, 10, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Module contenant les tests du module lot"""
+
+import random
+import unittest
+
+import numpy as np
+
+from nsi_tetris.jeu.lot import PlateauxLot, tableau_forme, tableau_formes
+from nsi_tetris.jeu.plateau import Plateau
+from nsi_tetris.jeu.regles import MODELES_NOMMES, TABLE_ROTATIONS
+from nsi_tetris.jeu.tetrimino import Rotation, Tetrimino
+
+
+class TestTableauForme(unittest.TestCase):
+    """Tests de la fonction tableau_forme"""
+
+    def test_resultat(self):
+        """Vérifie que la forme est complétée par des cases vides"""
+        tableau = tableau_forme(MODELES_NOMMES["T"][0])
+        self.assertEqual(tableau.shape, (4, 4))
+        self.assertEqual(tableau.sum(), 4)
+        self.assertTrue(tableau[0, 1])
+        self.assertFalse(tableau[3].any())
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        with self.assertRaises(ValueError):
+            tableau_forme(((1,) * 5,))  # type: ignore
+
+
+class TestPlateauxLot(unittest.TestCase):
+    """Compare le lot avec des plateaux manipulés un par un"""
+
+    def test_constructeur(self):
+        """Vérifie la forme du lot et les erreurs du constructeur"""
+        self.assertEqual(PlateauxLot(3, 10, 6).forme(), (3, 20, 6))
+
+        with self.assertRaises(ValueError):
+            PlateauxLot(-1)
+
+    def test_comparaison(self):
+        """Joue les mêmes coups sur un lot et sur des plateaux séparés"""
+        generateur = random.Random(4)
+        nombre = 16
+        lot = PlateauxLot(nombre, 10, 6)
+        plateaux = [Plateau(10, 6) for _ in range(nombre)]
+        noms = list(MODELES_NOMMES)
+
+        for _ in range(60):
+            tetriminos = []
+            for _ in range(nombre):
+                nom = generateur.choice(noms)
+                tetrimino = Tetrimino(
+                    MODELES_NOMMES[nom],
+                    generateur.randint(-2, 6),
+                    generateur.randint(0, 18),
+                )
+                tetrimino.set_rotation(generateur.choice(list(Rotation)))
+                tetriminos.append(tetrimino)
+
+            formes = tableau_formes([t.get_forme() for t in tetriminos])
+            x = np.array([t.get_position()[0] for t in tetriminos])
+            y = np.array([t.get_position()[1] for t in tetriminos])
+
+            obstrues = lot.est_obstrue(formes, x, y)
+            attendus = [p.est_obstrue(t) for p, t in zip(plateaux, tetriminos)]
+            self.assertEqual(obstrues.tolist(), attendus)
+
+            for plateau, tetrimino, obstrue in zip(plateaux, tetriminos, attendus):
+                if not obstrue:
+                    plateau.verrouiller(tetrimino)
+                    for indice in plateau.lignes_completes():
+                        plateau.effacer_ligne(indice)
+
+            lot.verrouiller(formes, x, y, np.ones(nombre), ~obstrues)
+            lot.effacer_lignes()
+
+            for grille, plateau in zip(lot.grilles(), plateaux):
+                attendu = [
+                    [case is not None for case in ligne] for ligne in plateau.grille()
+                ]
+                self.assertEqual((grille != 0).tolist(), attendu)
+
+    def test_effacer_lignes(self):
+        """Vérifie que plusieurs lignes sont effacées en une seule fois"""
+        lot = PlateauxLot(2, 0, 4)
+        grilles = lot.grilles()
+        formes = np.stack([tableau_forme(TABLE_ROTATIONS["I"][1].forme)] * 2)
+        self.assertEqual(lot.effacer_lignes().tolist(), [0, 0])
+
+        lot.verrouiller(formes, np.zeros(2, int), np.array([7, 8]), np.full(2, 5))
+        lot.verrouiller(formes, np.zeros(2, int), np.array([6, 5]), np.full(2, 3))
+        self.assertTrue(grilles.any())
+        self.assertEqual(lot.effacer_lignes().tolist(), [2, 2])
+
+        # Les vues obtenues avant l'effacement voient les grilles modifiées
+        self.assertFalse(grilles.any())
+
+    def test_reinitialiser(self):
+        """Vérifie que seuls les plateaux demandés sont vidés"""
+        lot = PlateauxLot(2, 0, 4)
+        formes = np.stack([tableau_forme(TABLE_ROTATIONS["O"][1].forme)] * 2)
+        lot.verrouiller(formes, np.zeros(2, int), np.zeros(2, int), np.ones(2))
+
+        lot.reinitialiser(np.array([True, False]))
+        self.assertFalse(lot.grilles()[0].any())
+        self.assertTrue(lot.grilles()[1].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+"""Module contenant les tests du module moteur"""
+
+import subprocess
+import sys
+import unittest
+
+from nsi_tetris.jeu.moteur import Action, Moteur, Resultat
+from nsi_tetris.jeu.regles import LIGNES_PAR_NIVEAU, MODELES_NOMMES
+
+
+class TestConstructeur(unittest.TestCase):
+    """Tests du constructeur"""
+
+    def test_erreurs(self):
+        """Vérifie que le constructeur renvoie les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Moteur(delai="test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Moteur(delai=-1)
+
+        with self.assertRaises(ValueError):
+            Moteur([])
+
+        with self.assertRaises(ValueError):
+            Moteur(niveau=0)
+
+    def test_sans_pygame(self):
+        """Vérifie que le moteur peut être importé sans charger pygame"""
+        code = "import sys, nsi_tetris.jeu.moteur; print('pygame' in sys.modules)"
+        sortie = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(sortie.stdout.strip(), "False")
+
+
+class TestJouer(unittest.TestCase):
+    """Tests de la méthode jouer"""
+
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Moteur().jouer("")  # type: ignore
+
+    def test_gravite(self):
+        """Vérifie que le tetrimino descend une fois le délai écoulé"""
+        moteur = Moteur(delai=3)
+        tetr_y = moteur.get_tetrimino().get_position()[1]
+
+        moteur.jouer(Action.TICK)
+        moteur.jouer(Action.TICK)
+        self.assertEqual(moteur.get_tetrimino().get_position()[1], tetr_y)
+
+        moteur.jouer(Action.TICK)
+        self.assertEqual(moteur.get_tetrimino().get_position()[1], tetr_y + 1)
+        self.assertEqual(moteur.get_ticks(), 3)
+
+    def test_gravite_maximale(self):
+        """Vérifie qu'à 20G le tetrimino atteint le sol en un seul tick"""
+        moteur = Moteur(niveau=20)
+        self.assertEqual(moteur.get_gravite(), 20)
+
+        tetrimino = moteur.get_tetrimino()
+        moteur.jouer(Action.TICK)
+        self.assertEqual(
+            tetrimino.get_position()[1],
+            moteur.get_plateau().fantome(tetrimino),
+        )
+
+    def test_niveau(self):
+        """Vérifie que le niveau et la gravité augmentent avec les lignes effacées"""
+        moteur = Moteur([MODELES_NOMMES["I"]], colonnes=8)
+        gravite = moteur.get_gravite()
+        while moteur.get_lignes() < LIGNES_PAR_NIVEAU:
+            self.assertEqual(moteur.get_niveau(), 1)
+            for _ in range(3):
+                moteur.jouer(Action.GAUCHE)
+            moteur.jouer(Action.CHUTE)
+            moteur.jouer(Action.TICK)
+
+            moteur.jouer(Action.DROITE)
+            moteur.jouer(Action.CHUTE)
+            moteur.jouer(Action.TICK)
+
+        self.assertEqual(moteur.get_niveau(), 2)
+        self.assertGreater(moteur.get_gravite(), gravite)
+
+    def test_deplacements(self):
+        """Vérifie que les actions de déplacement modifient le tetrimino"""
+        moteur = Moteur([MODELES_NOMMES["T"]])
+        tetrimino = moteur.get_tetrimino()
+        tetr_x = tetrimino.get_position()[0]
+
+        moteur.jouer(Action.GAUCHE)
+        self.assertEqual(tetrimino.get_position()[0], tetr_x - 1)
+
+        moteur.jouer(Action.DROITE)
+        moteur.jouer(Action.DROITE)
+        self.assertEqual(tetrimino.get_position()[0], tetr_x + 1)
+
+        etat = tetrimino.get_etat()
+        moteur.jouer(Action.TOURNER_HORAIRE)
+        self.assertIsNot(tetrimino.get_etat(), etat)
+        moteur.jouer(Action.TOURNER_ANTIHORAIRE)
+        self.assertIs(tetrimino.get_etat(), etat)
+
+    def test_chute(self):
+        """Vérifie qu'une chute verrouille le tetrimino au tick suivant"""
+        moteur = Moteur([MODELES_NOMMES["O"]])
+        premier = moteur.get_tetrimino()
+
+        self.assertEqual(moteur.jouer(Action.CHUTE), Resultat(0, 0, False))
+        self.assertIs(moteur.get_tetrimino(), premier)
+
+        moteur.jouer(Action.TICK)
+        self.assertIsNot(moteur.get_tetrimino(), premier)
+        self.assertEqual(moteur.get_pieces(), 2)
+
+    def test_lignes(self):
+        """Vérifie que les lignes complétées rapportent des points"""
+        moteur = Moteur([MODELES_NOMMES["I"]], colonnes=8)
+        for _ in range(3):
+            moteur.jouer(Action.GAUCHE)
+        moteur.jouer(Action.CHUTE)
+        self.assertEqual(moteur.jouer(Action.TICK), Resultat(0, 0, False))
+
+        moteur.jouer(Action.DROITE)
+        moteur.jouer(Action.CHUTE)
+        resultat = moteur.jouer(Action.TICK)
+
+        self.assertEqual(resultat, Resultat(1, 100, False))
+        self.assertEqual(moteur.get_score(), 100)
+        self.assertEqual(moteur.get_lignes(), 1)
+
+    def test_fin_de_partie(self):
+        """Vérifie que la partie se termine quand les tetriminos atteignent le haut"""
+        moteur = Moteur([MODELES_NOMMES["O"]])
+        resultat = Resultat(0, 0, False)
+        while not resultat.perdu:
+            moteur.jouer(Action.CHUTE)
+            resultat = moteur.jouer(Action.TICK)
+
+        self.assertTrue(moteur.est_perdu())
+        self.assertEqual(moteur.jouer(Action.GAUCHE), Resultat(0, 0, True))
+
+
+class TestRecevoirLignes(unittest.TestCase):
+    """Tests de la méthode recevoir_lignes"""
+
+    def test_fonctionnement(self):
+        """Vérifie que les lignes sont ajoutées sous le contenu de la grille"""
+        moteur = Moteur(graine=0)
+        moteur.jouer(Action.CHUTE)
+        moteur.jouer(Action.TICK)
+        masques = moteur.get_plateau().masques()
+
+        self.assertFalse(moteur.recevoir_lignes(2, 4))
+        self.assertEqual(moteur.get_plateau().masques()[:-2], masques[2:])
+        self.assertEqual(
+            moteur.get_plateau().masques()[-2:], (0b1111101111, 0b1111101111)
+        )
+        self.assertFalse(moteur.est_perdu())
+
+    def test_tetrimino(self):
+        """Vérifie que le tetrimino recouvert par les lignes remonte"""
+        moteur = Moteur(graine=0)
+        tetrimino = moteur.get_tetrimino()
+        fantome = moteur.get_plateau().fantome(tetrimino)
+        tetrimino.set_position(y=fantome)
+
+        self.assertFalse(moteur.recevoir_lignes(3, 0))
+        self.assertEqual(tetrimino.get_position()[1], fantome - 3)
+        self.assertFalse(moteur.get_plateau().est_obstrue(tetrimino))
+
+    def test_perdu(self):
+        """Vérifie que la partie est perdue quand la grille déborde"""
+        moteur = Moteur(graine=0)
+        lignes = moteur.get_plateau().forme()[0]
+        self.assertTrue(moteur.recevoir_lignes(lignes, 0))
+        self.assertTrue(moteur.est_perdu())
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Moteur().recevoir_lignes(1, "")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Moteur().recevoir_lignes(1, 10)
+
+
+class TestRestaurer(unittest.TestCase):
+    """Tests des méthodes etat et restaurer"""
+
+    def test_fonctionnement(self):
+        """Vérifie qu'une partie restaurée continue à l'identique"""
+        moteur = Moteur(graine=2)
+        for _ in range(5):
+            moteur.jouer(Action.DROITE)
+            moteur.jouer(Action.CHUTE)
+            moteur.jouer(Action.TICK)
+
+        copie = Moteur(graine=2)
+        copie.restaurer(moteur.etat())
+        self.assertEqual(copie.etat(), moteur.etat())
+
+        for action in (Action.GAUCHE, Action.CHUTE, Action.TICK):
+            moteur.jouer(action)
+            copie.jouer(action)
+        self.assertEqual(copie.etat(), moteur.etat())
+        self.assertEqual(copie.get_sac().apercu(7), moteur.get_sac().apercu(7))
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Moteur().restaurer("")  # type: ignore
+
+        # Sans graine, la suite des tetriminos ne pourrait pas être reproduite
+        with self.assertRaises(ValueError):
+            Moteur().restaurer(Moteur().etat())
+
+
+if __name__ == "__main__":
+    unittest.main()
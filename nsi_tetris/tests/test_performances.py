@@ -0,0 +1,106 @@
+"""Module contenant les tests du module performances"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# Le jeu est affiché sans fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from nsi_tetris.jeu.performances import (
+    MESURES,
+    REFERENCE,
+    Mesure,
+    comparer,
+    executer,
+    lire_reference,
+    mesurer,
+    vers_json,
+)
+
+
+class TestMesurer(unittest.TestCase):
+    """Tests de la fonction mesurer"""
+
+    def test_resultat(self):
+        """Vérifie que l'opération est répétée et que la durée est positive"""
+        appels = []
+        mesure = mesurer("test", lambda: appels.append(None), 10, 3)
+        self.assertEqual(len(appels), 30)
+        self.assertEqual(mesure.nom, "test")
+        self.assertEqual(mesure.iterations, 10)
+        self.assertGreater(mesure.duree, 0)
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            mesurer("test", lambda: None, 1.5)  # type: ignore
+
+        with self.assertRaises(ValueError):
+            mesurer("test", lambda: None, 0)
+
+
+class TestExecuter(unittest.TestCase):
+    """Tests de la fonction executer"""
+
+    def test_toutes(self):
+        """Vérifie que chaque mesure peut être préparée et exécutée"""
+        mesures = executer(echelle=0.001, repetitions=1)
+        self.assertEqual([mesure.nom for mesure in mesures], list(MESURES))
+        for mesure in mesures:
+            self.assertGreaterEqual(mesure.iterations, 1)
+            self.assertGreater(mesure.duree, 0)
+
+    def test_erreurs(self):
+        """Vérifie qu'une mesure inconnue est refusée avant toute exécution"""
+        with self.assertRaises(KeyError):
+            executer(["sac.depiler", "test"], echelle=0.001, repetitions=1)
+
+
+class TestComparer(unittest.TestCase):
+    """Tests de la fonction comparer"""
+
+    def test_regression(self):
+        """Vérifie que seul un ralentissement au delà de la tolérance est signalé"""
+        mesures = [Mesure("a", 1, 1.2), Mesure("b", 1, 1.3), Mesure("c", 1, 0.5)]
+        comparaison = comparer(mesures, {"a": 1.0, "b": 1.0, "c": 1.0}, 0.25)
+        self.assertFalse(comparaison["a"]["regression"])
+        self.assertTrue(comparaison["b"]["regression"])
+        self.assertFalse(comparaison["c"]["regression"])
+        self.assertEqual(comparaison["c"]["rapport"], 0.5)
+
+    def test_absente(self):
+        """Vérifie qu'une mesure absente de la référence n'est pas comparée"""
+        self.assertEqual(comparer([Mesure("a", 1, 1.0)], {}), {})
+
+
+class TestLireReference(unittest.TestCase):
+    """Tests de la fonction lire_reference"""
+
+    def setUp(self):
+        dossier = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(dossier.cleanup)
+        self.chemin = Path(dossier.name) / "performances.json"
+
+    def test_aller_retour(self):
+        """Vérifie que les durées écrites sont relues à l'identique"""
+        mesures = [Mesure("a", 10, 0.25), Mesure("b", 1, 2.0)]
+        self.chemin.write_text(json.dumps(vers_json(mesures)), encoding="utf-8")
+        self.assertEqual(lire_reference(self.chemin), {"a": 0.25, "b": 2.0})
+
+    def test_reference(self):
+        """Vérifie que la référence fournie couvre toutes les mesures"""
+        self.assertEqual(set(lire_reference(REFERENCE)), set(MESURES))
+
+    def test_erreurs(self):
+        """Vérifie qu'un fichier qui n'est pas un fichier de résultats est refusé"""
+        self.chemin.write_text('{"mesures": [1]}', encoding="utf-8")
+        with self.assertRaises(ValueError):
+            lire_reference(self.chemin)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,12 @@
 """Module contenant les tests du module plateau"""
 
 import unittest
+from random import Random
 from pygame.color import Color
 
-from nsi_tetris.jeu.plateau import Plateau, Grille
+from nsi_tetris.jeu.plateau import ObservateurPlateau, Placement, Plateau, Grille
 from nsi_tetris.jeu.constantes import MODELES_TETRIMINOS
-from nsi_tetris.jeu.tetrimino import Tetrimino
+from nsi_tetris.jeu.tetrimino import Rotation, Tetrimino
 
 C = Color("white")
 N = None
@@ -29,9 +30,23 @@ def depuis_grille(grille: Grille) -> Plateau:
     # pylint: disable=protected-access
     plateau._Plateau__lignes = lignes  # type: ignore
     plateau._Plateau__grille = grille  # type: ignore
+    plateau._Plateau__synchroniser()  # type: ignore
     return plateau
 
 
+class Journal(ObservateurPlateau):
+    """Observateur qui enregistre les notifications reçues"""
+
+    def __init__(self) -> None:
+        self.evenements = []
+
+    def lignes_modifiees(self, lignes):
+        self.evenements.append(("modifiees", lignes))
+
+    def ligne_effacee(self, indice):
+        self.evenements.append(("effacee", indice))
+
+
 class TestConstructeur(unittest.TestCase):
     """Tests du constructeur"""
 
@@ -82,9 +97,239 @@ class TestGrille(unittest.TestCase):
         )
 
 
+class TestCopier(unittest.TestCase):
+    """Tests de la méthode copier"""
+
+    def test_fonctionnement(self):
+        """Vérifie que la copie est identique et indépendante"""
+        plateau = Plateau(10, 10)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["Z"], 0, 18))
+        copie = plateau.copier()
+        self.assertEqual(copie.grille(), plateau.grille())
+        self.assertEqual(copie.masques(), plateau.masques())
+        self.assertEqual(copie.hauteurs(), plateau.hauteurs())
+
+        copie.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 5, 17))
+        self.assertNotEqual(copie.grille(), plateau.grille())
+        self.assertNotEqual(copie.masques(), plateau.masques())
+        self.assertNotEqual(copie.hauteurs(), plateau.hauteurs())
+
+
+class TestCloner(unittest.TestCase):
+    """Tests de la méthode cloner"""
+
+    def test_fonctionnement(self):
+        """Vérifie que le clone et l'original restent indépendants"""
+        plateau = Plateau(10, 10)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["Z"], 0, 18))
+        grille = plateau.grille()
+
+        clone = plateau.cloner()
+        self.assertEqual(clone.grille(), grille)
+        self.assertEqual(clone.empreinte(), plateau.empreinte())
+
+        # Les lignes partagées sont copiées par celui qui les modifie
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 17))
+        self.assertEqual(plateau.grille(), grille)
+
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 4, 17))
+        self.assertEqual(clone.ligne(18)[4:], (N,) * 6)
+        self.assertNotEqual(plateau.ligne(18), clone.ligne(18))
+
+    def test_effacer_ligne(self):
+        """Vérifie que les lignes partagées restent suivies après un effacement"""
+        plateau = Plateau(4, 4)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], -1, 9))
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 11))
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 12))
+
+        clone = plateau.cloner()
+        clone.effacer_ligne(13)
+        clone.effacer_ligne(13)
+        grille = plateau.grille()
+
+        # Les lignes de l'original ont descendu dans le clone, qui doit les copier
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 11))
+        self.assertEqual(plateau.grille(), grille)
+        self.assertEqual(clone.lignes_completes(), (12, 13))
+
+    def test_lignes_copiees(self):
+        """Vérifie qu'une ligne partagée qui descend sous une ligne copiée est copiée"""
+        plateau = Plateau(4, 4)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], -1, 8))
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 12))
+        grille = plateau.grille()
+
+        clone = plateau.cloner()
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 10))
+        clone.effacer_ligne(13)
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 9))
+        self.assertEqual(plateau.grille(), grille)
+        self.assertEqual(clone.lignes_completes(), (10, 11, 12))
+
+
+class TestSauvegarder(unittest.TestCase):
+    """Tests des méthodes sauvegarder et annuler"""
+
+    def test_fonctionnement(self):
+        """Vérifie que les modifications faites depuis la sauvegarde sont annulées"""
+        plateau = Plateau(4, 4)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], -1, 11))
+        etat = (plateau.grille(), plateau.masques(), plateau.hauteurs())
+        empreinte = plateau.empreinte()
+        sauvegarde = plateau.sauvegarder()
+
+        for _ in range(2):
+            plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 11))
+            plateau.effacer_ligne(13)
+            plateau.effacer_ligne(13)
+            self.assertEqual(plateau.masques()[12:], (0, 0))
+
+            plateau.annuler(sauvegarde)
+            self.assertEqual(
+                (plateau.grille(), plateau.masques(), plateau.hauteurs()), etat
+            )
+            self.assertEqual(plateau.empreinte(), empreinte)
+
+    def test_observateurs(self):
+        """Vérifie que seules les lignes modifiées sont signalées"""
+        plateau = Plateau(4, 4)
+        sauvegarde = plateau.sauvegarder()
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], -1, 11))
+
+        journal = Journal()
+        plateau.ajouter_observateur(journal)
+        plateau.annuler(sauvegarde)
+        self.assertEqual(journal.evenements, [("modifiees", (12, 13))])
+
+    def test_erreurs(self):
+        """Vérifie que la méthode annuler lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau().annuler(())  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Plateau().annuler(Plateau(4, 4).sauvegarder())
+
+
+class TestLigne(unittest.TestCase):
+    """Tests de la méthode ligne"""
+
+    def test_resultat(self):
+        """Vérifie que la méthode renvoie le contenu de la ligne"""
+        plateau = depuis_grille([[C, N], [N, C]])
+        self.assertEqual(plateau.ligne(1), (N, C))
+
+
+class TestObservateurs(unittest.TestCase):
+    """Tests des méthodes ajouter_observateur et retirer_observateur"""
+
+    def test_erreurs(self):
+        """Vérifie que les méthodes lèvent les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau(5, 5).ajouter_observateur("")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Plateau(5, 5).retirer_observateur(Journal())
+
+    def test_notifications(self):
+        """Vérifie que les observateurs sont prévenus des lignes modifiées"""
+        plateau = Plateau(2, 4)
+        journal = Journal()
+        plateau.ajouter_observateur(journal)
+
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 0, 9))
+        plateau.effacer_ligne(11)
+        self.assertEqual(journal.evenements, [("modifiees", (10, 11)), ("effacee", 11)])
+
+        plateau.copier().effacer_ligne(11)
+        plateau.retirer_observateur(journal)
+        plateau.effacer_ligne(11)
+        self.assertEqual(len(journal.evenements), 2)
+
+
+class TestRestaurer(unittest.TestCase):
+    """Tests de la méthode restaurer"""
+
+    def test_fonctionnement(self):
+        """Vérifie que le contenu et les masques sont remplacés"""
+        plateau = depuis_grille([[C, N], [C, C]])
+        plateau.restaurer([[N, N], [N, C]])
+        self.assertEqual(plateau.grille(), ((N, N), (N, C)))
+        self.assertEqual(plateau.masques(), (0, 2))
+        self.assertEqual(plateau.hauteurs(), (2, 1))
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(ValueError):
+            Plateau(5, 5).restaurer([[N]])
+
+
+class TestEmpreinte(unittest.TestCase):
+    """Tests de la méthode empreinte"""
+
+    def test_incrementale(self):
+        """Vérifie que l'empreinte mise à jour est celle du plateau recalculé"""
+        aleatoire = Random(1)
+        modeles = [MODELES_TETRIMINOS["O"], MODELES_TETRIMINOS["I"]]
+        plateau = Plateau(12, 4)
+        vide = plateau.grille()
+        empreintes = {plateau.empreinte()}
+        effacees = 0
+        for _ in range(100):
+            tetrimino = Tetrimino(aleatoire.choice(modeles), 0, 10)
+            placements = plateau.placements(tetrimino)
+            if not placements:
+                # Le plateau est plein : on le vide en restaurant la grille initiale
+                plateau.restaurer(vide)
+                self.assertEqual(plateau.empreinte(), Plateau(12, 4).empreinte())
+                continue
+
+            rotation, x, y = aleatoire.choice(placements)
+            tetrimino.set_rotation(rotation)
+            tetrimino.set_position(x, y)
+            plateau.verrouiller(tetrimino)
+            self.assertEqual(
+                plateau.empreinte(), depuis_grille(plateau.grille()).empreinte()
+            )
+
+            for indice in plateau.lignes_completes():
+                plateau.effacer_ligne(indice)
+                effacees += 1
+                self.assertEqual(
+                    plateau.empreinte(), depuis_grille(plateau.grille()).empreinte()
+                )
+            empreintes.add(plateau.empreinte())
+
+        self.assertGreater(effacees, 0)
+        self.assertGreater(len(empreintes), 50)
+        self.assertEqual(plateau.copier().empreinte(), plateau.empreinte())
+
+    def test_couleurs(self):
+        """Vérifie que l'empreinte ne dépend que des cases occupées"""
+        self.assertEqual(
+            depuis_grille([[C, N], [N, C]]).empreinte(),
+            depuis_grille([[Color("blue"), N], [N, C]]).empreinte(),
+        )
+        self.assertNotEqual(
+            depuis_grille([[C, N], [N, C]]).empreinte(),
+            depuis_grille([[N, C], [N, C]]).empreinte(),
+        )
+
+    def test_tetrimino(self):
+        """Vérifie que la position du tetrimino est prise en compte"""
+        plateau = Plateau(10, 10)
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["T"], 0, 10)
+        empreinte = plateau.empreinte(tetrimino)
+        self.assertNotEqual(empreinte, plateau.empreinte())
+
+        plateau.deplacer_droite(tetrimino)
+        self.assertNotEqual(plateau.empreinte(tetrimino), empreinte)
+
+
 class TestEstObstrue(unittest.TestCase):
     """Tests de la méthode est_obstrue"""
 
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
     def test_erreurs(self):
         """Vérifie que la méthode lève les bonnes erreurs"""
         with self.assertRaises(TypeError):
@@ -104,10 +349,29 @@ class TestEstObstrue(unittest.TestCase):
         tetrimino2 = Tetrimino(MODELES_TETRIMINOS["L"])
         self.assertTrue(plateau.est_obstrue(tetrimino2))
 
+    def test_colonnes_vides(self):
+        """Vérifie que les colonnes vides d'une forme peuvent sortir de la grille"""
+        plateau = Plateau(10, 10)
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["I"])
+        tetrimino.tourner()
+
+        tetrimino.set_position(-2, 0)
+        self.assertFalse(plateau.est_obstrue(tetrimino))
+
+        tetrimino.set_position(-3, 0)
+        self.assertTrue(plateau.est_obstrue(tetrimino))
+
+        tetrimino.set_position(7, 0)
+        self.assertFalse(plateau.est_obstrue(tetrimino))
+
+        tetrimino.set_position(8, 0)
+        self.assertTrue(plateau.est_obstrue(tetrimino))
+
 
 class TestVerrouiller(unittest.TestCase):
     """Tests de la méthode verouiller"""
 
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
     def test_erreurs(self):
         """Vérifie que la méthode lève les bonnes erreurs"""
         with self.assertRaises(TypeError):
@@ -121,6 +385,31 @@ class TestVerrouiller(unittest.TestCase):
         self.assertEqual(plateau.grille()[0][0], Color("red"))
 
 
+class TestLignesCompletes(unittest.TestCase):
+    """Tests de la méthode lignes_completes"""
+
+    def test_resultat(self):
+        """Vérifie que la méthode renvoie le bon résultat"""
+        plateau = depuis_grille(
+            [
+                [C, C, N, C],
+                [C, C, C, C],
+                [C, N, N, C],
+                [C, C, C, C],
+            ]
+        )
+        self.assertEqual(plateau.lignes_completes(), (1, 3))
+
+    def test_verrouiller(self):
+        """Vérifie que les lignes complétées par un tetrimino sont détectées"""
+        plateau = Plateau(2, 4)
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["I"], 0, 10)
+        self.assertEqual(plateau.lignes_completes(), ())
+
+        plateau.verrouiller(tetrimino)
+        self.assertEqual(plateau.lignes_completes(), (11,))
+
+
 class TestEffacerLigne(unittest.TestCase):
     """Tests de la méthode effacer_ligne"""
 
@@ -157,9 +446,211 @@ class TestEffacerLigne(unittest.TestCase):
         )
 
 
+class TestEffacerLignes(unittest.TestCase):
+    """Tests de la méthode effacer_lignes"""
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau(5, 5).effacer_lignes([""])  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Plateau(5, 5).effacer_lignes([3, 20])
+
+    def test_lignes_completes(self):
+        """Vérifie que les lignes complètes sont effacées par défaut"""
+        plateau = depuis_grille(
+            [
+                [C, C, N, C],
+                [C, C, C, C],
+                [N, C, C, N],
+                [C, C, C, C],
+                [C, N, N, C],
+                [C, C, C, C],
+            ]
+        )
+        self.assertEqual(plateau.effacer_lignes(), 3)
+        self.assertEqual(
+            plateau.grille(),
+            (
+                (N, N, N, N),
+                (N, N, N, N),
+                (N, N, N, N),
+                (C, C, N, C),
+                (N, C, C, N),
+                (C, N, N, C),
+            ),
+        )
+        self.assertEqual(plateau.hauteurs(), (3, 3, 4, 3))
+        self.assertEqual(plateau.effacer_lignes(), 0)
+
+    def test_une_par_une(self):
+        """Vérifie que le résultat est celui de l'effacement des lignes une par une"""
+        aleatoire = Random(2)
+        for _ in range(50):
+            grille = [
+                [C if aleatoire.random() < 0.6 else N for _ in range(5)]
+                for _ in range(8)
+            ]
+            indices = aleatoire.sample(range(8), aleatoire.randint(1, 4))
+
+            attendu = depuis_grille([ligne.copy() for ligne in grille])
+            journal_attendu = Journal()
+            attendu.ajouter_observateur(journal_attendu)
+            for indice in sorted(indices):
+                attendu.effacer_ligne(indice)
+
+            plateau = depuis_grille([ligne.copy() for ligne in grille])
+            journal = Journal()
+            plateau.ajouter_observateur(journal)
+            self.assertEqual(plateau.effacer_lignes(indices), len(indices))
+
+            self.assertEqual(plateau.grille(), attendu.grille())
+            self.assertEqual(plateau.masques(), attendu.masques())
+            self.assertEqual(plateau.hauteurs(), attendu.hauteurs())
+            self.assertEqual(plateau.empreinte(), attendu.empreinte())
+            self.assertEqual(journal.evenements, journal_attendu.evenements)
+
+    def test_clone(self):
+        """Vérifie que les lignes partagées avec un clone restent partagées"""
+        plateau = Plateau(4, 4)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], -1, 8))
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 10))
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 12))
+        grille = plateau.grille()
+
+        clone = plateau.cloner()
+        self.assertEqual(clone.effacer_lignes(), 2)
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 10))
+        self.assertEqual(plateau.grille(), grille)
+        self.assertEqual(clone.lignes_completes(), (11, 12))
+
+
+class TestAjouterLignes(unittest.TestCase):
+    """Tests de la méthode ajouter_lignes"""
+
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau(5, 5).ajouter_lignes("", 0, C)  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Plateau(5, 5).ajouter_lignes(1, 5, C)
+
+        with self.assertRaises(ValueError):
+            Plateau(5, 5).ajouter_lignes(16, 0, C)
+
+    def test_fonctionnement(self):
+        """Vérifie que le contenu monte et que les lignes ajoutées ont un trou"""
+        plateau = depuis_grille(
+            [
+                [N, N, N, N],
+                [N, N, N, N],
+                [N, C, N, N],
+                [C, C, N, C],
+            ]
+        )
+        journal = Journal()
+        plateau.ajouter_observateur(journal)
+        self.assertFalse(plateau.ajouter_lignes(2, 2, C))
+        self.assertEqual(
+            plateau.grille(),
+            (
+                (N, C, N, N),
+                (C, C, N, C),
+                (C, C, N, C),
+                (C, C, N, C),
+            ),
+        )
+        self.assertEqual(plateau.hauteurs(), (1, 0, 4, 1))
+        self.assertEqual(plateau.masques(), depuis_grille(plateau.grille()).masques())
+        self.assertEqual(
+            plateau.empreinte(), depuis_grille(plateau.grille()).empreinte()
+        )
+        self.assertEqual(journal.evenements, [("modifiees", (0, 1, 2, 3))])
+
+    def test_debordement(self):
+        """Vérifie que les cases sorties par le haut sont signalées"""
+        plateau = depuis_grille([[N, C], [N, N], [N, N]])
+        self.assertTrue(plateau.ajouter_lignes(1, 0, C))
+        self.assertEqual(plateau.grille(), ((N, N), (N, N), (N, C)))
+        self.assertEqual(plateau.hauteurs(), (3, 2))
+
+    def test_clone(self):
+        """Vérifie que l'ajout de lignes à un clone ne modifie pas l'original"""
+        plateau = Plateau(4, 4)
+        plateau.verrouiller(Tetrimino(MODELES_TETRIMINOS["I"], 0, 12))
+        grille = plateau.grille()
+
+        clone = plateau.cloner()
+        clone.ajouter_lignes(3, 1, C)
+        clone.verrouiller(Tetrimino(MODELES_TETRIMINOS["O"], 1, 8))
+        self.assertEqual(plateau.grille(), grille)
+        self.assertEqual(clone.empreinte(), depuis_grille(clone.grille()).empreinte())
+
+
+class TestFantome(unittest.TestCase):
+    """Tests de la méthode fantome"""
+
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau(5, 5).fantome("")  # type: ignore
+
+    def test_fonctionnement(self):
+        """Vérifie que la méthode fonctionne bien"""
+        plateau = depuis_grille(
+            [
+                [N, N, N, N],
+                [N, N, N, N],
+                [N, N, N, N],
+                [N, N, N, N],
+                [N, C, N, N],
+                [C, C, N, C],
+            ]
+        )
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["O"], 0, 0)
+        self.assertEqual(plateau.fantome(tetrimino), 1)
+
+        tetrimino.set_position(1, 0)
+        self.assertEqual(plateau.fantome(tetrimino), 2)
+
+        # Après l'effacement d'une ligne, les hauteurs des colonnes doivent suivre
+        plateau.effacer_ligne(4)
+        tetrimino.set_position(0, 0)
+        self.assertEqual(plateau.fantome(tetrimino), 2)
+
+    def test_surplomb(self):
+        """Vérifie le résultat pour un tetrimino situé sous une case occupée"""
+        plateau = depuis_grille(
+            [
+                [N, N, N, N],
+                [C, C, C, N],
+                [N, N, N, N],
+                [N, N, N, N],
+                [N, N, N, N],
+            ]
+        )
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["O"], -1, 1)
+        self.assertEqual(plateau.fantome(tetrimino), 2)
+
+    def test_verrouiller(self):
+        """Vérifie que les hauteurs des colonnes suivent les tetriminos verrouillés"""
+        plateau = Plateau(10, 10)
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["T"], 0, 0)
+        self.assertEqual(plateau.fantome(tetrimino), 18)
+
+        tetrimino.set_position(y=18)
+        plateau.verrouiller(tetrimino)
+        tetrimino.set_position(1, 0)
+        self.assertEqual(plateau.fantome(tetrimino), 16)
+
+
 class TestDeplacer(unittest.TestCase):
     """Tests des methodes deplacer_gauche et deplacer_droite"""
 
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
     def test_erreurs(self):
         """Vérifie que les méthodes lèvent les bonnes erreurs"""
         plateau = Plateau(10, 10)
@@ -197,6 +688,7 @@ class TestDeplacer(unittest.TestCase):
 class TestTournerTetrimino(unittest.TestCase):
     """Tests de la methode tourner_tetrimino"""
 
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
     def test_erreurs(self):
         """Vérifie que la méthode lève les bonnes erreurs"""
         plateau = Plateau(10, 10)
@@ -230,5 +722,52 @@ class TestTournerTetrimino(unittest.TestCase):
         self.assertTrue(plateau2.tourner_tetrimino(tetrimino))
 
 
+class TestPlacements(unittest.TestCase):
+    """Tests de la méthode placements"""
+
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
+    def test_erreurs(self):
+        """Vérifie que la méthode lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Plateau(5, 5).placements("")  # type: ignore
+
+    def test_plateau_vide(self):
+        """Vérifie le nombre de positions distinctes sur un plateau vide"""
+        plateau = Plateau()
+        attendus = {"I": 17, "O": 9, "T": 34, "S": 17, "Z": 17, "J": 34, "L": 34}
+        for nom, nombre in attendus.items():
+            tetrimino = Tetrimino(MODELES_TETRIMINOS[nom], 3, 8)
+            placements = plateau.placements(tetrimino)
+            self.assertEqual(len(placements), nombre, nom)
+
+            # Chaque position doit être libre et posée sur le sol
+            for rotation, x, y in placements:
+                tetrimino.set_rotation(rotation)
+                tetrimino.set_position(x, y)
+                self.assertFalse(plateau.est_obstrue(tetrimino))
+                self.assertEqual(plateau.fantome(tetrimino), y)
+
+    def test_glissement(self):
+        """Vérifie qu'une position sous une case occupée est trouvée"""
+        plateau = depuis_grille(
+            [
+                [N, N, N, N, N],
+                [N, N, N, N, N],
+                [N, N, N, N, N],
+                [N, N, C, C, C],
+                [N, N, N, N, N],
+                [N, N, N, N, N],
+            ]
+        )
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["O"], -1, 0)
+        placements = plateau.placements(tetrimino)
+        self.assertIn(Placement(Rotation.BASE, 2, 3), placements)
+
+    def test_obstrue(self):
+        """Vérifie qu'un tetrimino obstrué n'a aucune position"""
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["T"], -3, 0)
+        self.assertEqual(Plateau().placements(tetrimino), ())
+
+
 if __name__ == "__main__":
     unittest.main()
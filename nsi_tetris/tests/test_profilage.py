@@ -0,0 +1,139 @@
+"""Module contenant les tests du module profilage"""
+
+import unittest
+
+from nsi_tetris.jeu.profilage import (
+    AFFICHER,
+    AFFICHER_TEXTE,
+    AVANCER,
+    IMAGE,
+    PHASES,
+    Centiles,
+    Profileur,
+)
+
+
+def profileur_rempli(durees, capacite=100, budget=1.0) -> Profileur:
+    """
+    Renvoie un profileur dont les images ont les durées données, réparties entre
+    avancer et afficher
+
+    Args:
+        durees (Iterable[float]): Les durées des images
+        capacite (int, optional): Le nombre d'images conservées
+        budget (float, optional): La durée maximale d'une image
+
+    Returns:
+        Profileur: Le profileur
+    """
+    profileur = Profileur(capacite, budget)
+    for duree in durees:
+        profileur.ajouter(AVANCER, duree / 4)
+        profileur.ajouter(AFFICHER, duree * 3 / 4)
+        profileur.terminer_image()
+
+    return profileur
+
+
+class TestTerminerImage(unittest.TestCase):
+    """Tests de la méthode terminer_image"""
+
+    def test_fonctionnement(self):
+        """Vérifie que les durées d'une image sont enregistrées puis remises à zéro"""
+        profileur = Profileur(4)
+        profileur.ajouter(AVANCER, 1.0)
+        profileur.ajouter(AVANCER, 0.5)
+        profileur.ajouter(AFFICHER, 2.0)
+        profileur.terminer_image()
+        profileur.terminer_image()
+
+        self.assertEqual(list(profileur.durees(AVANCER)), [1.5, 0.0])
+        self.assertEqual(list(profileur.durees()), [3.5, 0.0])
+        self.assertEqual(len(profileur), 2)
+
+    def test_tampon_circulaire(self):
+        """Vérifie que seules les dernières images sont conservées, dans l'ordre"""
+        profileur = profileur_rempli(range(10), capacite=4)
+        self.assertEqual(list(profileur.durees()), [6, 7, 8, 9])
+        self.assertEqual(len(profileur), 4)
+        self.assertEqual(profileur.get_images(), 10)
+
+    def test_depassements(self):
+        """Vérifie que les images plus longues que le budget sont comptées"""
+        profileur = profileur_rempli([0.5, 2, 1, 3, 0.1], capacite=3, budget=1.0)
+        self.assertEqual(profileur.depassements(), 1)
+        self.assertEqual(profileur.depassements(True), 2)
+
+
+class TestCentiles(unittest.TestCase):
+    """Tests de la méthode centiles"""
+
+    def test_resultat(self):
+        """Vérifie les centiles de durées connues"""
+        profileur = profileur_rempli(range(1, 101))
+        self.assertEqual(profileur.centiles(), Centiles(50, 95, 99))
+        self.assertEqual(profileur.centiles(AVANCER), Centiles(12.5, 23.75, 24.75))
+
+    def test_vide(self):
+        """Vérifie que les centiles sont nuls sans image"""
+        self.assertEqual(Profileur().centiles(), Centiles(0.0, 0.0, 0.0))
+
+    def test_resume(self):
+        """Vérifie que le résumé contient chaque phase"""
+        self.assertEqual(set(Profileur().resume()), {IMAGE, *PHASES})
+
+    def test_erreurs(self):
+        """Vérifie qu'une phase inconnue est refusée"""
+        with self.assertRaises(KeyError):
+            Profileur().centiles("test")
+
+
+class TestChronometrer(unittest.TestCase):
+    """Tests de la méthode chronometrer"""
+
+    def test_fonctionnement(self):
+        """Vérifie que la fonction est appelée et que sa durée est ajoutée"""
+        profileur = Profileur()
+        fonction = profileur.chronometrer(AFFICHER_TEXTE, lambda a, b=0: a + b)
+        self.assertEqual(fonction(1, b=2), 3)
+        profileur.terminer_image()
+        self.assertGreater(profileur.durees(AFFICHER_TEXTE)[0], 0)
+
+    def test_exception(self):
+        """Vérifie que la durée est ajoutée même si la fonction lève une exception"""
+        profileur = Profileur()
+
+        def erreur():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            profileur.chronometrer(AFFICHER_TEXTE, erreur)()
+        profileur.terminer_image()
+        self.assertGreater(profileur.durees(AFFICHER_TEXTE)[0], 0)
+
+    def test_erreurs(self):
+        """Vérifie qu'une phase inconnue est refusée"""
+        with self.assertRaises(KeyError):
+            Profileur().chronometrer("test", print)
+
+
+class TestInit(unittest.TestCase):
+    """Tests du constructeur"""
+
+    def test_erreurs(self):
+        """Vérifie que le constructeur lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Profileur("test")  # type: ignore
+
+        with self.assertRaises(TypeError):
+            Profileur(10, "test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Profileur(0)
+
+        with self.assertRaises(ValueError):
+            Profileur(10, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
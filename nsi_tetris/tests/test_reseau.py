@@ -0,0 +1,130 @@
+"""Module contenant les tests du module reseau"""
+
+import asyncio
+import unittest
+
+from nsi_tetris.jeu.moteur import Action, Moteur
+from nsi_tetris.jeu.reseau import (
+    ACTION,
+    ETAT,
+    TAILLE_MAX,
+    Suivi,
+    Vue,
+    appliquer_etat,
+    lire_debut,
+    lire_trame,
+    message_debut,
+    trame,
+)
+
+
+def lire(donnees: bytes):
+    """Lit la première trame de données en mémoire"""
+
+    async def lire_flux():
+        lecteur = asyncio.StreamReader()
+        lecteur.feed_data(donnees)
+        lecteur.feed_eof()
+        return await lire_trame(lecteur)
+
+    return asyncio.run(lire_flux())
+
+
+class TestTrame(unittest.TestCase):
+    """Tests des fonctions trame et lire_trame"""
+
+    def test_aller_retour(self):
+        """Vérifie qu'une trame lue redonne le message écrit"""
+        self.assertEqual(lire(trame(ACTION, b"\x03")), (ACTION, b"\x03"))
+        self.assertEqual(lire(trame(ETAT)), (ETAT, b""))
+
+    def test_erreurs(self):
+        """Vérifie que les fonctions lèvent les bonnes erreurs"""
+        with self.assertRaises(ValueError):
+            trame(ETAT, bytes(TAILLE_MAX))
+
+        with self.assertRaises(ValueError):
+            lire(b"\x00\x00")
+
+        with self.assertRaises(asyncio.IncompleteReadError):
+            lire(trame(ACTION, b"\x03")[:-1])
+
+
+class TestMessageDebut(unittest.TestCase):
+    """Tests des fonctions message_debut et lire_debut"""
+
+    def test_aller_retour(self):
+        """Vérifie que le message lu redonne la graine et le joueur"""
+        _, contenu = lire(message_debut(2**32 - 1, 1))
+        self.assertEqual(lire_debut(contenu), (2**32 - 1, 1))
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        with self.assertRaises(ValueError):
+            lire_debut(b"\x05")
+
+
+class TestSuivi(unittest.TestCase):
+    """Tests de la classe Suivi, appliquée à une Vue"""
+
+    def test_vue(self):
+        """Vérifie que la vue reconstruite est identique à la partie suivie"""
+        moteur = Moteur(graine=3)
+        modeles = moteur.get_modeles()
+        suivi = Suivi(moteur, 1)
+        vues = {0: Vue(1), 1: Vue(moteur.get_plateau().forme()[0])}
+        actions = [Action.DROITE, Action.TOURNER_HORAIRE, Action.CHUTE, Action.TICK]
+        for indice in range(400):
+            moteur.jouer(actions[indice % len(actions)])
+            if indice % 50 == 0:
+                moteur.recevoir_lignes(1, indice % 10)
+
+            contenu = suivi.delta()
+            if contenu is not None:
+                self.assertEqual(appliquer_etat(vues, contenu), 1)
+
+            vue = vues[1]
+            tetrimino = moteur.get_tetrimino()
+            self.assertEqual(vue.masques, list(moteur.get_plateau().masques()))
+            self.assertEqual(
+                vue.tetrimino,
+                (
+                    modeles.index(moteur.get_modele()),
+                    *tetrimino.get_position(),
+                    tetrimino.get_rotation().value,
+                ),
+            )
+            self.assertEqual(vue.score, moteur.get_score())
+            self.assertEqual(vue.lignes, moteur.get_lignes())
+            self.assertEqual(vue.perdu, moteur.est_perdu())
+            if moteur.est_perdu():
+                break
+
+    def test_delta(self):
+        """Vérifie que seuls les changements sont envoyés"""
+        moteur = Moteur(graine=0)
+        suivi = Suivi(moteur, 0)
+        premier = suivi.delta()
+        self.assertIsNotNone(premier)
+        self.assertIsNone(suivi.delta())
+
+        moteur.jouer(Action.GAUCHE)
+        contenu = suivi.delta()
+        self.assertIsNotNone(contenu)
+        self.assertLess(len(contenu), len(premier))  # type: ignore
+
+    def test_erreurs(self):
+        """Vérifie que les méthodes lèvent les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Suivi(Moteur(), "")  # type: ignore
+
+        contenu = Suivi(Moteur(), 0).delta()
+        with self.assertRaises(ValueError):
+            appliquer_etat({0: Vue(30)}, contenu[:-1])  # type: ignore
+
+        with self.assertRaises(ValueError):
+            appliquer_etat({1: Vue(30)}, contenu)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 """Module contenant les tests du module sac"""
 
 import unittest
+from itertools import islice
+from random import Random
 
 from nsi_tetris.jeu.sac import Sac
 from nsi_tetris.jeu.constantes import MODELES_TETRIMINOS
@@ -17,6 +19,31 @@ class TestConstructeur(unittest.TestCase):
         with self.assertRaises(ValueError):
             Sac([])
 
+        with self.assertRaises(TypeError):
+            Sac(list(MODELES_TETRIMINOS.values()), 5)  # type: ignore
+
+
+class TestDepiler(unittest.TestCase):
+    """Tests de la méthode depiler"""
+
+    def test_series(self):
+        """Vérifie que chaque série de 7 tetriminos contient tous les modèles"""
+        modeles = list(MODELES_TETRIMINOS.values())
+        sac = Sac(modeles)
+        for _ in range(5):
+            serie = [sac.depiler() for _ in range(len(modeles))]
+            self.assertEqual(sorted(map(id, serie)), sorted(map(id, modeles)))
+
+    def test_graine(self):
+        """Vérifie que deux sacs de même graine donnent la même suite"""
+        modeles = list(MODELES_TETRIMINOS.values())
+        sac1 = Sac(modeles, Random(42))
+        sac2 = Sac(modeles, Random(42))
+        self.assertEqual(
+            [sac1.depiler() for _ in range(50)],
+            [sac2.depiler() for _ in range(50)],
+        )
+
 
 class TestRemplir(unittest.TestCase):
     """Tests de la méthode remplir"""
@@ -36,5 +63,75 @@ class TestRemplir(unittest.TestCase):
             sac.remplir(-1)
 
 
+class TestApercu(unittest.TestCase):
+    """Tests de la méthode apercu"""
+
+    def test_erreurs(self):
+        """Vérifie que apercu renvoie les bonnes erreurs"""
+        sac = Sac(list(MODELES_TETRIMINOS.values()))
+
+        with self.assertRaises(TypeError):
+            sac.apercu("test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            sac.apercu(0)
+
+    def test_fonctionnement(self):
+        """Vérifie que l'aperçu correspond aux prochains modèles piochés"""
+        sac = Sac(list(MODELES_TETRIMINOS.values()))
+        apercu = sac.apercu(10)
+        self.assertEqual(len(apercu), 10)
+        self.assertEqual(tuple(sac.depiler() for _ in range(10)), apercu)
+
+
+class TestTirer(unittest.TestCase):
+    """Tests de la méthode tirer et de l'itérateur"""
+
+    def test_erreurs(self):
+        """Vérifie que tirer renvoie les bonnes erreurs"""
+        sac = Sac(list(MODELES_TETRIMINOS.values()))
+
+        with self.assertRaises(TypeError):
+            sac.tirer("test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            sac.tirer(-1)
+
+    def test_equivalence(self):
+        """Vérifie que tirer donne la même suite que des appels à depiler"""
+        modeles = list(MODELES_TETRIMINOS.values())
+        sac1 = Sac(modeles, Random(3))
+        sac2 = Sac(modeles, Random(3))
+
+        sac1.apercu(3)
+        attendu = [sac2.depiler() for _ in range(40)]
+        self.assertEqual(sac1.tirer(2) + sac1.tirer(0) + sac1.tirer(30), attendu[:32])
+        self.assertEqual([sac1.depiler() for _ in range(8)], attendu[32:])
+
+    def test_iterateur(self):
+        """Vérifie que l'itérateur donne la même suite que des appels à depiler"""
+        modeles = list(MODELES_TETRIMINOS.values())
+        sac1 = Sac(modeles, Random(8))
+        sac2 = Sac(modeles, Random(8))
+        self.assertEqual(
+            list(islice(sac1, 20)),
+            [sac2.depiler() for _ in range(20)],
+        )
+
+    def test_iterateur_melange(self):
+        """Vérifie qu'aucun modèle n'est perdu en mélangeant l'itérateur et depiler"""
+        sac1 = Sac(list(range(7)), Random(1))  # type: ignore
+        sac2 = Sac(list(range(7)), Random(1))  # type: ignore
+        attendu = [sac2.depiler() for _ in range(14)]
+
+        iterateur = iter(sac1)
+        obtenu = [next(iterateur) for _ in range(3)]
+        self.assertEqual(sac1.apercu(2), tuple(attendu[3:5]))
+        obtenu.append(sac1.depiler())
+        obtenu += [next(iterateur) for _ in range(5)]
+        obtenu += [sac1.depiler() for _ in range(5)]
+        self.assertEqual(obtenu, attendu)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,223 @@
+"""Module contenant les tests du module serveur"""
+
+import asyncio
+import unittest
+
+from nsi_tetris.jeu.moteur import Action, Moteur
+from nsi_tetris.jeu.regles import COULEUR_DECHETS, DECHETS, MODELES_NOMMES
+from nsi_tetris.jeu.reseau import (
+    ACTION,
+    DEBUT,
+    ETAT,
+    FIN,
+    REJOINDRE,
+    Vue,
+    appliquer_etat,
+    lire_debut,
+    lire_trame,
+    trame,
+)
+from nsi_tetris.jeu.serveur import Partie, Serveur
+from nsi_tetris.jeu.tetrimino import Tetrimino
+
+# Le délai laissé au serveur pour traiter les messages des clients
+ATTENTE = 0.05
+
+
+async def connecter(port: int):
+    """Connecte un client au serveur et lui fait chercher une partie"""
+    lecteur, ecrivain = await asyncio.open_connection("127.0.0.1", port)
+    ecrivain.write(trame(REJOINDRE))
+    await ecrivain.drain()
+    return lecteur, ecrivain
+
+
+async def lire_disponibles(lecteur: asyncio.StreamReader):
+    """Lit les trames déjà reçues"""
+    trames = []
+    while True:
+        try:
+            trames.append(await asyncio.wait_for(lire_trame(lecteur), ATTENTE))
+        except asyncio.TimeoutError:
+            return trames
+
+
+def preparer_lignes(moteur: Moteur) -> None:
+    """
+    Remplit les lignes où le tetrimino du moteur tombera, sauf ses cases : pour un
+    tetrimino qui peut tomber dans ce creux, comme le O, sa chute efface ces lignes
+    """
+    plateau = moteur.get_plateau()
+    tetr = moteur.get_tetrimino()
+    chute = Tetrimino(moteur.get_modele(), *tetr.get_position())
+    chute.set_rotation(tetr.get_rotation())
+    chute.set_position(y=plateau.fantome(chute))
+
+    apres = plateau.copier()
+    apres.verrouiller(chute)
+    grille = []
+    for ligne, ligne_apres in zip(plateau.grille(), apres.grille()):
+        if ligne == ligne_apres:
+            grille.append(ligne)
+        else:
+            grille.append(
+                [None if case is not None else COULEUR_DECHETS for case in ligne_apres]
+            )
+    plateau.restaurer(grille)
+
+
+class TestPartie(unittest.TestCase):
+    """Tests du déroulement d'une partie sur le serveur"""
+
+    def test_vues(self):
+        """Vérifie que les clients reconstruisent les parties jouées par le serveur"""
+
+        async def scenario():
+            serveur = Serveur(graine=1)
+            serveur_asyncio = await serveur.demarrer()
+            port = serveur_asyncio.sockets[0].getsockname()[1]
+            clients = [await connecter(port), await connecter(port)]
+            await asyncio.sleep(ATTENTE)
+
+            vues = []
+            moteurs = []
+            for lecteur, _ in clients:
+                type_message, contenu = await lire_trame(lecteur)
+                self.assertEqual(type_message, DEBUT)
+                graine, joueur = lire_debut(contenu)
+                self.assertEqual(joueur, len(vues))
+                moteurs.append(Moteur(graine=graine))
+                lignes = moteurs[-1].get_plateau().forme()[0]
+                vues.append({0: Vue(lignes), 1: Vue(lignes)})
+            self.assertEqual(serveur.statistiques().parties, 1)
+
+            # Le premier joueur fait tomber ses tetriminos, le second attend
+            for _ in range(8):
+                clients[0][1].write(trame(ACTION, bytes((Action.CHUTE.value,))))
+                await asyncio.sleep(ATTENTE)
+                serveur.avancer()
+                moteurs[0].jouer(Action.CHUTE)
+                moteurs[0].jouer(Action.TICK)
+                moteurs[1].jouer(Action.TICK)
+
+                for (lecteur, _), vue in zip(clients, vues):
+                    for type_message, contenu in await lire_disponibles(lecteur):
+                        self.assertEqual(type_message, ETAT)
+                        appliquer_etat(vue, contenu)
+
+                for vue in vues:
+                    for indice, moteur in enumerate(moteurs):
+                        self.assertEqual(
+                            vue[indice].masques, list(moteur.get_plateau().masques())
+                        )
+
+            # Le second joueur se déconnecte : le premier gagne
+            clients[1][1].close()
+            await asyncio.sleep(ATTENTE)
+            self.assertEqual(
+                await lire_disponibles(clients[0][0]), [(FIN, bytes((0,)))]
+            )
+            statistiques = serveur.statistiques()
+            self.assertEqual(statistiques.parties, 0)
+            self.assertEqual(statistiques.terminees, 1)
+
+            clients[0][1].close()
+            serveur_asyncio.close()
+            await serveur_asyncio.wait_closed()
+
+        asyncio.run(scenario())
+
+    def test_dechets(self):
+        """Vérifie que les lignes effacées sont envoyées à l'adversaire"""
+
+        async def scenario():
+            serveur = Serveur(graine=8)
+            serveur_asyncio = await serveur.demarrer()
+            port = serveur_asyncio.sockets[0].getsockname()[1]
+            clients = [await connecter(port), await connecter(port)]
+            await asyncio.sleep(ATTENTE)
+
+            # pylint: disable=protected-access
+            (partie,) = serveur._Serveur__parties  # type: ignore
+            self.assertIsInstance(partie, Partie)
+            moteurs = partie.moteurs
+
+            # Avec cette graine, le premier tetrimino est un O, qui efface deux lignes
+            self.assertIs(moteurs[0].get_modele(), MODELES_NOMMES["O"])
+            lignes = moteurs[0].get_plateau().forme()[0]
+            vues = [{0: Vue(lignes), 1: Vue(lignes)} for _ in clients]
+            for (lecteur, _), vue in zip(clients, vues):
+                for type_message, contenu in await lire_disponibles(lecteur):
+                    if type_message == ETAT:
+                        appliquer_etat(vue, contenu)
+
+            preparer_lignes(moteurs[0])
+            clients[0][1].write(trame(ACTION, bytes((Action.CHUTE.value,))))
+            await asyncio.sleep(ATTENTE)
+            masques = moteurs[1].get_plateau().masques()
+            serveur.avancer()
+
+            effacees = moteurs[0].get_lignes()
+            dechets = DECHETS[effacees]
+            self.assertGreater(dechets, 0)
+
+            # Le contenu de l'adversaire monte et les lignes reçues ont un seul trou
+            recues = moteurs[1].get_plateau().masques()
+            self.assertEqual(recues[:-dechets], masques[dechets:])
+            plein = (1 << moteurs[1].get_plateau().forme()[1]) - 1
+            trous = {plein & ~masque for masque in recues[-dechets:]}
+            self.assertEqual(len(trous), 1)
+            self.assertEqual(bin(trous.pop()).count("1"), 1)
+
+            # Les deux clients reçoivent les deux plateaux dans les messages suivants
+            for (lecteur, _), vue in zip(clients, vues):
+                for type_message, contenu in await lire_disponibles(lecteur):
+                    self.assertEqual(type_message, ETAT)
+                    appliquer_etat(vue, contenu)
+                self.assertEqual(vue[0].lignes, effacees)
+                for indice, moteur in enumerate(moteurs):
+                    self.assertEqual(
+                        vue[indice].masques, list(moteur.get_plateau().masques())
+                    )
+
+            for _, ecrivain in clients:
+                ecrivain.close()
+            serveur_asyncio.close()
+            await serveur_asyncio.wait_closed()
+
+        asyncio.run(scenario())
+
+    def test_actions_invalides(self):
+        """Vérifie qu'un client qui envoie un message inconnu est déconnecté"""
+
+        async def scenario():
+            serveur = Serveur()
+            serveur_asyncio = await serveur.demarrer()
+            port = serveur_asyncio.sockets[0].getsockname()[1]
+            lecteur, ecrivain = await connecter(port)
+            ecrivain.write(trame(0x7F))
+            self.assertEqual(await lecteur.read(), b"")
+            await asyncio.sleep(ATTENTE)
+            self.assertEqual(serveur.statistiques().connexions, 0)
+
+            ecrivain.close()
+            serveur_asyncio.close()
+            await serveur_asyncio.wait_closed()
+
+        asyncio.run(scenario())
+
+
+class TestConstructeur(unittest.TestCase):
+    """Tests du constructeur"""
+
+    def test_erreurs(self):
+        """Vérifie que le constructeur lève les bonnes erreurs"""
+        with self.assertRaises(TypeError):
+            Serveur("")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            Serveur(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
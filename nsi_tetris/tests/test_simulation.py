@@ -0,0 +1,58 @@
+"""Module contenant les tests du module simulation"""
+
+import unittest
+
+from nsi_tetris.jeu.moteur import Action, Moteur
+from nsi_tetris.jeu.simulation import jouer_partie, jouer_parties, politique_chute
+
+
+def politique_gauche(moteur: Moteur) -> Action:
+    """Politique qui pousse chaque tetrimino à gauche avant de le faire tomber"""
+    if moteur.get_ticks() % 4 == 3:
+        return Action.CHUTE
+
+    return Action.GAUCHE
+
+
+class TestJouerPartie(unittest.TestCase):
+    """Tests de la fonction jouer_partie"""
+
+    def test_determinisme(self):
+        """Vérifie qu'une même graine donne la même partie"""
+        resultat1 = jouer_partie(politique_gauche, 12)
+        resultat2 = jouer_partie(politique_gauche, 12)
+        self.assertEqual(resultat1[:4], resultat2[:4])
+        self.assertEqual(resultat1.graine, 12)
+
+    def test_ticks_max(self):
+        """Vérifie que la partie s'arrête après le nombre maximal de ticks"""
+        resultat = jouer_partie(lambda _: None, 0, ticks_max=120)
+        self.assertEqual(resultat.pieces, 1)
+
+
+class TestJouerParties(unittest.TestCase):
+    """Tests de la fonction jouer_parties"""
+
+    def test_erreurs(self):
+        """Vérifie que la fonction lève les bonnes erreurs"""
+        # Les erreurs sont levées dès l'appel, sans lire les résultats
+        with self.assertRaises(TypeError):
+            jouer_parties(politique_chute, "test")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            jouer_parties(politique_chute, 5, processus=0)
+
+    def test_resultats(self):
+        """Vérifie que chaque graine est jouée une fois et donne le même résultat"""
+        resultats = list(jouer_parties(politique_gauche, 8, 3, processus=2))
+        self.assertEqual(
+            sorted(resultat.graine for resultat in resultats), list(range(3, 11))
+        )
+
+        for resultat in resultats:
+            attendu = jouer_partie(politique_gauche, resultat.graine)
+            self.assertEqual(resultat[:4], attendu[:4])
+
+
+if __name__ == "__main__":
+    unittest.main()
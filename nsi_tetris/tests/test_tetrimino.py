@@ -2,8 +2,9 @@
 
 import unittest
 
-from nsi_tetris.jeu.tetrimino import Tetrimino
-from nsi_tetris.jeu.constantes import MODELES_TETRIMINOS
+from nsi_tetris.jeu.tetrimino import Rotation, Tetrimino
+from nsi_tetris.jeu.constantes import MODELES_TETRIMINOS, TABLE_ROTATIONS
+from nsi_tetris.jeu.tableaux import tourner
 
 
 class TestConstructeur(unittest.TestCase):
@@ -29,6 +30,7 @@ class TestConstructeur(unittest.TestCase):
 class TestSetPosition(unittest.TestCase):
     """Test de la méthode set_position de la classe Tetrimino"""
 
+    @unittest.skipUnless(__debug__, "Les préconditions sont supprimées par python -O")
     def test_erreurs(self):
         """Vérifie que la méthode lève bien les bonnes erreurs"""
         with self.assertRaises(TypeError):
@@ -54,6 +56,74 @@ class TestSetPosition(unittest.TestCase):
         self.assertEqual(tetrimino.get_position(), (0, 9))
 
 
+class TestTourner(unittest.TestCase):
+    """Test de la méthode tourner de la classe Tetrimino"""
+
+    def test_fonctionnement(self):
+        """Vérifie que les formes précalculées correspondent aux rotations des tableaux"""
+        for modele in MODELES_TETRIMINOS.values():
+            forme = modele[0]
+
+            tetrimino = Tetrimino(modele)
+            tetrimino.tourner()
+            self.assertEqual(tetrimino.get_forme(), tourner(forme))
+            self.assertEqual(tetrimino.get_rotation(), Rotation.DROITE)
+
+            tetrimino = Tetrimino(modele)
+            tetrimino.tourner(False)
+            self.assertEqual(tetrimino.get_forme(), tourner(forme, False))
+            self.assertEqual(tetrimino.get_rotation(), Rotation.GAUCHE)
+
+    def test_annulation(self):
+        """Vérifie qu'une rotation annulée redonne exactement l'état précédent"""
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["T"])
+        etat = tetrimino.get_etat()
+
+        tetrimino.tourner()
+        tetrimino.tourner(False)
+        self.assertIs(tetrimino.get_etat(), etat)
+
+        for _ in range(4):
+            tetrimino.tourner()
+        self.assertIs(tetrimino.get_etat(), etat)
+
+    def test_set_rotation(self):
+        """Vérifie que set_rotation utilise la table des rotations"""
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["L"])
+        tetrimino.set_rotation(Rotation.SECOND)
+        self.assertIs(tetrimino.get_etat(), TABLE_ROTATIONS["L"][Rotation.SECOND.value])
+
+        if __debug__:
+            with self.assertRaises(TypeError):
+                tetrimino.set_rotation(2)  # type: ignore
+
+
+class TestGetMasques(unittest.TestCase):
+    """Test de la méthode get_masques de la classe Tetrimino"""
+
+    def test_resultat(self):
+        """Vérifie que la méthode renvoie le bon résultat"""
+        self.assertEqual(
+            Tetrimino(MODELES_TETRIMINOS["S"]).get_masques(),
+            (((0, 0b110, (1, 2)), (1, 0b011, (0, 1))), (0, 0, 2, 1)),
+        )
+
+        tetrimino = Tetrimino(MODELES_TETRIMINOS["I"])
+        tetrimino.tourner()
+        self.assertEqual(
+            tetrimino.get_masques(),
+            (
+                (
+                    (0, 0b100, (2,)),
+                    (1, 0b100, (2,)),
+                    (2, 0b100, (2,)),
+                    (3, 0b100, (2,)),
+                ),
+                (2, 0, 2, 3),
+            ),
+        )
+
+
 class TestRepr(unittest.TestCase):
     """Test de la représentation du tetrimino"""
 